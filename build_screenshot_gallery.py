@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Build one HTML gallery page for all screenshot mockups.
+
+create_simple_html_screenshots() used to write one page per screen, each with
+its own full copy of the SVG. This builder writes a single page instead:
+
+  - Top-level SVG elements that occur in more than one mockup (phone frame,
+    status bar, app bar, ...) are written once as <symbol>s in a hidden sprite
+    and drawn with <use>. Runs of elements that always appear together become
+    one symbol.
+  - The mockups' <style> blocks are merged into the page stylesheet. Rules
+    that differ between files are scoped to their mockup, and elements that
+    depend on them stay inline.
+  - Only the first few mockups are live DOM. The rest sit in inert <template>s
+    and are instantiated by an IntersectionObserver as they approach the
+    viewport; raster variants use <img loading="lazy">.
+  - The page is written chunk by chunk as it is generated.
+
+Only the standard library is needed.
+
+Usage:
+  python3 build_screenshot_gallery.py                     # every SVG/PNG in docs/screenshots
+  python3 build_screenshot_gallery.py a.svg b.png -o gallery.html --eager 2
+"""
+
+import argparse
+import glob
+import os
+import re
+import struct
+import xml.etree.ElementTree as ET
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+SCREENSHOTS_DIR = 'docs/screenshots'
+DEFAULT_OUTPUT = os.path.join(SCREENSHOTS_DIR, 'gallery.html')
+
+# A symbol has to save more than the <use> that replaces it
+MIN_SYMBOL_BYTES = 48
+
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title}</title>
+<style>
+body {{ margin: 0; padding: 24px; background: #F5F5F5; font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif; }}
+h1 {{ font-size: 20px; font-weight: 500; color: #212121; }}
+.gallery {{ display: flex; flex-wrap: wrap; gap: 24px; }}
+.gallery figure {{ margin: 0; content-visibility: auto; contain-intrinsic-size: auto {width}px auto {height}px; }}
+.gallery figcaption {{ margin-top: 8px; font-size: 14px; color: #757575; text-align: center; }}
+.gallery svg, .gallery img {{ display: block; }}
+"""
+
+PAGE_SCRIPT = """<script>
+(function () {
+  var pending = document.querySelectorAll('figure[data-lazy]');
+  function show(figure) {
+    var template = figure.querySelector('template');
+    if (template) template.replaceWith(template.content);
+    figure.removeAttribute('data-lazy');
+  }
+  if (!('IntersectionObserver' in window)) { pending.forEach(show); return; }
+  var observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) { observer.unobserve(entry.target); show(entry.target); }
+    });
+  }, { rootMargin: '400px' });
+  pending.forEach(function (figure) { observer.observe(figure); });
+})();
+</script>
+"""
+
+ET.register_namespace('', SVG_NS)
+ET.register_namespace('xlink', XLINK_NS)
+
+
+def strip_namespaces(root):
+    """Drop the SVG namespace from tags so fragments serialize as plain inline SVG"""
+    prefix = f'{{{SVG_NS}}}'
+    for element in root.iter():
+        if isinstance(element.tag, str) and element.tag.startswith(prefix):
+            element.tag = element.tag[len(prefix):]
+        for name in list(element.attrib):
+            if name.startswith(f'{{{XLINK_NS}}}'):
+                element.attrib['xlink:' + name.split('}', 1)[1]] = element.attrib.pop(name)
+
+
+def serialize(element):
+    element.tail = None
+    return ET.tostring(element, encoding='unicode', short_empty_elements=True)
+
+
+def split_css(css):
+    """Split a stylesheet into (selector, body) pairs; nested @-rules stay whole"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    rules = []
+    depth = 0
+    start = 0
+    selector = None
+    for index, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                selector = css[start:index].strip()
+                start = index + 1
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                rules.append((selector, ' '.join(css[start:index].split())))
+                start = index + 1
+    return rules
+
+
+def element_classes(element):
+    classes = set()
+    for node in element.iter():
+        classes.update(node.get('class', '').split())
+    return classes
+
+
+def slugify(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def title_from_filename(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for prefix in ('realistic-', 'screenshot-'):
+        if stem.startswith(prefix):
+            stem = stem[len(prefix):]
+    return stem.replace('-', ' ').title()
+
+
+def png_size(path):
+    """Width and height from the PNG IHDR chunk, without decoding the image"""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if header[:8] != b'\x89PNG\r\n\x1a\n':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+class Mockup:
+    """One parsed SVG: root attributes, CSS rules and top-level elements"""
+
+    def __init__(self, path, title):
+        self.path = path
+        self.title = title
+        self.slug = slugify(os.path.basename(path))
+        root = ET.parse(path).getroot()
+        strip_namespaces(root)
+
+        self.attrib = {k: v for k, v in root.attrib.items() if k != 'xmlns'}
+        if 'viewBox' not in self.attrib:
+            self.attrib['viewBox'] = f"0 0 {self.attrib.get('width', 300)} {self.attrib.get('height', 600)}"
+        self.width = int(float(self.attrib.get('width', 300)))
+        self.height = int(float(self.attrib.get('height', 600)))
+
+        self.rules = []
+        self.elements = []
+        for child in root:
+            if child.tag == 'defs':
+                for definition in list(child):
+                    if definition.tag == 'style':
+                        self.rules.extend(split_css(definition.text or ''))
+                        child.remove(definition)
+                if len(child):
+                    self.elements.append((serialize(child), element_classes(child)))
+            elif isinstance(child.tag, str):
+                self.elements.append((serialize(child), element_classes(child)))
+
+
+class RasterShot:
+    """A PNG/JPEG variant shown with a lazily loaded <img>"""
+
+    def __init__(self, path, title):
+        self.path = path
+        self.title = title
+        self.slug = slugify(os.path.basename(path))
+        self.size = png_size(path) if path.lower().endswith('.png') else None
+
+
+def merge_styles(mockups):
+    """Shared rules once; rules whose body differs between files scoped per mockup"""
+    bodies = {}
+    for mockup in mockups:
+        for selector, body in mockup.rules:
+            bodies.setdefault(selector, set()).add(body)
+    conflicting = {selector for selector, seen in bodies.items() if len(seen) > 1}
+
+    shared = {}
+    scoped = []
+    for mockup in mockups:
+        for selector, body in mockup.rules:
+            if selector not in conflicting or selector.startswith('@'):
+                # @-rules cannot be scoped to one mockup; the first definition wins
+                shared.setdefault(selector, body)
+            else:
+                scoped_selector = ', '.join(f'#{mockup.slug} {s.strip()}' for s in selector.split(','))
+                scoped.append((scoped_selector, body))
+
+    conflicting_classes = set()
+    for selector in conflicting:
+        conflicting_classes.update(re.findall(r'\.([\w-]+)', selector))
+    return list(shared.items()) + scoped, conflicting_classes
+
+
+def find_symbols(mockups, conflicting_classes):
+    """Group shared top-level elements into symbols; returns (symbols, per-mockup layout)
+
+    A layout is a list of ('use', symbol id) and ('inline', markup) items in
+    paint order. Consecutive shared elements are merged into one symbol when
+    every occurrence of the first is followed by the second and every
+    occurrence of the second is preceded by the first.
+    """
+    owners = {}
+    for index, mockup in enumerate(mockups):
+        for markup, classes in mockup.elements:
+            if not classes & conflicting_classes:
+                owners.setdefault(markup, set()).add(index)
+    shared = {markup for markup, seen in owners.items() if len(seen) > 1}
+
+    followers = {}
+    leaders = {}
+    for mockup in mockups:
+        keys = [markup for markup, _ in mockup.elements]
+        for position, markup in enumerate(keys):
+            if markup not in shared:
+                continue
+            after = keys[position + 1] if position + 1 < len(keys) else None
+            before = keys[position - 1] if position > 0 else None
+            followers.setdefault(markup, set()).add(after)
+            leaders.setdefault(markup, set()).add(before)
+
+    def joined(first, second):
+        return (second in shared and followers[first] == {second} and leaders[second] == {first})
+
+    symbols = {}
+    layouts = []
+    for mockup in mockups:
+        keys = [markup for markup, _ in mockup.elements]
+        layout = []
+        position = 0
+        while position < len(keys):
+            markup = keys[position]
+            if markup not in shared:
+                layout.append(('inline', markup))
+                position += 1
+                continue
+            run = [markup]
+            while position + len(run) < len(keys) and joined(run[-1], keys[position + len(run)]):
+                run.append(keys[position + len(run)])
+            position += len(run)
+            body = ''.join(run)
+            if len(body) < MIN_SYMBOL_BYTES:
+                layout.extend(('inline', part) for part in run)
+                continue
+            if body not in symbols:
+                symbols[body] = f's{len(symbols)}'
+            layout.append(('use', symbols[body]))
+        layouts.append(layout)
+    return symbols, layouts
+
+
+def render_gallery(shots, title='EmuSaves Screenshots', eager=4, base_dir=SCREENSHOTS_DIR):
+    """Yield the gallery page in chunks; image paths are made relative to base_dir"""
+    mockups = [shot for shot in shots if isinstance(shot, Mockup)]
+    rules, conflicting_classes = merge_styles(mockups)
+    symbols, layouts = find_symbols(mockups, conflicting_classes)
+    layout_for = {id(mockup): layout for mockup, layout in zip(mockups, layouts)}
+
+    width = max((m.width for m in mockups), default=320)
+    height = max((m.height for m in mockups), default=640)
+    yield PAGE_HEAD.format(title=title, width=width, height=height)
+    for selector, body in rules:
+        yield f'{selector} {{ {body} }}\n'
+    yield '</style>\n</head>\n<body>\n'
+    yield f'<h1>{title}</h1>\n'
+
+    # Sprite: sized to nothing rather than display:none, which breaks
+    # referenced gradients and filters in some browsers
+    yield '<svg width="0" height="0" style="position:absolute" aria-hidden="true">\n'
+    for body, symbol_id in symbols.items():
+        yield f'<symbol id="{symbol_id}" overflow="visible">{body}</symbol>\n'
+    yield '</svg>\n<main class="gallery">\n'
+
+    for index, shot in enumerate(shots):
+        lazy = index >= eager
+        caption = f'<figcaption>{shot.title}</figcaption>'
+        if isinstance(shot, RasterShot):
+            src = os.path.relpath(shot.path, base_dir)
+            size = f' width="{shot.size[0]}" height="{shot.size[1]}"' if shot.size else ''
+            loading = ' loading="lazy"' if lazy else ''
+            yield (f'<figure id="{shot.slug}"><img src="{src}" alt="{shot.title}"{size}{loading} '
+                   f'decoding="async">{caption}</figure>\n')
+            continue
+
+        attributes = ' '.join(f'{k}="{v}"' for k, v in shot.attrib.items())
+        yield f'<figure id="{shot.slug}"{" data-lazy" if lazy else ""}>'
+        if lazy:
+            yield '<template>'
+        yield f'<svg {attributes} role="img" aria-label="{shot.title}">'
+        for kind, value in layout_for[id(shot)]:
+            yield f'<use href="#{value}"/>' if kind == 'use' else value
+        yield '</svg>'
+        if lazy:
+            yield '</template>'
+        yield f'{caption}</figure>\n'
+
+    yield '</main>\n'
+    yield PAGE_SCRIPT
+    yield '</body>\n</html>\n'
+
+
+def load_shot(path, title=None):
+    title = title or title_from_filename(path)
+    if path.lower().endswith('.svg'):
+        return Mockup(path, title)
+    return RasterShot(path, title)
+
+
+def build_gallery(entries, output_path=DEFAULT_OUTPUT, title='EmuSaves Screenshots', eager=4):
+    """Write the gallery for (path, title) entries; returns the number of bytes written"""
+    shots = [load_shot(path, name) for path, name in entries]
+    written = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for chunk in render_gallery(shots, title, eager, os.path.dirname(os.path.abspath(output_path))):
+            f.write(chunk)
+            written += len(chunk.encode('utf-8'))
+    return written
+
+
+def default_entries(directory=SCREENSHOTS_DIR):
+    """Realistic SVG mockups first, then the other SVGs, then raster variants"""
+    svgs = sorted(glob.glob(os.path.join(directory, '*.svg')))
+    svgs.sort(key=lambda p: not os.path.basename(p).startswith('realistic-'))
+    pngs = sorted(glob.glob(os.path.join(directory, '*.png')))
+    return [(path, None) for path in svgs + pngs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a single-page screenshot gallery')
+    parser.add_argument('files', nargs='*', help='SVG mockups and PNG variants (default: everything in docs/screenshots)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help='Gallery HTML file')
+    parser.add_argument('--eager', type=int, default=4, help='Mockups rendered immediately; the rest load lazily')
+    args = parser.parse_args()
+
+    entries = [(path, None) for path in args.files] or default_entries()
+    if not entries:
+        print("❌ No SVG or PNG screenshots found")
+        return
+
+    print("🖼️  Building screenshot gallery...")
+    size = build_gallery(entries, args.output, eager=args.eager)
+    inline = sum(os.path.getsize(path) for path, _ in entries if path.lower().endswith('.svg'))
+    print(f"✅ {args.output}: {len(entries)} screenshots, {size / 1024:.1f} KB "
+          f"(SVG sources {inline / 1024:.1f} KB)")
+    print(f"💡 Open file://{os.path.abspath(args.output)}")
+
+
+if __name__ == '__main__':
+    main()
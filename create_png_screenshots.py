@@ -6,6 +6,31 @@ import os
 import subprocess
 import sys
 
+from build_screenshot_gallery import build_gallery
+
+CONVERSION_METHODS = [
+    # Try rsvg-convert (librsvg)
+    lambda svg, png: ['rsvg-convert', '-w', '320', '-h', '640', svg, '-o', png],
+    # Try inkscape
+    lambda svg, png: ['inkscape', '--export-type=png', '--export-width=320', '--export-height=640', '--export-filename=' + png, svg],
+    # Try ImageMagick convert
+    lambda svg, png: ['convert', '-background', 'transparent', '-size', '320x640', svg, png],
+    # Try cairosvg (if available)
+    lambda svg, png: ['cairosvg', svg, '-o', png, '-W', '320', '-H', '640'],
+]
+
+def convert_svg_file(svg_file, png_file, methods=CONVERSION_METHODS):
+    """Convert one SVG with the first tool that works and return that method (or None)"""
+    for method in methods:
+        try:
+            cmd = method(svg_file, png_file)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                return method
+        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
+            continue
+    return None
+
 def convert_svg_to_png():
     """Convert SVG screenshots to PNG using available tools"""
     
@@ -16,17 +41,6 @@ def convert_svg_to_png():
         ('docs/screenshots/realistic-synology-config.svg', 'docs/screenshots/screenshot-synology-config.png'),
     ]
     
-    conversion_methods = [
-        # Try rsvg-convert (librsvg)
-        lambda svg, png: ['rsvg-convert', '-w', '320', '-h', '640', svg, '-o', png],
-        # Try inkscape
-        lambda svg, png: ['inkscape', '--export-type=png', '--export-width=320', '--export-height=640', '--export-filename=' + png, svg],
-        # Try ImageMagick convert
-        lambda svg, png: ['convert', '-background', 'transparent', '-size', '320x640', svg, png],
-        # Try cairosvg (if available)
-        lambda svg, png: ['cairosvg', svg, '-o', png, '-W', '320', '-H', '640'],
-    ]
-    
     success_count = 0
     
     for svg_file, png_file in svg_files:
@@ -35,20 +49,10 @@ def convert_svg_to_png():
             continue
             
         # Try each conversion method
-        converted = False
-        for method in conversion_methods:
-            try:
-                cmd = method(svg_file, png_file)
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                if result.returncode == 0:
-                    print(f"✅ Converted {svg_file} → {png_file}")
-                    success_count += 1
-                    converted = True
-                    break
-                else:
-                    continue
-            except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-                continue
+        converted = convert_svg_file(svg_file, png_file) is not None
+        if converted:
+            print(f"✅ Converted {svg_file} → {png_file}")
+            success_count += 1
         
         if not converted:
             print(f"❌ Failed to convert {svg_file} (no working conversion tool found)")
@@ -81,56 +85,30 @@ def install_conversion_tools():
     return False
 
 def create_simple_html_screenshots():
-    """Create HTML files that can be screenshot manually"""
-    
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=320, initial-scale=1.0">
-        <title>EmuSaves - {title}</title>
-        <style>
-            body {{ margin: 0; padding: 0; width: 320px; height: 640px; overflow: hidden; }}
-            iframe {{ width: 320px; height: 640px; border: none; }}
-        </style>
-    </head>
-    <body>
-        <div style="width: 320px; height: 640px; transform-origin: top left;">
-            {svg_content}
-        </div>
-    </body>
-    </html>
-    """
+    """Create one HTML gallery page that can be screenshot manually"""
     
     screenshots = [
-        ('realistic-home-screen.svg', 'Home Screen', 'screenshot-home.html'),
-        ('realistic-quick-add-dialog.svg', 'Quick Add Dialog', 'screenshot-quick-add.html'),
-        ('realistic-sync-progress.svg', 'Sync Progress', 'screenshot-sync-progress.html'),
-        ('realistic-synology-config.svg', 'Synology Config', 'screenshot-synology-config.html'),
+        ('realistic-home-screen.svg', 'Home Screen'),
+        ('realistic-quick-add-dialog.svg', 'Quick Add Dialog'),
+        ('realistic-sync-progress.svg', 'Sync Progress'),
+        ('realistic-synology-config.svg', 'Synology Config'),
     ]
     
     os.makedirs('docs/screenshots', exist_ok=True)
     
-    for svg_name, title, html_name in screenshots:
+    entries = []
+    for svg_name, title in screenshots:
         svg_path = f'docs/screenshots/{svg_name}'
-        html_path = f'docs/screenshots/{html_name}'
-        
         if os.path.exists(svg_path):
-            with open(svg_path, 'r') as f:
-                svg_content = f.read()
-            
-            html_content = html_template.format(title=title, svg_content=svg_content)
-            
-            with open(html_path, 'w') as f:
-                f.write(html_content)
-            
-            print(f"✅ Created {html_path}")
+            entries.append((svg_path, title))
+    
+    html_path = 'docs/screenshots/gallery.html'
+    build_gallery(entries, html_path)
+    print(f"✅ Created {html_path} with {len(entries)} screens")
     
-    print(f"\n📱 HTML screenshot files created in docs/screenshots/")
-    print(f"💡 You can open these in a browser and screenshot them manually:")
-    for _, title, html_name in screenshots:
-        print(f"   file://{os.path.abspath('docs/screenshots/' + html_name)}")
+    print(f"\n📱 HTML screenshot gallery created in docs/screenshots/")
+    print(f"💡 You can open it in a browser and screenshot each mockup manually:")
+    print(f"   file://{os.path.abspath(html_path)}")
 
 def main():
     """Main function"""
@@ -146,12 +124,12 @@ def main():
             success_count = convert_svg_to_png()
     
     if success_count == 0:
-        print("\n📱 Creating HTML files for manual screenshot capture...")
+        print("\n📱 Creating HTML gallery for manual screenshot capture...")
         create_simple_html_screenshots()
         print("\n💡 Manual screenshot process:")
-        print("   1. Open the HTML files in a browser")
-        print("   2. Set browser window to exactly 320x640 pixels")
-        print("   3. Take screenshots and save as PNG")
+        print("   1. Open the HTML gallery in a browser")
+        print("   2. Capture each 320x640 mockup (e.g. the devtools \"Capture node screenshot\" command)")
+        print("   3. Save the captures as PNG")
     else:
         print(f"\n🎉 Successfully created {success_count} PNG screenshots!")
     
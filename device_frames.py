@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Device frames for screenshots: phones, tablets and foldables.
+
+Each DeviceProfile describes a body (outer size, corner radius, color), a
+screen (size, bezels, corner radius) and optional details: a notch or
+punch-hole camera, a fold crease, a gesture home indicator. load_frame()
+builds two bitmaps per profile and scale, once, and caches them:
+
+  image   RGBA body: device color with anti-aliased outer corners
+  mask    L image of the screen shape: rounded corners and cutout, rendered
+          at 4x and box-filtered down, so the edges are anti-aliased
+
+Framing a screen is then a copy of the body, one plain paste of the screen
+and an alpha composite of small cached patches: the bezel over the screen's
+anti-aliased corners and cutout, the crease and the indicator. Only those
+edge pixels are blended and nothing is drawn per call.
+
+Running this file benchmarks cached framing against building frames per call and
+writes one sample per profile to docs/screenshots/frames/.
+"""
+
+try:
+    from PIL import Image, ImageChops, ImageDraw
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+# Masks are drawn at this multiple of the target size and box-filtered down
+SUPERSAMPLE = 4
+# Screen edges are re-covered in tiles of at most this size
+EDGE_TILE = 32
+
+DeviceProfile = namedtuple('DeviceProfile', [
+    'name', 'kind', 'screen', 'bezel', 'radius', 'screen_radius',
+    'cutout', 'cutout_size', 'fold', 'indicator', 'color',
+])
+DeviceProfile.__doc__ = """Device geometry in pixels at scale 1
+
+screen is (width, height); bezel is (left, top, right, bottom). cutout is
+None, 'notch' or 'punch-hole' with cutout_size (width, height); fold is
+None, 'vertical' or 'horizontal'.
+"""
+
+Frame = namedtuple('Frame', ['image', 'mask', 'screen_box', 'overlays'])
+
+PROFILES = {profile.name: profile for profile in [
+    # Same outer size as the original 340x680 docs frame
+    DeviceProfile('pixel', 'phone', (300, 640), (20, 20, 20, 20), 40, 24,
+                  'punch-hole', (10, 10), None, True, (0, 0, 0)),
+    DeviceProfile('phone-notch', 'phone', (300, 650), (10, 12, 10, 12), 44, 36,
+                  'notch', (120, 22), None, True, (28, 28, 30)),
+    DeviceProfile('phone-classic', 'phone', (300, 534), (16, 56, 16, 56), 28, 0,
+                  None, None, None, False, (20, 20, 20)),
+    DeviceProfile('tablet', 'tablet', (600, 960), (28, 28, 28, 28), 36, 12,
+                  None, None, None, True, (40, 40, 44)),
+    DeviceProfile('tablet-landscape', 'tablet', (960, 600), (28, 28, 28, 28), 36, 12,
+                  None, None, None, True, (40, 40, 44)),
+    DeviceProfile('foldable', 'foldable', (560, 620), (14, 14, 14, 14), 30, 18,
+                  'punch-hole', (10, 10), 'vertical', True, (32, 32, 36)),
+    DeviceProfile('foldable-cover', 'foldable', (260, 640), (12, 16, 12, 16), 34, 24,
+                  'punch-hole', (9, 9), None, True, (32, 32, 36)),
+    DeviceProfile('flip', 'foldable', (280, 700), (10, 12, 10, 12), 36, 28,
+                  'punch-hole', (9, 9), 'horizontal', True, (60, 48, 72)),
+]}
+
+DEFAULT_PROFILE = 'pixel'
+
+
+def profile_size(profile):
+    left, top, right, bottom = profile.bezel
+    return profile.screen[0] + left + right, profile.screen[1] + top + bottom
+
+
+def _scaled(value, factor):
+    return int(round(value * factor))
+
+
+def _draw_cutout(draw, profile, factor, screen_x, screen_y):
+    """Draw the camera cutout (filled with 0) into a supersampled screen mask"""
+    width, height = profile.cutout_size
+    width, height = _scaled(width, factor), _scaled(height, factor)
+    center = screen_x + _scaled(profile.screen[0], factor) // 2
+    if profile.cutout == 'punch-hole':
+        top = screen_y + _scaled(7, factor)
+        draw.ellipse([center - width // 2, top, center + width // 2, top + height], fill=0)
+    elif profile.cutout == 'notch':
+        radius = height // 2
+        draw.rounded_rectangle([center - width // 2, screen_y - radius, center + width // 2, screen_y + height],
+                               radius=radius, fill=0)
+
+
+@lru_cache(maxsize=None)
+def load_frame(name=DEFAULT_PROFILE, scale=1):
+    """Build (once per profile and scale) the frame overlay and screen mask"""
+    profile = PROFILES[name]
+    width, height = profile_size(profile)
+    left, top = profile.bezel[0], profile.bezel[1]
+    size = (_scaled(width, scale), _scaled(height, scale))
+    screen_box = (_scaled(left, scale), _scaled(top, scale),
+                  _scaled(left + profile.screen[0], scale), _scaled(top + profile.screen[1], scale))
+
+    factor = scale * SUPERSAMPLE
+    big = (size[0] * SUPERSAMPLE, size[1] * SUPERSAMPLE)
+    body = Image.new('L', big, 0)
+    ImageDraw.Draw(body).rounded_rectangle([0, 0, big[0] - 1, big[1] - 1],
+                                           radius=_scaled(profile.radius, factor), fill=255)
+    screen = Image.new('L', big, 0)
+    draw = ImageDraw.Draw(screen)
+    x0, y0, x1, y1 = (value * SUPERSAMPLE for value in screen_box)
+    draw.rounded_rectangle([x0, y0, x1 - 1, y1 - 1], radius=_scaled(profile.screen_radius, factor), fill=255)
+    if profile.cutout:
+        _draw_cutout(draw, profile, factor, x0, y0)
+
+    # Box-filter down: each output pixel is the exact coverage of its 4x4 block
+    body = body.reduce(SUPERSAMPLE)
+    mask = screen.reduce(SUPERSAMPLE).crop(screen_box)
+
+    image = Image.new('RGBA', size, profile.color + (255,))
+    image.putalpha(body)
+
+    # Wherever the screen mask is not fully opaque (rounded corners, cutout)
+    # the body is laid back over the screen as small patches, so framing can
+    # paste the screen unmasked and blend only these edges
+    overlays = list(_edge_patches(mask, profile.color, screen_box[:2]))
+
+    # Details drawn over the screen are patches too; the rest is baked into
+    # the body image
+    sx0, sy0, sx1, sy1 = screen_box
+    crease = max(1, _scaled(2, scale))
+    if profile.fold == 'vertical':
+        middle = (sx0 + sx1) // 2
+        overlays.append(_patch((crease, sy1 - sy0), (0, 0, 0, 28), (middle, sy0)))
+    elif profile.fold == 'horizontal':
+        middle = (sy0 + sy1) // 2
+        overlays.append(_patch((sx1 - sx0, crease), (0, 0, 0, 28), (sx0, middle)))
+    if profile.indicator:
+        pill_width, pill_height = _scaled(60, scale), max(2, _scaled(4, scale))
+        pill_x = (size[0] - pill_width) // 2
+        bottom_bezel = _scaled(profile.bezel[3], scale)
+        if bottom_bezel >= _scaled(16, scale):
+            # Thick bezel: the indicator sits on the body, as on the original frame
+            pill_y = size[1] - bottom_bezel + (bottom_bezel - pill_height) // 2
+            ImageDraw.Draw(image).rounded_rectangle([pill_x, pill_y, pill_x + pill_width, pill_y + pill_height],
+                                                    radius=pill_height // 2, fill=(100, 100, 100, 255))
+        else:
+            pill = Image.new('RGBA', (pill_width + 1, pill_height + 1), (0, 0, 0, 0))
+            ImageDraw.Draw(pill).rounded_rectangle([0, 0, pill_width, pill_height],
+                                                   radius=pill_height // 2, fill=(60, 60, 60, 160))
+            overlays.append((pill, (pill_x, sy1 - _scaled(8, scale) - pill_height)))
+    return Frame(image, mask, screen_box, tuple(overlays))
+
+
+def _edge_patches(mask, color, offset, tile=EDGE_TILE):
+    """RGBA body patches covering the partly transparent parts of a screen mask"""
+    inverse = ImageChops.invert(mask)
+    for top in range(0, mask.height, tile):
+        for left in range(0, mask.width, tile):
+            box = inverse.crop((left, top, min(left + tile, mask.width), min(top + tile, mask.height))).getbbox()
+            if box is None:
+                continue
+            box = (left + box[0], top + box[1], left + box[2], top + box[3])
+            patch = Image.new('RGBA', (box[2] - box[0], box[3] - box[1]), color + (255,))
+            patch.putalpha(inverse.crop(box))
+            yield patch, (offset[0] + box[0], offset[1] + box[1])
+
+
+def _patch(size, color, position):
+    return Image.new('RGBA', size, color), position
+
+
+def screen_size(name=DEFAULT_PROFILE, scale=1):
+    x0, y0, x1, y1 = load_frame(name, scale).screen_box
+    return x1 - x0, y1 - y0
+
+
+def frame_screen(content, name=DEFAULT_PROFILE, scale=1, background=(250, 250, 250)):
+    """Put a screen image into a device frame; returns a new RGBA image
+
+    Content of a different size is resized to the screen first (LANCZOS);
+    render at screen_size() to skip that.
+    """
+    frame = load_frame(name, scale)
+    x0, y0, x1, y1 = frame.screen_box
+    if content.size != (x1 - x0, y1 - y0):
+        content = content.resize((x1 - x0, y1 - y0), Image.Resampling.LANCZOS)
+    if content.mode == 'RGBA' and content.getchannel('A').getextrema()[0] < 255:
+        flattened = Image.new('RGBA', content.size, background + (255,))
+        flattened.alpha_composite(content)
+        content = flattened
+    framed = frame.image.copy()
+    framed.paste(content, (x0, y0))
+    # Anti-aliased corners and cutout, then crease and indicator
+    for patch, position in frame.overlays:
+        framed.alpha_composite(patch, position)
+    return framed
+
+
+def round_screen(content, name=DEFAULT_PROFILE, scale=1):
+    """Clip a screen image to the profile's rounded screen shape, without a frame"""
+    frame = load_frame(name, scale)
+    if content.size != frame.mask.size:
+        content = content.resize(frame.mask.size, Image.Resampling.LANCZOS)
+    clipped = content.convert('RGBA')
+    clipped.putalpha(ImageChops.multiply(clipped.getchannel('A'), frame.mask))
+    return clipped
+
+
+def benchmark(screens, count):
+    """Screens per second: the original drawn frame, building this frame per call, and cached"""
+    def drawn_frame(content):
+        phone = Image.new('RGBA', (340, 680), (0, 0, 0, 255))
+        draw = ImageDraw.Draw(phone)
+        phone.paste(Image.new('RGBA', (300, 640), (250, 250, 250, 255)), (20, 20))
+        phone.paste(content, (20, 20))
+        draw.rounded_rectangle([140, 665, 200, 669], radius=2, fill=(100, 100, 100, 255))
+        return phone
+
+    def uncached_frame(content):
+        load_frame.cache_clear()
+        return frame_screen(content)
+
+    results = {}
+    for label, function in (('original (no AA)', drawn_frame), ('built per call', uncached_frame),
+                            ('cached', frame_screen)):
+        start = time.perf_counter()
+        for i in range(count):
+            function(screens[i % len(screens)])
+        results[label] = count / (time.perf_counter() - start)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark device frames and write one sample per profile')
+    parser.add_argument('--count', type=int, default=300, help='Screens framed in the benchmark')
+    parser.add_argument('--output', default='docs/screenshots/frames', help='Folder for the samples')
+    args = parser.parse_args()
+
+    print("📱 EmuSaves device frames")
+
+    if not PIL_AVAILABLE:
+        print("❌ PIL not available. Install with: pip install pillow")
+        return
+
+    from generate_realistic_screenshots import create_home_screen
+
+    home = create_home_screen()
+    print("\n⏱️  Building frames (once per profile and scale):")
+    for name in PROFILES:
+        start = time.perf_counter()
+        load_frame(name)
+        print(f"   {name:<17} {profile_size(PROFILES[name])[0]}x{profile_size(PROFILES[name])[1]}  "
+              f"{(time.perf_counter() - start) * 1000:6.1f} ms")
+
+    screens = [home.resize(screen_size(), Image.Resampling.LANCZOS)]
+    results = benchmark(screens, args.count)
+    print(f"\n🖼️  Framing {args.count} screens:")
+    for label, rate in results.items():
+        print(f"   {label:<17} {rate:8.0f} screens/s")
+
+    os.makedirs(args.output, exist_ok=True)
+    for name in PROFILES:
+        filepath = os.path.join(args.output, f'frame-{name}.png')
+        frame_screen(home, name).save(filepath, 'PNG')
+    print(f"\n✅ Samples for {len(PROFILES)} profiles saved in {args.output}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,8 +7,8 @@ except ImportError:
     print("PIL not available. Install with: pip install pillow")
     exit(1)
 
-def create_phone_mockup(title, content_lines, filename):
-    """Create a phone mockup PNG"""
+def create_phone_mockup(title, content_lines):
+    """Create a phone mockup image"""
     # Create a 300x600 image (phone dimensions)
     img = Image.new('RGB', (300, 600), color='#FAFAFA')
     draw = ImageDraw.Draw(img)
@@ -63,7 +63,10 @@ def create_phone_mockup(title, content_lines, filename):
             draw.text((20, y_pos), line, fill=color, font=font_small)
         y_pos += 22
     
-    # Save
+    return img
+
+def save_mockup(img, filename):
+    """Write a mockup to disk; the only step here that touches the filesystem"""
     img.save(filename, 'PNG')
     print(f"✓ Created: {filename}")
 
@@ -72,7 +75,7 @@ def main():
     print("=" * 45)
     
     # Home Screen
-    create_phone_mockup(
+    save_mockup(create_phone_mockup(
         "📱 Home Screen",
         [
             "📊 Sync Status",
@@ -90,12 +93,11 @@ def main():
             "",
             "⏰ Scheduled Sync        ●",
             "Every 6 hours on Wi-Fi + charging"
-        ],
-        'screenshot-home.png'
-    )
+        ]
+    ), 'screenshot-home.png')
     
     # Quick Add Dialog
-    create_phone_mockup(
+    save_mockup(create_phone_mockup(
         "📲 Quick Add Emulators",
         [
             "Select common emulator save locations:",
@@ -121,12 +123,11 @@ def main():
             "└─────────────────────────────┘",
             "",
             "                      [Close]"
-        ],
-        'screenshot-quick-add.png'
-    )
+        ]
+    ), 'screenshot-quick-add.png')
     
     # Sync Progress
-    create_phone_mockup(
+    save_mockup(create_phone_mockup(
         "🔄 Sync in Progress",
         [
             "🔄 Syncing to nas.local...",
@@ -149,9 +150,8 @@ def main():
             "✓ pokemon_red.sav (128 KB)",
             "",
             "[      Cancel Sync      ]"
-        ],
-        'screenshot-sync-progress.png'
-    )
+        ]
+    ), 'screenshot-sync-progress.png')
     
     print(f"\n🎉 Created 3 placeholder screenshots!")
     print("📂 Location: docs/screenshots/")
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Color emoji atlas and mixed text/emoji rendering for the mockups.
+
+DejaVu has no emoji, so draw.text('⭐ Quick Add') draws a tofu box. The atlas
+rasterizes each emoji once per pixel size from a local color emoji source and
+keeps the bitmap in memory and on disk; draw_text() lays out a label as text
+runs and emoji, pasting the cached bitmap for every emoji.
+
+Sources, in order: the EMUSAVES_EMOJI environment variable, then the usual
+Noto Color Emoji / Apple Color Emoji / Segoe UI Emoji locations. A source is
+either a color font or a folder of PNGs named by code point (Twemoji
+"1f3ae.png", Noto "emoji_u1f3ae.png", OpenMoji "1F3AE.png"). Without any
+source the emoji are left out of the label, so '⭐ Quick Add' draws as
+'Quick Add' instead of a box.
+
+Usage:
+  python3 emoji_atlas.py                       # pre-rasterize the app's emoji
+  python3 emoji_atlas.py --preview labels.png  # also draw sample labels
+"""
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+import argparse
+import glob
+import hashlib
+import os
+import re
+import time
+from functools import lru_cache
+
+EMOJI_SOURCES = [
+    '/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf',
+    '/usr/share/fonts/noto/NotoColorEmoji.ttf',
+    '/usr/share/fonts/google-noto-emoji/NotoColorEmoji.ttf',
+    '/usr/share/fonts/noto-emoji/NotoColorEmoji.ttf',
+    '/System/Library/Fonts/Apple Color Emoji.ttc',
+    'C:/Windows/Fonts/seguiemj.ttf',
+]
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                         'emusaves', 'emoji')
+
+# Bitmap color fonts only load at their strike sizes (Noto: 109, Apple: 160,
+# 96, 64, ...); scalable ones accept the first size tried
+FONT_RENDER_SIZES = (109, 160, 128, 96, 64, 48)
+
+# Part of every cache file name; bump it when glyph processing changes so
+# bitmaps cached by an older version are not reused
+CACHE_VERSION = 2
+
+# Sizes the mockups draw text at
+MOCKUP_SIZES = (11, 12, 14, 16)
+
+PREVIEW_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+
+# Characters drawn as emoji even without U+FE0F (Emoji_Presentation outside
+# the supplementary planes)
+_BMP_EMOJI = ('\u231a\u231b\u23e9-\u23ec\u23f0\u23f3\u25fd\u25fe\u2614\u2615\u2648-\u2653'
+              '\u267f\u2693\u26a1\u26aa\u26ab\u26bd\u26be\u26c4\u26c5\u26ce\u26d4\u26ea'
+              '\u26f2\u26f3\u26f5\u26fa\u26fd\u2705\u270a\u270b\u2728\u274c\u274e'
+              '\u2753-\u2755\u2757\u2795-\u2797\u27b0\u27bf\u2b1b\u2b1c\u2b50\u2b55')
+_BASE = f'(?:[\U0001F000-\U0001FAFF{_BMP_EMOJI}]|[\u00a9\u00ae\u203c-\u3299]\ufe0f)'
+_MODIFIERS = '(?:\ufe0f|\u20e3|[\U0001F3FB-\U0001F3FF])*'
+EMOJI_PATTERN = re.compile(
+    f'[\U0001F1E6-\U0001F1FF]{{2}}|{_BASE}{_MODIFIERS}(?:\u200d{_BASE}{_MODIFIERS})*'
+)
+
+# Any code point no font maps; its rendering is the font's tofu box
+_MISSING = '\U0010fffd'
+
+
+def split_emoji(text):
+    """Split text into (is_emoji, segment) runs"""
+    runs = []
+    position = 0
+    for match in EMOJI_PATTERN.finditer(text):
+        if match.start() > position:
+            runs.append((False, text[position:match.start()]))
+        runs.append((True, match.group()))
+        position = match.end()
+    if position < len(text):
+        runs.append((False, text[position:]))
+    return runs
+
+
+def find_emoji_source():
+    """First color emoji font or image folder that exists, or None"""
+    candidates = [os.environ.get('EMUSAVES_EMOJI')] + EMOJI_SOURCES
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def _source_stamp(source):
+    """Modification stamp of a font, or of the newest PNG in a folder (editing
+    a file inside a folder does not touch the folder's own mtime)"""
+    if not os.path.isdir(source):
+        return os.path.getmtime(source)
+    newest = count = 0
+    with os.scandir(source) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith('.png'):
+                count += 1
+                newest = max(newest, entry.stat().st_mtime)
+    return f'{count}:{newest}'
+
+
+def _codepoints(emoji, keep_variation=True):
+    return [f'{ord(c):x}' for c in emoji if keep_variation or c != '\ufe0f']
+
+
+class EmojiAtlas:
+    """Emoji bitmaps rasterized once per (emoji, size) and reused"""
+
+    def __init__(self, source=None, cache_dir=None):
+        self.source = source
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.glyphs = {}
+        self.rasterized = 0
+        self._font = None
+        self._missing = None
+        if source:
+            stamp = f'{CACHE_VERSION}:{os.path.abspath(source)}:{_source_stamp(source)}'
+            self.tag = hashlib.sha1(stamp.encode('utf-8')).hexdigest()[:10]
+        else:
+            self.tag = None
+
+    @property
+    def available(self):
+        return self.source is not None
+
+    def glyph(self, emoji, size):
+        """RGBA bitmap of emoji, size x size pixels, or None if there is none"""
+        key = (emoji, size)
+        if key not in self.glyphs:
+            self.glyphs[key] = self._load(emoji, size)
+        return self.glyphs[key]
+
+    def _cache_path(self, emoji, size):
+        return os.path.join(self.cache_dir, f'{self.tag}-{size}-{"-".join(_codepoints(emoji))}.png')
+
+    def _load(self, emoji, size):
+        if not self.available:
+            return None
+        path = self._cache_path(emoji, size)
+        if os.path.exists(path):
+            with Image.open(path) as cached:
+                return cached.convert('RGBA')
+
+        source = self._rasterize(emoji)
+        if source is None:
+            return None
+        glyph = _fit_square(source, size)
+        self.rasterized += 1
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            glyph.save(path, 'PNG')
+        except OSError:
+            pass  # A read-only cache only costs the next process a rasterization
+        return glyph
+
+    def _rasterize(self, emoji):
+        if os.path.isdir(self.source):
+            return self._from_folder(emoji)
+        return self._from_font(emoji)
+
+    def _from_folder(self, emoji):
+        names = []
+        for keep_variation in (True, False):
+            codes = _codepoints(emoji, keep_variation)
+            for joined in ('-'.join(codes), '_'.join(codes)):
+                names += [f'{joined}.png', f'emoji_u{joined}.png', f'{joined.upper()}.png']
+        for name in names:
+            path = os.path.join(self.source, name)
+            if os.path.exists(path):
+                with Image.open(path) as image:
+                    return image.convert('RGBA')
+        return None
+
+    def _from_font(self, emoji):
+        if self._font is None:
+            for render_size in FONT_RENDER_SIZES:
+                try:
+                    self._font = ImageFont.truetype(self.source, render_size)
+                    break
+                except OSError:
+                    continue
+            else:
+                self.source = None  # Not a usable font; fall back to leaving emoji out
+                return None
+            self._missing = self._draw_font_glyph(_MISSING)
+        image = self._draw_font_glyph(emoji)
+        if image is None or (self._missing is not None and image.tobytes() == self._missing.tobytes()):
+            return None
+        return image
+
+    def _draw_font_glyph(self, text):
+        left, top, right, bottom = self._font.getbbox(text, mode='RGBA')
+        if right <= left or bottom <= top:
+            return None
+        image = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+        ImageDraw.Draw(image).text((-left, -top), text, font=self._font, embedded_color=True)
+        return image
+
+
+def _fit_square(image, size):
+    """Center an emoji image on a square canvas and scale it to size"""
+    image = image.crop(image.getbbox() or (0, 0, image.width, image.height))
+    side = max(image.size)
+    square = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+    square.paste(image, ((side - image.width) // 2, (side - image.height) // 2))
+    return square.resize((size, size), Image.Resampling.LANCZOS)
+
+
+@lru_cache(maxsize=None)
+def default_atlas():
+    """Process-wide atlas over the first emoji source found"""
+    return EmojiAtlas(find_emoji_source())
+
+
+def _emoji_size(font):
+    return getattr(font, 'size', 11)
+
+
+def _layout(text, font, atlas):
+    """(glyph, None) and (None, text) runs; emoji without a bitmap are dropped
+    together with one following space"""
+    size = _emoji_size(font)
+    runs = []
+    skip_space = False
+    for is_emoji, segment in split_emoji(text):
+        if is_emoji:
+            glyph = atlas.glyph(segment, size)
+            if glyph is not None:
+                runs.append((glyph, None))
+            skip_space = glyph is None
+            continue
+        if skip_space and segment.startswith(' '):
+            segment = segment[1:]
+        skip_space = False
+        if segment:
+            runs.append((None, segment))
+    return runs
+
+
+def text_length(text, font, atlas=None):
+    """Advance width of a label drawn by draw_text"""
+    runs = _layout(text, font, atlas or default_atlas())
+    return sum(glyph.width if glyph else font.getlength(segment) for glyph, segment in runs)
+
+
+def draw_text(image, xy, text, fill=None, font=None, atlas=None):
+    """Draw a label like ImageDraw.text, pasting color emoji from the atlas
+
+    Returns the x coordinate after the label.
+    """
+    font = font or ImageFont.load_default()
+    draw = ImageDraw.Draw(image)
+    x, y = xy
+    if hasattr(font, 'getmetrics'):
+        ascent, descent = font.getmetrics()
+    else:
+        ascent, descent = _emoji_size(font), 0
+    for glyph, segment in _layout(text, font, atlas or default_atlas()):
+        if glyph is not None:
+            # Centered on the line box, like the platform emoji fonts
+            image.paste(glyph, (round(x), y + (ascent + descent - glyph.height) // 2), glyph)
+            x += glyph.width
+        else:
+            draw.text((x, y), segment, fill=fill, font=font)
+            x += font.getlength(segment)
+    return x
+
+
+def app_emoji():
+    """Emoji used by the mockups and by EmulatorLocation icons in the app"""
+    found = set()
+    patterns = ['generate_realistic_screenshots.py', 'app/src/main/java/**/*.kt']
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(REPO_ROOT, pattern), recursive=True):
+            with open(path, encoding='utf-8') as f:
+                found.update(EMOJI_PATTERN.findall(f.read()))
+    return sorted(found)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-rasterize the emoji used by the screenshot mockups')
+    parser.add_argument('--source', help='Color emoji font or PNG folder (default: first one found)')
+    parser.add_argument('--sizes', type=int, nargs='*', default=list(MOCKUP_SIZES), help='Pixel sizes')
+    parser.add_argument('--preview', help='Also write sample labels to this PNG')
+    parser.add_argument('--font', default=PREVIEW_FONT, help='TrueType font for the preview text')
+    args = parser.parse_args()
+
+    print("😀 Building emoji atlas...")
+
+    if not PIL_AVAILABLE:
+        print("❌ PIL not available. Install with: pip install pillow")
+        return
+
+    atlas = EmojiAtlas(args.source) if args.source else default_atlas()
+    if not atlas.available:
+        print("⚠️  No color emoji source found; labels are drawn without their emoji.")
+        print("   Install fonts-noto-color-emoji or set EMUSAVES_EMOJI to a font or PNG folder.")
+    else:
+        print(f"📂 Source: {atlas.source}")
+        print(f"💾 Cache: {atlas.cache_dir}")
+
+    emoji = app_emoji()
+    start = time.perf_counter()
+    missing = [e for e in emoji for size in args.sizes if atlas.glyph(e, size) is None]
+    elapsed = time.perf_counter() - start
+    glyphs = len(emoji) * len(args.sizes) - len(missing)
+    print(f"✅ {glyphs} glyphs for {len(emoji)} emoji at {len(args.sizes)} sizes "
+          f"({atlas.rasterized} rasterized, {glyphs - atlas.rasterized} from disk) in {elapsed * 1000:.0f} ms")
+    if atlas.available and missing:
+        print(f"⚠️  Not in the source: {' '.join(sorted(set(missing)))}")
+
+    if args.preview:
+        try:
+            font = ImageFont.truetype(args.font, 14)
+        except OSError:
+            print(f"⚠️  Cannot load {args.font}; using PIL's default font for the preview")
+            font = ImageFont.load_default(14)
+        labels = ['⭐ Quick Add', '🎮 Multi  🕹️ Console  📱 Handheld'] + [' '.join(emoji)]
+        preview = Image.new('RGB', (max(int(text_length(l, font, atlas)) for l in labels) + 16,
+                                    len(labels) * 24 + 8), 'white')
+        for i, label in enumerate(labels):
+            draw_text(preview, (8, 8 + i * 24), label, fill=(33, 33, 33), font=font, atlas=atlas)
+        preview.save(args.preview, 'PNG')
+        print(f"🖼️  Preview saved as {args.preview}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,83 +10,93 @@ except ImportError:
     PIL_AVAILABLE = False
 
 import os
+from functools import lru_cache
+
+from device_frames import DEFAULT_PROFILE, frame_screen
+from emoji_atlas import default_atlas, draw_text, text_length
+
+# Material Design 3 color roles used by the mockups. Screen creators accept a
+# dict with these keys so the same layout can be drawn in other themes.
+MATERIAL_COLORS = {
+    'primary': (25, 118, 210),              # #1976D2
+    'primary_container': (227, 242, 253),   # #E3F2FD
+    'background': (250, 250, 250),          # #FAFAFA
+    'surface': (255, 255, 255),             # White
+    'on_surface': (33, 33, 33),             # Dark gray
+    'outline': (224, 224, 224),             # Light gray
+    'success': (76, 175, 80),               # Green
+    'warning': (255, 152, 0),               # Orange
+    'on_primary': (255, 255, 255),          # White
+    'on_primary_container': (25, 118, 210), # #1976D2, same as primary
+    'on_primary_container_variant': (21, 101, 192),  # #1565C0, descriptions
+    'surface_variant': (245, 245, 245),     # Chips
+    'surface_container': (248, 249, 250),   # List items
+    'on_surface_variant': (117, 117, 117),  # Secondary text
+    'shadow': (200, 200, 200),              # Card shadows
+    'success_container': (232, 245, 233),   # #E8F5E9
+    'warning_container': (255, 243, 224),   # #FFF3E0
+    'on_warning_container': (230, 81, 0),   # #E65100
+    'error': (244, 67, 54),                 # #F44336
+    'error_container': (255, 235, 238),     # #FFEBEE
+    'on_error_container': (211, 47, 47),    # #D32F2F
+}
+
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a TrueType font once per process and reuse it across screens"""
+    return ImageFont.truetype(path, size)
 
 def create_android_phone_frame(content_image, filename):
     """Create a phone frame around the content"""
     if not PIL_AVAILABLE:
         return False
         
-    # Create phone frame (Google Pixel style)
-    phone_width = 340
-    phone_height = 680
-    
-    # Phone background (black frame)
-    phone = Image.new('RGBA', (phone_width, phone_height), (0, 0, 0, 255))
-    draw = ImageDraw.Draw(phone)
-    
-    # Rounded rectangle for screen area
-    screen_x, screen_y = 20, 20
-    screen_width = phone_width - 40
-    screen_height = phone_height - 40
-    
-    # Screen background
-    screen_bg = Image.new('RGBA', (screen_width, screen_height), (250, 250, 250, 255))
-    
-    # Resize content to fit screen
-    content_resized = content_image.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
-    
-    # Composite screen onto phone
-    phone.paste(screen_bg, (screen_x, screen_y))
-    phone.paste(content_resized, (screen_x, screen_y), content_resized if content_resized.mode == 'RGBA' else None)
-    
-    # Add phone details (home button, etc.)
-    # Home indicator
-    home_width = 60
-    home_height = 4
-    home_x = (phone_width - home_width) // 2
-    home_y = phone_height - 15
-    draw.rounded_rectangle([home_x, home_y, home_x + home_width, home_y + home_height], 
-                          radius=2, fill=(100, 100, 100, 255))
-    
+    phone = build_android_phone_frame(content_image)
     phone.save(filename, 'PNG')
     return True
 
-def create_home_screen():
+def build_android_phone_frame(content_image, profile=DEFAULT_PROFILE):
+    """Return the framed phone image without writing it to disk"""
+    # Frames are built once per profile by device_frames and cached
+    return frame_screen(content_image, profile)
+
+def create_home_screen(colors=None):
     """Create realistic home screen screenshot"""
     if not PIL_AVAILABLE:
         return False
         
+    colors = colors or MATERIAL_COLORS
     width, height = 300, 600
-    img = Image.new('RGB', (width, height), (250, 250, 250))
+    img = Image.new('RGB', (width, height), colors['background'])
     draw = ImageDraw.Draw(img)
     
     try:
         # Load system fonts
-        font_large = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 20)
-        font_medium = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 16)
-        font_small = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 14)
-        font_tiny = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 12)
+        font_large = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 20)
+        font_medium = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 16)
+        font_small = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 14)
+        font_tiny = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 12)
     except:
         font_large = font_medium = font_small = font_tiny = ImageFont.load_default()
     
     # Colors (Material Design 3)
-    primary_color = (25, 118, 210)      # #1976D2
-    surface_color = (255, 255, 255)     # White
-    on_surface = (33, 33, 33)           # Dark gray
-    outline = (224, 224, 224)           # Light gray
-    success_color = (76, 175, 80)       # Green
+    primary_color = colors['primary']
+    surface_color = colors['surface']
+    on_surface = colors['on_surface']
+    outline = colors['outline']
+    success_color = colors['success']
     
     y_pos = 0
     
     # Status bar
     draw.rectangle([0, y_pos, width, y_pos + 24], fill=primary_color)
-    draw.text((12, y_pos + 6), '9:41', fill='white', font=font_tiny)
-    draw.text((width - 50, y_pos + 6), '100%', fill='white', font=font_tiny)
+    draw.text((12, y_pos + 6), '9:41', fill=colors['on_primary'], font=font_tiny)
+    draw.text((width - 50, y_pos + 6), '100%', fill=colors['on_primary'], font=font_tiny)
     y_pos += 24
     
     # App bar  
-    draw.rectangle([0, y_pos, width, y_pos + 56], fill=(227, 242, 253))
-    draw.text((16, y_pos + 18), 'EmuSaves', fill=primary_color, font=font_large)
+    draw.rectangle([0, y_pos, width, y_pos + 56], fill=colors['primary_container'])
+    draw.text((16, y_pos + 18), 'EmuSaves', fill=colors['on_primary_container'], font=font_large)
     y_pos += 72
     
     # Sync Status Card
@@ -96,7 +106,7 @@ def create_home_screen():
     
     # Card background with shadow effect
     draw.rectangle([card_margin + 2, y_pos + 2, card_margin + card_width + 2, y_pos + card_height + 2], 
-                  fill=(200, 200, 200, 100))  # Shadow
+                  fill=colors['shadow'])  # Shadow
     draw.rectangle([card_margin, y_pos, card_margin + card_width, y_pos + card_height], 
                   fill=surface_color, outline=outline)
     
@@ -110,7 +120,7 @@ def create_home_screen():
     
     # Last sync info
     card_y += 24
-    draw.text((card_x, card_y), 'Last sync: Feb 16, 01:15', fill=(117, 117, 117), font=font_small)
+    draw.text((card_x, card_y), 'Last sync: Feb 16, 01:15', fill=colors['on_surface_variant'], font=font_small)
     
     # Sync button
     card_y += 30
@@ -124,14 +134,14 @@ def create_home_screen():
     bbox = draw.textbbox((0, 0), button_text, font=font_small)
     text_width = bbox[2] - bbox[0]
     text_x = card_x + (button_width - text_width) // 2
-    draw.text((text_x, card_y + 10), button_text, fill='white', font=font_small)
+    draw.text((text_x, card_y + 10), button_text, fill=colors['on_primary'], font=font_small)
     
     y_pos += card_height + 16
     
     # Folders Card
     card_height = 160
     draw.rectangle([card_margin + 2, y_pos + 2, card_margin + card_width + 2, y_pos + card_height + 2], 
-                  fill=(200, 200, 200, 100))  # Shadow
+                  fill=colors['shadow'])  # Shadow
     draw.rectangle([card_margin, y_pos, card_margin + card_width, y_pos + card_height], 
                   fill=surface_color, outline=outline)
     
@@ -161,29 +171,28 @@ def create_home_screen():
     
     # Quick Add button (filled tonal)
     draw.rectangle([card_x, card_y, card_x + button_width, card_y + 36], 
-                  fill=(227, 242, 253), outline=primary_color)
+                  fill=colors['primary_container'], outline=primary_color)
     quick_add_text = '⭐ Quick Add'
-    bbox = draw.textbbox((0, 0), quick_add_text, font=font_tiny)
-    text_width = bbox[2] - bbox[0]
-    text_x = card_x + (button_width - text_width) // 2
-    draw.text((text_x, card_y + 11), quick_add_text, fill=primary_color, font=font_tiny)
+    text_width = text_length(quick_add_text, font_tiny)
+    text_x = card_x + (button_width - int(text_width)) // 2
+    draw_text(img, (text_x, card_y + 11), quick_add_text, fill=colors['on_primary_container'], font=font_tiny)
     
     # Browse button (outlined)
     button_x = card_x + button_width + 8
     draw.rectangle([button_x, card_y, button_x + button_width, card_y + 36], 
-                  fill='white', outline=(117, 117, 117))
+                  fill=surface_color, outline=colors['on_surface_variant'])
     browse_text = '+ Browse'
     bbox = draw.textbbox((0, 0), browse_text, font=font_tiny)
     text_width = bbox[2] - bbox[0]
     text_x = button_x + (button_width - text_width) // 2
-    draw.text((text_x, card_y + 11), browse_text, fill=(117, 117, 117), font=font_tiny)
+    draw.text((text_x, card_y + 11), browse_text, fill=colors['on_surface_variant'], font=font_tiny)
     
     y_pos += card_height + 16
     
     # Synology Card
     card_height = 100
     draw.rectangle([card_margin + 2, y_pos + 2, card_margin + card_width + 2, y_pos + card_height + 2], 
-                  fill=(200, 200, 200, 100))  # Shadow
+                  fill=colors['shadow'])  # Shadow
     draw.rectangle([card_margin, y_pos, card_margin + card_width, y_pos + card_height], 
                   fill=surface_color, outline=outline)
     
@@ -192,41 +201,42 @@ def create_home_screen():
     draw.ellipse([card_x + card_width - 40, card_y - 2, card_x + card_width - 32, card_y + 6], fill=success_color)
     
     card_y += 24
-    draw.text((card_x, card_y), 'nas.local → /Drive/EmulatorBackups', fill=(117, 117, 117), font=font_tiny)
+    draw.text((card_x, card_y), 'nas.local → /Drive/EmulatorBackups', fill=colors['on_surface_variant'], font=font_tiny)
     
     card_y += 24
     draw.rectangle([card_x, card_y, card_x + card_width - 32, card_y + 32], 
-                  fill='white', outline=(117, 117, 117))
+                  fill=surface_color, outline=colors['on_surface_variant'])
     config_text = 'Update Configuration'
     bbox = draw.textbbox((0, 0), config_text, font=font_tiny)
     text_width = bbox[2] - bbox[0]
     text_x = card_x + ((card_width - 32) - text_width) // 2
-    draw.text((text_x, card_y + 10), config_text, fill=(117, 117, 117), font=font_tiny)
+    draw.text((text_x, card_y + 10), config_text, fill=colors['on_surface_variant'], font=font_tiny)
     
     return img
 
-def create_quick_add_dialog():
+def create_quick_add_dialog(colors=None):
     """Create Quick Add dialog screenshot"""
     if not PIL_AVAILABLE:
         return False
         
+    colors = colors or MATERIAL_COLORS
     width, height = 300, 600
-    img = Image.new('RGB', (width, height), (250, 250, 250))
+    img = Image.new('RGB', (width, height), colors['background'])
     draw = ImageDraw.Draw(img)
     
     try:
-        font_large = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 18)
-        font_medium = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 14)
-        font_small = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 12)
-        font_tiny = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 11)
+        font_large = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 18)
+        font_medium = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 14)
+        font_small = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 12)
+        font_tiny = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 11)
     except:
         font_large = font_medium = font_small = font_tiny = ImageFont.load_default()
     
     # Colors
-    primary_color = (25, 118, 210)
-    surface_color = (255, 255, 255)
-    on_surface = (33, 33, 33)
-    outline = (224, 224, 224)
+    primary_color = colors['primary']
+    surface_color = colors['surface']
+    on_surface = colors['on_surface']
+    outline = colors['outline']
     
     y_pos = 0
     
@@ -256,7 +266,7 @@ def create_quick_add_dialog():
     
     # Subtitle
     draw.text((dialog_x, current_y), 'Select common emulator save locations:', 
-              fill=(117, 117, 117), font=font_small)
+              fill=colors['on_surface_variant'], font=font_small)
     current_y += 24
     
     # Category chips
@@ -266,22 +276,22 @@ def create_quick_add_dialog():
     # Multi-System chip (selected)
     chip_width = 85
     draw.rectangle([dialog_x, chip_y, dialog_x + chip_width, chip_y + chip_height], 
-                  fill=(227, 242, 253), outline=primary_color)
-    draw.text((dialog_x + 8, chip_y + 8), '🎮 Multi', fill=primary_color, font=font_tiny)
+                  fill=colors['primary_container'], outline=primary_color)
+    draw_text(img, (dialog_x + 8, chip_y + 8), '🎮 Multi', fill=colors['on_primary_container'], font=font_tiny)
     
     # Console chip
     chip_x = dialog_x + chip_width + 8
     chip_width = 70
     draw.rectangle([chip_x, chip_y, chip_x + chip_width, chip_y + chip_height], 
-                  fill=(245, 245, 245), outline=outline)
-    draw.text((chip_x + 8, chip_y + 8), '🕹️ Console', fill=(117, 117, 117), font=font_tiny)
+                  fill=colors['surface_variant'], outline=outline)
+    draw_text(img, (chip_x + 8, chip_y + 8), '🕹️ Console', fill=colors['on_surface_variant'], font=font_tiny)
     
     # Handheld chip
     chip_x += chip_width + 8
     chip_width = 80
     draw.rectangle([chip_x, chip_y, chip_x + chip_width, chip_y + chip_height], 
-                  fill=(245, 245, 245), outline=outline)
-    draw.text((chip_x + 8, chip_y + 8), '📱 Handheld', fill=(117, 117, 117), font=font_tiny)
+                  fill=colors['surface_variant'], outline=outline)
+    draw_text(img, (chip_x + 8, chip_y + 8), '📱 Handheld', fill=colors['on_surface_variant'], font=font_tiny)
     
     current_y += chip_height + 16
     
@@ -299,29 +309,28 @@ def create_quick_add_dialog():
         # Item background
         if selected:
             draw.rectangle([dialog_x, current_y, dialog_x + item_width, current_y + item_height], 
-                          fill=(227, 242, 253), outline=primary_color, width=2)
-            text_color = primary_color
-            desc_color = (21, 101, 192)
+                          fill=colors['primary_container'], outline=primary_color, width=2)
+            text_color = accent = colors['on_primary_container']
+            desc_color = colors['on_primary_container_variant']
         else:
             draw.rectangle([dialog_x, current_y, dialog_x + item_width, current_y + item_height], 
-                          fill=(248, 249, 250), outline=outline)
+                          fill=colors['surface_container'], outline=outline)
             text_color = on_surface
-            desc_color = (117, 117, 117)
+            accent = primary_color
+            desc_color = colors['on_surface_variant']
         
-        # Icon
-        draw.text((dialog_x + 8, current_y + 18), icon, font=font_medium)
+        # Icon (color emoji from the atlas, pasted from its cache)
+        draw_text(img, (dialog_x + 8, current_y + 18), icon, font=font_medium)
         
         # Text content
         text_x = dialog_x + 32
         draw.text((text_x, current_y + 12), name, fill=text_color, font=font_small)
-        draw.text((text_x, current_y + 28), emulator, fill=primary_color, font=font_tiny)
+        draw.text((text_x, current_y + 28), emulator, fill=accent, font=font_tiny)
         draw.text((text_x, current_y + 42), description, fill=desc_color, font=font_tiny)
         
         # Arrow
-        if selected:
-            draw.text((dialog_x + item_width - 20, current_y + 24), '→', fill=primary_color, font=font_medium)
-        else:
-            draw.text((dialog_x + item_width - 20, current_y + 24), '→', fill=(117, 117, 117), font=font_medium)
+        arrow_color = accent if selected else colors['on_surface_variant']
+        draw.text((dialog_x + item_width - 20, current_y + 24), '→', fill=arrow_color, font=font_medium)
         
         current_y += item_height + 4
     
@@ -335,46 +344,47 @@ def create_quick_add_dialog():
     bbox = draw.textbbox((0, 0), close_text, font=font_small)
     text_width = bbox[2] - bbox[0]
     text_x = button_x + (button_width - text_width) // 2
-    draw.text((text_x, button_y + 10), close_text, fill='white', font=font_small)
+    draw.text((text_x, button_y + 10), close_text, fill=colors['on_primary'], font=font_small)
     
     return img
 
-def create_sync_progress():
+def create_sync_progress(colors=None):
     """Create sync progress screenshot"""  
     if not PIL_AVAILABLE:
         return False
         
+    colors = colors or MATERIAL_COLORS
     width, height = 300, 600
-    img = Image.new('RGB', (width, height), (250, 250, 250))
+    img = Image.new('RGB', (width, height), colors['background'])
     draw = ImageDraw.Draw(img)
     
     try:
-        font_large = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 20)
-        font_medium = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 16)
-        font_small = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 14)
-        font_tiny = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 12)
+        font_large = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 20)
+        font_medium = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 16)
+        font_small = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 14)
+        font_tiny = load_font('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 12)
     except:
         font_large = font_medium = font_small = font_tiny = ImageFont.load_default()
     
     # Colors
-    primary_color = (25, 118, 210)
-    surface_color = (255, 255, 255)
-    on_surface = (33, 33, 33)
-    outline = (224, 224, 224)
-    success_color = (76, 175, 80)
-    warning_color = (255, 152, 0)
+    primary_color = colors['primary']
+    surface_color = colors['surface']
+    on_surface = colors['on_surface']
+    outline = colors['outline']
+    success_color = colors['success']
+    warning_color = colors['warning']
     
     y_pos = 0
     
     # Status bar
     draw.rectangle([0, y_pos, width, y_pos + 24], fill=primary_color)
-    draw.text((12, y_pos + 6), '9:43', fill='white', font=font_tiny)
-    draw.text((width - 50, y_pos + 6), '95%', fill='white', font=font_tiny)
+    draw.text((12, y_pos + 6), '9:43', fill=colors['on_primary'], font=font_tiny)
+    draw.text((width - 50, y_pos + 6), '95%', fill=colors['on_primary'], font=font_tiny)
     y_pos += 24
     
     # App bar
-    draw.rectangle([0, y_pos, width, y_pos + 56], fill=(227, 242, 253))
-    draw.text((16, y_pos + 18), 'EmuSaves', fill=primary_color, font=font_large)
+    draw.rectangle([0, y_pos, width, y_pos + 56], fill=colors['primary_container'])
+    draw.text((16, y_pos + 18), 'EmuSaves', fill=colors['on_primary_container'], font=font_large)
     y_pos += 72
     
     # Active Sync Status Card (highlighted border)
@@ -384,7 +394,7 @@ def create_sync_progress():
     
     # Card with success border
     draw.rectangle([card_margin + 2, y_pos + 2, card_margin + card_width + 2, y_pos + card_height + 2], 
-                  fill=(200, 200, 200, 100))
+                  fill=colors['shadow'])
     draw.rectangle([card_margin, y_pos, card_margin + card_width, y_pos + card_height], 
                   fill=surface_color, outline=success_color, width=2)
     
@@ -407,7 +417,7 @@ def create_sync_progress():
     progress_width = card_width - 32
     progress_height = 4
     draw.rectangle([card_x, card_y, card_x + progress_width, card_y + progress_height], 
-                  fill=(224, 224, 224))
+                  fill=outline)
     # 75% progress
     progress_fill = int(progress_width * 0.75)
     draw.rectangle([card_x, card_y, card_x + progress_fill, card_y + progress_height], 
@@ -424,40 +434,40 @@ def create_sync_progress():
     
     # Files Found stat
     draw.rectangle([card_x, card_y, card_x + stat_width, card_y + stat_height], 
-                  fill=(232, 245, 233), outline=success_color)
+                  fill=colors['success_container'], outline=success_color)
     draw.text((card_x + stat_width // 2 - 8, card_y + 12), '12', 
               fill=success_color, font=font_large)
     draw.text((card_x + stat_width // 2 - 30, card_y + 36), 'Files Found', 
               fill=success_color, font=font_tiny)
-    draw.text((card_x + 8, card_y + 52), 'RetroArch, PPSSPP', fill=(117, 117, 117), font=font_tiny)
-    draw.text((card_x + 8, card_y + 66), '2.3 MB total', fill=(117, 117, 117), font=font_tiny)
+    draw.text((card_x + 8, card_y + 52), 'RetroArch, PPSSPP', fill=colors['on_surface_variant'], font=font_tiny)
+    draw.text((card_x + 8, card_y + 66), '2.3 MB total', fill=colors['on_surface_variant'], font=font_tiny)
     
     # Uploaded stat  
     stat_x = card_x + stat_width + 8
     draw.rectangle([stat_x, card_y, stat_x + stat_width, card_y + stat_height], 
-                  fill=(227, 242, 253), outline=primary_color)
+                  fill=colors['primary_container'], outline=primary_color)
     draw.text((stat_x + stat_width // 2 - 8, card_y + 12), '9', 
-              fill=primary_color, font=font_large)
+              fill=colors['on_primary_container'], font=font_large)
     draw.text((stat_x + stat_width // 2 - 20, card_y + 36), 'Uploaded', 
-              fill=primary_color, font=font_tiny)
-    draw.text((stat_x + 8, card_y + 52), '1.7 MB synced', fill=(117, 117, 117), font=font_tiny)
+              fill=colors['on_primary_container'], font=font_tiny)
+    draw.text((stat_x + 8, card_y + 52), '1.7 MB synced', fill=colors['on_surface_variant'], font=font_tiny)
     draw.text((stat_x + 8, card_y + 66), '✓ No conflicts', fill=success_color, font=font_tiny)
     
     # Current file
     card_y += stat_height + 16
-    draw.text((card_x, card_y), 'Currently uploading:', fill=(117, 117, 117), font=font_small)
+    draw.text((card_x, card_y), 'Currently uploading:', fill=colors['on_surface_variant'], font=font_small)
     card_y += 20
     
     # Current file box
     draw.rectangle([card_x, card_y, card_x + card_width - 32, card_y + 32], 
-                  fill=(255, 243, 224), outline=warning_color)
+                  fill=colors['warning_container'], outline=warning_color)
     draw.text((card_x + 8, card_y + 10), 'zelda_link_awakening.srm', 
-              fill=(230, 81, 0), font=font_tiny)
+              fill=colors['on_warning_container'], font=font_tiny)
     draw.text((card_x + card_width - 60, card_y + 10), '47%', fill=warning_color, font=font_tiny)
     
     # Recent uploads
     card_y += 48
-    draw.text((card_x, card_y), 'Recent uploads:', fill=(117, 117, 117), font=font_small)
+    draw.text((card_x, card_y), 'Recent uploads:', fill=colors['on_surface_variant'], font=font_small)
     card_y += 20
     
     recent_files = [
@@ -473,12 +483,12 @@ def create_sync_progress():
     # Cancel button
     card_y += 16
     draw.rectangle([card_x, card_y, card_x + card_width - 32, card_y + 40], 
-                  fill=(255, 235, 238), outline=(244, 67, 54))
+                  fill=colors['error_container'], outline=colors['error'])
     cancel_text = 'Cancel Sync'
     bbox = draw.textbbox((0, 0), cancel_text, font=font_small)
     text_width = bbox[2] - bbox[0]
     text_x = card_x + ((card_width - 32) - text_width) // 2
-    draw.text((text_x, card_y + 12), cancel_text, fill=(211, 47, 47), font=font_small)
+    draw.text((text_x, card_y + 12), cancel_text, fill=colors['on_error_container'], font=font_small)
     
     return img
 
@@ -490,6 +500,9 @@ def main():
         print("❌ PIL not available. Install with: pip install pillow")
         return
     
+    if not default_atlas().available:
+        print("⚠️  No color emoji source found; emoji are left out (see emoji_atlas.py)")
+    
     # Create output directory
     os.makedirs('docs/screenshots', exist_ok=True)
     
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Generate light, dark and dynamic-color variants of the realistic screenshots.
+
+Every screen creator takes a dict of Material color roles, so each theme is
+simply drawn with its own colors (about 8 ms per screen). Pasted color emoji
+and the few fixed accent colors keep their values in every theme.
+
+Usage: python3 generate_theme_variants.py [light] [dark] [dynamic]
+"""
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+import os
+import sys
+
+from generate_realistic_screenshots import (
+    MATERIAL_COLORS,
+    create_android_phone_frame,
+    create_home_screen,
+    create_quick_add_dialog,
+    create_sync_progress,
+)
+
+# Color schemes from app/src/main/java/com/emusaves/ui/theme/Theme.kt. Only
+# primary is overridden there; the other roles are the Material 3 baseline
+# values that lightColorScheme()/darkColorScheme() fall back to. Dynamic color
+# depends on the wallpaper, so the blue scheme the mockups already use stands
+# in as a sample. Success, warning, their containers, the flat card shadow and
+# the description variant of onPrimaryContainer are mockup colors with no
+# Material 3 role.
+THEMES = {
+    'light': {
+        'primary': (103, 80, 164),               # 0xFF6750A4
+        'primary_container': (234, 221, 255),    # 0xFFEADDFF
+        'background': (255, 251, 254),           # 0xFFFFFBFE
+        'surface': (255, 251, 254),              # 0xFFFFFBFE
+        'on_surface': (28, 27, 31),              # 0xFF1C1B1F
+        'outline': (121, 116, 126),              # 0xFF79747E
+        'success': (76, 175, 80),
+        'warning': (255, 152, 0),
+        'on_primary': (255, 255, 255),           # 0xFFFFFFFF
+        'on_primary_container': (33, 0, 93),     # 0xFF21005D
+        'on_primary_container_variant': (33, 0, 93),
+        'surface_variant': (231, 224, 236),      # 0xFFE7E0EC
+        'surface_container': (243, 237, 247),    # 0xFFF3EDF7
+        'on_surface_variant': (73, 69, 79),      # 0xFF49454F
+        'shadow': (200, 200, 200),
+        'success_container': (232, 245, 233),
+        'warning_container': (255, 243, 224),
+        'on_warning_container': (230, 81, 0),
+        'error': (179, 38, 30),                  # 0xFFB3261E
+        'error_container': (249, 222, 220),      # 0xFFF9DEDC
+        'on_error_container': (65, 14, 11),      # 0xFF410E0B
+    },
+    'dark': {
+        'primary': (103, 80, 164),               # 0xFF6750A4
+        'primary_container': (79, 55, 139),      # 0xFF4F378B
+        'background': (28, 27, 31),              # 0xFF1C1B1F
+        'surface': (28, 27, 31),                 # 0xFF1C1B1F
+        'on_surface': (230, 225, 229),           # 0xFFE6E1E5
+        'outline': (147, 143, 153),              # 0xFF938F99
+        'success': (129, 199, 132),
+        'warning': (255, 183, 77),
+        # Theme.kt keeps the light primary in dark mode but not its onPrimary,
+        # so button labels are low-contrast in the app as well
+        'on_primary': (56, 30, 114),             # 0xFF381E72
+        'on_primary_container': (234, 221, 255), # 0xFFEADDFF
+        'on_primary_container_variant': (234, 221, 255),
+        'surface_variant': (73, 69, 79),         # 0xFF49454F
+        'surface_container': (33, 31, 38),       # 0xFF211F26
+        'on_surface_variant': (202, 196, 208),   # 0xFFCAC4D0
+        'shadow': (0, 0, 0),
+        'success_container': (27, 94, 32),
+        'warning_container': (102, 60, 0),
+        'on_warning_container': (255, 224, 178),
+        'error': (242, 184, 181),                # 0xFFF2B8B5
+        'error_container': (140, 29, 24),        # 0xFF8C1D18
+        'on_error_container': (249, 222, 220),   # 0xFFF9DEDC
+    },
+    'dynamic': MATERIAL_COLORS,
+}
+
+
+def main():
+    """Render every screen in each theme and write one framed PNG per theme"""
+    print("🎨 Generating EmuSaves theme variants...")
+
+    if not PIL_AVAILABLE:
+        print("❌ PIL not available. Install with: pip install pillow")
+        return
+
+    themes = sys.argv[1:] or list(THEMES)
+    unknown = [name for name in themes if name not in THEMES]
+    if unknown:
+        print(f"❌ Unknown theme(s): {', '.join(unknown)} (choose from {', '.join(THEMES)})")
+        return
+
+    os.makedirs('docs/screenshots', exist_ok=True)
+
+    screens = [
+        ('Home Screen', create_home_screen, 'screenshot-home'),
+        ('Quick Add Dialog', create_quick_add_dialog, 'screenshot-quick-add'),
+        ('Sync Progress', create_sync_progress, 'screenshot-sync-progress'),
+    ]
+
+    for name, creator_func, basename in screens:
+        print(f"📱 Rendering {name}...")
+        for theme in themes:
+            filepath = f'docs/screenshots/{basename}-{theme}.png'
+            create_android_phone_frame(creator_func(colors=THEMES[theme]), filepath)
+            print(f"✅ {theme} saved as {filepath}")
+
+    print(f"\n🎉 Generated {len(screens) * len(themes)} themed screenshots!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Batch post-processing for real device captures.
+
+scripts/take-screenshots.sh pulls raw `adb shell screencap` PNGs: full device
+resolution, live status bar (real clock, notifications, carrier). This turns a
+whole folder of them into documentation screenshots. Each capture is:
+
+  1. normalized   EXIF orientation applied, converted to RGB
+  2. status bar   replaced with a clean 9:41 / 100% bar, cropped off, or kept
+  3. resized      to the phone frame's screen area, keeping the aspect ratio
+                  (excess height is trimmed from the bottom)
+  4. framed       with a device_frames profile (the docs phone by default)
+
+Captures are streamed through a process pool; each worker opens, processes
+and writes one file, so images are never shipped between processes. No
+device is needed: any folder of PNGs works.
+
+Usage:
+  python3 process_device_captures.py docs/screenshots/captures -o docs/screenshots
+  python3 process_device_captures.py ~/captures -o docs/screenshots --status-bar crop
+"""
+
+try:
+    from PIL import Image, ImageDraw, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+import argparse
+import glob
+import multiprocessing
+import os
+import time
+
+from device_frames import DEFAULT_PROFILE, PROFILES, frame_screen, screen_size
+from generate_realistic_screenshots import load_font
+
+# Android's status bar is 24dp; captures are measured against a 411dp wide
+# phone (Pixel) unless --density says otherwise
+STATUS_BAR_DP = 24
+REFERENCE_WIDTH_DP = 411
+
+OUTPUT_SUFFIX = '-framed'
+FONT_PATH = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+
+
+def status_bar_height(image, density=None):
+    density = density or image.width / REFERENCE_WIDTH_DP
+    return round(STATUS_BAR_DP * density)
+
+
+def normalize(image):
+    """Apply EXIF rotation and drop alpha/palette so every capture is plain RGB"""
+    image = ImageOps.exif_transpose(image)
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    return image
+
+
+def replace_status_bar(image, height, clock='9:41', battery='100%'):
+    """Paint over the live status bar with a clean one in the app bar's color"""
+    # A row just below the bar is the top of the app bar; its most common
+    # color is the background the status bar is drawn on
+    sample_y = min(image.height - 1, height + max(1, height // 8))
+    row = image.crop((0, sample_y, image.width, sample_y + 1))
+    colors = row.getcolors(image.width) or [(1, row.getpixel((0, 0)))]
+    background = max(colors)[1]
+    luminance = 0.299 * background[0] + 0.587 * background[1] + 0.114 * background[2]
+    foreground = (33, 33, 33) if luminance > 150 else (255, 255, 255)
+
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, 0, image.width, height], fill=background)
+    font = load_font(FONT_PATH, max(8, height // 2))
+    margin = height // 2
+    text_y = (height - font.size) // 2
+    draw.text((margin, text_y), clock, fill=foreground, font=font)
+    bbox = draw.textbbox((0, 0), battery, font=font)
+    draw.text((image.width - margin - (bbox[2] - bbox[0]), text_y), battery, fill=foreground, font=font)
+    return image
+
+
+def fit_screen(image, size):
+    """Scale to cover the screen area, anchored at the top"""
+    width, height = image.size
+    # Crop the source to the target aspect first so only kept pixels are resampled
+    if width * size[1] > height * size[0]:
+        crop_width = round(height * size[0] / size[1])
+        left = (width - crop_width) // 2
+        image = image.crop((left, 0, left + crop_width, height))
+    else:
+        image = image.crop((0, 0, width, round(width * size[1] / size[0])))
+    # reducing_gap lets Pillow box-reduce by an integer factor before LANCZOS
+    return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def process_capture(job):
+    """Worker: one capture in, one framed PNG out; returns (name, seconds, source size)"""
+    source, output_dir, status_bar, density, compress_level, device = job
+    start = time.perf_counter()
+    with Image.open(source) as capture:
+        source_size = capture.size
+        image = normalize(capture)
+
+    height = status_bar_height(image, density)
+    if status_bar == 'replace':
+        image = replace_status_bar(image, height)
+    elif status_bar == 'crop':
+        image = image.crop((0, height, image.width, image.height))
+
+    framed = frame_screen(fit_screen(image, screen_size(device)), device)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    target = os.path.join(output_dir, f'{stem}{OUTPUT_SUFFIX}.png')
+    framed.save(target, 'PNG', compress_level=compress_level)
+    return target, time.perf_counter() - start, source_size
+
+
+def find_captures(input_dir, min_width=0):
+    """PNG captures in a folder, skipping files this tool wrote earlier
+
+    Returns (captures, skipped) where skipped lists (path, reason) for PNGs
+    that cannot be read or whose short side is below min_width.
+    """
+    paths = sorted(glob.glob(os.path.join(input_dir, '*.png')))
+    captures, skipped = [], []
+    for path in paths:
+        if os.path.splitext(path)[0].endswith(OUTPUT_SUFFIX):
+            continue
+        try:
+            # Only the header is read here
+            with Image.open(path) as image:
+                size = image.size
+        except OSError as e:
+            skipped.append((path, f'unreadable: {e}'))
+            continue
+        if min(size) < min_width:
+            skipped.append((path, f'{size[0]}x{size[1]} is below --min-width {min_width}'))
+        else:
+            captures.append(path)
+    return captures, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Normalize, clean up and frame a folder of device captures')
+    parser.add_argument('input', help='Folder of PNG captures')
+    parser.add_argument('-o', '--output', help='Output folder (default: the input folder)')
+    parser.add_argument('--status-bar', choices=('replace', 'crop', 'keep'), default='replace')
+    parser.add_argument('--density', type=float, help='Device density (px per dp); default assumes a 411dp wide screen')
+    parser.add_argument('--device', choices=sorted(PROFILES), default=DEFAULT_PROFILE, help='Device frame profile')
+    parser.add_argument('--compress-level', type=int, default=6, help='PNG compression level 0-9')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Process pool size')
+    parser.add_argument('--min-width', type=int, default=0,
+                        help='Skip PNGs whose short side is narrower, e.g. 720 to leave out mockups')
+    args = parser.parse_args()
+
+    print("📸 Processing device captures...")
+
+    if not PIL_AVAILABLE:
+        print("❌ PIL not available. Install with: pip install pillow")
+        return
+
+    captures, skipped = find_captures(args.input, args.min_width)
+    for path, reason in skipped:
+        print(f"⏭️  Skipped {path} ({reason})")
+    if not captures:
+        print(f"❌ No PNG captures found in {args.input}")
+        return
+    output_dir = args.output or args.input
+    os.makedirs(output_dir, exist_ok=True)
+
+    jobs = [(path, output_dir, args.status_bar, args.density, args.compress_level, args.device)
+            for path in captures]
+    start = time.perf_counter()
+    failures = 0
+    with multiprocessing.Pool(args.workers) as pool:
+        results = pool.imap_unordered(process_capture, jobs, chunksize=max(1, len(jobs) // (args.workers * 4)))
+        while True:
+            try:
+                target, seconds, (width, height) = next(results)
+            except StopIteration:
+                break
+            except Exception as e:
+                failures += 1
+                print(f"❌ {e}")
+                continue
+            print(f"✅ {target} ({width}x{height}, {seconds * 1000:.0f} ms)")
+    elapsed = time.perf_counter() - start
+
+    done = len(jobs) - failures
+    print(f"\n🎉 Framed {done}/{len(jobs)} captures in {elapsed:.2f}s ({done / elapsed:.1f}/s, {args.workers} workers)")
+
+
+if __name__ == '__main__':
+    main()
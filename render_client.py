@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Thin client for render_daemon.py.
+
+Imports only the standard library, so a call costs interpreter startup plus
+one socket round trip; the daemon (started automatically on first use) does
+the drawing with warm fonts and layers. Paths are sent as absolute paths.
+
+Usage:
+  python3 render_client.py                        # same output as generate_realistic_screenshots.py
+  python3 render_client.py render home --theme dark -o docs/screenshots/home-dark.png
+  python3 render_client.py frame capture.png -o framed.png
+  python3 render_client.py convert docs/screenshots/realistic-home-screen.svg -o home.png
+  python3 render_client.py stop
+"""
+
+import argparse
+import base64
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+DAEMON_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'render_daemon.py')
+
+
+def default_socket_path():
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(runtime_dir, f'emusaves-render-{os.getuid()}.sock')
+
+
+class RenderClient:
+    """Send jobs to the render daemon, starting it if it is not running"""
+
+    def __init__(self, socket_path=None, autostart=True, start_timeout=15):
+        self.socket_path = socket_path or default_socket_path()
+        self.autostart = autostart
+        self.start_timeout = start_timeout
+        self.sock = None
+        self.reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.sock is not None:
+            self.reader.close()
+            self.sock.close()
+            self.sock = self.reader = None
+
+    def connect(self):
+        if self.sock is not None:
+            return
+        try:
+            self._open()
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not self.autostart:
+                raise
+            self._start_daemon()
+
+    def _open(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+        self.reader = sock.makefile('rb')
+
+    def _start_daemon(self):
+        subprocess.Popen(
+            [sys.executable, DAEMON_SCRIPT, '--socket', self.socket_path],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            try:
+                self._open()
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f'render daemon did not start on {self.socket_path}')
+                time.sleep(0.05)
+
+    def request(self, payload):
+        """Send one job and return the daemon's reply dict"""
+        self.connect()
+        self.sock.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        line = self.reader.readline()
+        if not line:
+            self.close()
+            raise ConnectionError('render daemon closed the connection')
+        return json.loads(line)
+
+    def _result(self, reply):
+        if not reply.get('ok'):
+            raise RuntimeError(reply.get('error', 'render failed'))
+        if 'png' in reply:
+            return base64.b64decode(reply['png'])
+        return reply.get('path')
+
+    def render(self, screen, theme=None, frame=True, output=None):
+        """Render a screen; returns the output path, or PNG bytes without one"""
+        payload = {'op': 'render', 'screen': screen, 'theme': theme, 'frame': frame}
+        if output:
+            payload['output'] = os.path.abspath(output)
+        return self._result(self.request(payload))
+
+    def frame(self, input_path, output=None):
+        payload = {'op': 'frame', 'input': os.path.abspath(input_path)}
+        if output:
+            payload['output'] = os.path.abspath(output)
+        return self._result(self.request(payload))
+
+    def convert(self, input_path, output):
+        payload = {'op': 'convert', 'input': os.path.abspath(input_path), 'output': os.path.abspath(output)}
+        return self._result(self.request(payload))
+
+    def ping(self):
+        return self.request({'op': 'ping'})
+
+    def shutdown(self):
+        reply = self.request({'op': 'shutdown'})
+        self.close()
+        return reply
+
+
+def generate_default_screenshots(client):
+    """Same files generate_realistic_screenshots.py writes, rendered by the daemon"""
+    os.makedirs('docs/screenshots', exist_ok=True)
+    screenshots = [
+        ('Home Screen', 'home', 'screenshot-home-realistic.png'),
+        ('Quick Add Dialog', 'quick-add', 'screenshot-quick-add-realistic.png'),
+        ('Sync Progress', 'sync-progress', 'screenshot-sync-progress-realistic.png'),
+    ]
+    for name, screen, filename in screenshots:
+        filepath = f'docs/screenshots/{filename}'
+        client.render(screen, output=filepath)
+        print(f"✅ {name} saved as {filepath}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run screenshot jobs on the warm render daemon')
+    parser.add_argument('--socket', default=None, help='Daemon socket path')
+    commands = parser.add_subparsers(dest='command')
+
+    render = commands.add_parser('render', help='Render a screen')
+    render.add_argument('screen', help='home, quick-add or sync-progress')
+    render.add_argument('--theme', help='light, dark or dynamic')
+    render.add_argument('--no-frame', action='store_true', help='Skip the phone frame')
+    render.add_argument('-o', '--output', required=True)
+
+    frame = commands.add_parser('frame', help='Put a capture into the phone frame')
+    frame.add_argument('input')
+    frame.add_argument('-o', '--output', required=True)
+
+    convert = commands.add_parser('convert', help='Convert an SVG mockup to PNG')
+    convert.add_argument('input')
+    convert.add_argument('-o', '--output', required=True)
+
+    commands.add_parser('stop', help='Shut the daemon down')
+    args = parser.parse_args()
+
+    if args.command == 'stop':
+        client = RenderClient(args.socket, autostart=False)
+        try:
+            client.shutdown()
+            print("🛑 Render daemon stopped")
+        except (FileNotFoundError, ConnectionRefusedError):
+            print("Render daemon is not running")
+        return
+
+    with RenderClient(args.socket) as client:
+        try:
+            if args.command == 'render':
+                print(client.render(args.screen, args.theme, not args.no_frame, args.output))
+            elif args.command == 'frame':
+                print(client.frame(args.input, args.output))
+            elif args.command == 'convert':
+                print(client.convert(args.input, args.output))
+            else:
+                generate_default_screenshots(client)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Long-running render service for the screenshot generators.
+
+Build tooling calls the generators dozens of times per build, and every call
+pays for interpreter startup, the PIL import and TrueType loading again. This
+daemon imports everything once and keeps it warm: fonts (load_font cache)
+and the SVG converter that last worked. Jobs arrive as one JSON object per
+line on a Unix socket and run on an internal thread pool; each reply is one
+JSON line.
+
+Requests (output is optional; without it the PNG comes back base64-encoded):
+  {"op": "render", "screen": "home", "theme": "dark", "frame": true, "output": "out.png"}
+  {"op": "frame", "input": "capture.png", "output": "framed.png"}
+  {"op": "convert", "input": "screen.svg", "output": "screen.png"}
+  {"op": "ping"}  /  {"op": "shutdown"}
+
+Use render_client.py to talk to it; the client starts the daemon on demand.
+
+Usage: python3 render_daemon.py [--socket PATH] [--workers N]
+"""
+
+import argparse
+import base64
+import fcntl
+import json
+import os
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from create_png_screenshots import CONVERSION_METHODS, convert_svg_file
+from render_client import default_socket_path
+from screenshot_api import encode, frame, render_screen
+
+
+class RenderService:
+    """Job handlers plus the state kept warm between jobs"""
+
+    def __init__(self, workers):
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.converters = list(CONVERSION_METHODS)
+        self.converters_lock = threading.Lock()
+
+    def submit(self, request):
+        return self.pool.submit(self.handle, request)
+
+    def handle(self, request):
+        op = request.get('op')
+        handler = getattr(self, f'do_{op}', None)
+        if handler is None:
+            return {'ok': False, 'error': f'unknown op: {op}'}
+        try:
+            return handler(request)
+        except Exception as e:
+            return {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+
+    def do_ping(self, request):
+        return {'ok': True, 'pid': os.getpid()}
+
+    def do_render(self, request):
+        image = render_screen(request['screen'], request.get('theme'))
+        if request.get('frame', True):
+            image = frame(image)
+        return self.reply_image(image, request.get('output'))
+
+    def do_frame(self, request):
+        with Image.open(request['input']) as capture:
+            image = frame(capture.convert('RGBA'))
+        return self.reply_image(image, request.get('output'))
+
+    def do_convert(self, request):
+        output = request['output']
+        with self.converters_lock:
+            converters = list(self.converters)
+        method = convert_svg_file(request['input'], output, converters)
+        if method is None:
+            return {'ok': False, 'error': 'no working SVG conversion tool found'}
+        # Try the converter that worked first next time
+        with self.converters_lock:
+            if self.converters[0] is not method:
+                self.converters.remove(method)
+                self.converters.insert(0, method)
+        return {'ok': True, 'path': output}
+
+    @staticmethod
+    def reply_image(image, output):
+        if output:
+            image.save(output, 'PNG')
+            return {'ok': True, 'path': os.path.abspath(output)}
+        return {'ok': True, 'png': base64.b64encode(encode(image)).decode('ascii')}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Read JSON lines from one client, answer each in order"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                reply = {'ok': False, 'error': f'bad request: {e}'}
+            else:
+                if request.get('op') == 'shutdown':
+                    self.send({'ok': True})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                reply = self.server.service.submit(request).result()
+            self.send(reply)
+
+    def send(self, reply):
+        self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path, workers):
+    # Two clients can autostart a daemon at the same moment. Whoever holds the
+    # lock owns the socket; the other daemon leaves it alone and exits, and
+    # its client connects to the winner.
+    lock = open(f'{socket_path}.lock', 'w')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock.close()
+        print(f"🖥️  EmuSaves render daemon already running on {socket_path}", flush=True)
+        return
+    # With the lock held, a socket file left here is from a daemon that died
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = RenderServer(socket_path, RequestHandler)
+    server.service = RenderService(workers)
+    print(f"🖥️  EmuSaves render daemon listening on {socket_path} (pid {os.getpid()})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.pool.shutdown()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        lock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve screenshot render jobs over a Unix socket')
+    parser.add_argument('--socket', default=default_socket_path(), help='Socket path')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Render threads')
+    args = parser.parse_args()
+
+    serve(args.socket, args.workers)
+
+
+if __name__ == '__main__':
+    main()
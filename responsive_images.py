@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Responsive image sets for the README and release notes.
+
+The README shows each screenshot at width="250" while the files are 340x680,
+and high-DPI screens want 2x and 3x versions. This renders each screen once
+at the largest size and derives the whole set from it in a cascade: every
+size is resampled from the next larger one, never from the source again, so
+each step only shrinks by a small factor. All sizes are then encoded in
+parallel; PNG encoding releases the GIL, so a thread pool is enough. Matching
+<img srcset> markup is printed for pasting into Markdown.
+
+The mockup creators draw at a fixed 1x size, so rendered screens are framed
+at that native resolution and their sets stop there: an upscaled 2x or 3x
+candidate would add bytes but no detail. Existing PNGs (for example framed
+device captures) can be passed with --input to get the high-density sizes.
+
+Usage:
+  python3 responsive_images.py                               # home, quick-add, sync-progress
+  python3 responsive_images.py --input docs/screenshots/screenshot-home.png
+"""
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from build_screenshot_gallery import title_from_filename
+from device_frames import DEFAULT_PROFILE, PROFILES, frame_screen, screen_size
+from generate_theme_variants import THEMES
+from screenshot_api import SCREENS, encode, render_screen, save
+
+README = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'README.md')
+
+# CSS width the README displays screenshots at, and the set built around it
+DISPLAY_WIDTH = 250
+DENSITIES = (3, 2, 1)
+THUMBNAIL_WIDTH = 120
+
+
+def render_native(name, theme=None, profile=DEFAULT_PROFILE):
+    """One framed render of a screen at the resolution the mockup is drawn at"""
+    # Frames are built at any scale, so scale the frame to the screen instead
+    # of resampling the screen to the frame
+    screen = render_screen(name, theme)
+    scale = screen.width / PROFILES[profile].screen[0]
+    return frame_screen(screen.resize(screen_size(profile, scale), Image.Resampling.LANCZOS), profile, scale)
+
+
+def build_image_set(image, widths):
+    """Resize image to every width (largest first), each from the next larger size"""
+    images = {}
+    current = image
+    for width in sorted(widths, reverse=True):
+        if width > current.width:
+            raise ValueError(f'{width}px is wider than the {current.width}px source')
+        height = round(current.height * width / current.width)
+        if width != current.width:
+            current = current.resize((width, height), Image.Resampling.LANCZOS)
+        images[width] = current
+    return images
+
+
+def encode_image_set(images, workers=None, **params):
+    """Encode every size in parallel; returns {width: PNG bytes}"""
+    with ThreadPoolExecutor(max_workers=workers or len(images)) as pool:
+        futures = {width: pool.submit(encode, image, 'PNG', **params) for width, image in images.items()}
+        return {width: future.result() for width, future in futures.items()}
+
+
+def set_filename(basename, width):
+    return f'{basename}-{width}w.png'
+
+
+def srcset_markup(basename, widths, height, alt, prefix='docs/screenshots/', display_width=DISPLAY_WIDTH):
+    """<img> tag with density descriptors for the display width (thumbnails are left out)"""
+    candidates = []
+    for density in sorted(DENSITIES):
+        width = display_width * density
+        if width in widths:
+            candidates.append(f'{prefix}{set_filename(basename, width)} {density}x')
+    return (f'<img src="{prefix}{set_filename(basename, display_width)}" '
+            f'srcset="{", ".join(candidates)}" alt="{alt}" width="{display_width}" height="{height}"/>')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build responsive PNG sets and srcset markup')
+    parser.add_argument('screens', nargs='*', help=f'Screens to render ({", ".join(SCREENS)}); default: all')
+    parser.add_argument('--input', nargs='*', default=[], help='Existing PNGs to build sets from instead')
+    parser.add_argument('--theme', choices=sorted(THEMES), help='Color theme for rendered screens')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default=DEFAULT_PROFILE, help='Device frame')
+    parser.add_argument('--display-width', type=int, default=DISPLAY_WIDTH, help='CSS width in the README')
+    parser.add_argument('--output', default='docs/screenshots', help='Output folder')
+    parser.add_argument('--readme', default=README, help='Markdown file the markup paths are relative to')
+    args = parser.parse_args()
+
+    print("🖼️  Building responsive screenshot sets...")
+
+    if not PIL_AVAILABLE:
+        print("❌ PIL not available. Install with: pip install pillow")
+        return
+
+    widths = sorted({args.display_width * density for density in DENSITIES} | {THUMBNAIL_WIDTH}, reverse=True)
+    os.makedirs(args.output, exist_ok=True)
+    readme_dir = os.path.dirname(os.path.abspath(args.readme))
+    prefix = os.path.relpath(os.path.abspath(args.output), readme_dir).replace(os.sep, '/') + '/'
+
+    jobs = []
+    for path in args.input:
+        jobs.append((os.path.splitext(os.path.basename(path))[0], lambda path=path: Image.open(path).convert('RGBA')))
+    if not args.input:
+        print("ℹ️  Mockups are drawn at 1x, so rendered sets stop at their native size and list "
+              "only 1x in srcset; pass high-resolution captures with --input for 2x/3x")
+        for name in args.screens or list(SCREENS):
+            basename = f'screenshot-{name}' + (f'-{args.theme}' if args.theme else '')
+            jobs.append((basename, lambda name=name: render_native(name, args.theme, args.profile)))
+
+    markup = []
+    for basename, load in jobs:
+        start = time.perf_counter()
+        source = load()
+        rendered = time.perf_counter()
+        if source.width < args.display_width:
+            print(f"⚠️  {basename} is only {source.width}px wide, below the {args.display_width}px display width")
+            continue
+        images = build_image_set(source, [w for w in widths if w <= source.width])
+        resized = time.perf_counter()
+        encoded = encode_image_set(images)
+        done = time.perf_counter()
+        for width, data in encoded.items():
+            save(data, os.path.join(args.output, set_filename(basename, width)))
+
+        # Reference point: encoding just the largest size on its own
+        single_start = time.perf_counter()
+        encode(source)
+        single = time.perf_counter() - single_start
+
+        sizes = ', '.join(f'{w}w' for w in encoded)
+        print(f"✅ {basename}: {sizes}  render {(rendered - start) * 1000:.0f} ms, "
+              f"resize {(resized - rendered) * 1000:.0f} ms, encode {(done - resized) * 1000:.0f} ms "
+              f"(full size alone: {single * 1000:.0f} ms)")
+        height = round(source.height * args.display_width / source.width)
+        markup.append(srcset_markup(basename, encoded, height, title_from_filename(basename),
+                                    prefix, args.display_width))
+
+    print("\n📝 README markup:")
+    for line in markup:
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+In-memory API for the screenshot generators.
+
+Every stage takes and returns PIL images or bytes, so build tools can chain
+them without touching the filesystem; writing a file is a separate, optional
+last step:
+
+    from screenshot_api import render_screen, frame, encode, save
+
+    png = encode(frame(render_screen('home', theme='dark'), profile='flip'))
+    upload(png)                     # or: save(png, 'docs/screenshots/home-dark.png')
+
+Stages:
+  render_screen(name, theme)   screen image, drawn with the theme's colors
+  frame(image, profile)        device frame from device_frames
+  convert_svg(svg)             SVG markup, bytes or path -> image, through pipes
+  encode(image) / decode(data) image <-> PNG (or any PIL format) bytes
+  save(image_or_bytes, path)   the only stage that writes to disk
+
+Usage: python3 screenshot_api.py home --theme dark --profile pixel -o home-dark.png
+"""
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+import argparse
+import io
+import os
+import subprocess
+
+from device_frames import DEFAULT_PROFILE, PROFILES, frame_screen
+from generate_realistic_screenshots import (
+    create_home_screen,
+    create_quick_add_dialog,
+    create_sync_progress,
+)
+from generate_theme_variants import THEMES
+
+SCREENS = {
+    'home': create_home_screen,
+    'quick-add': create_quick_add_dialog,
+    'sync-progress': create_sync_progress,
+}
+
+# SVG converters that read the SVG on stdin and write a PNG to stdout; the
+# piped counterparts of create_png_screenshots.CONVERSION_METHODS
+SVG_PIPE_METHODS = [
+    lambda w, h: ['rsvg-convert', '-w', str(w), '-h', str(h)],
+    lambda w, h: ['inkscape', '--pipe', '--export-type=png', '--export-filename=-',
+                  f'--export-width={w}', f'--export-height={h}'],
+    lambda w, h: ['convert', '-background', 'transparent', '-size', f'{w}x{h}', 'svg:-', 'png:-'],
+    lambda w, h: ['cairosvg', '-', '-W', str(w), '-H', str(h)],
+]
+
+
+def render_screen(name, theme=None):
+    """Render a screen; theme is a THEMES name or a colors dict (None: default colors)"""
+    if name not in SCREENS:
+        raise ValueError(f'unknown screen {name!r} (choose from {", ".join(SCREENS)})')
+    if theme is None:
+        return SCREENS[name]()
+    if isinstance(theme, str):
+        if theme not in THEMES:
+            raise ValueError(f'unknown theme {theme!r} (choose from {", ".join(THEMES)})')
+        theme = THEMES[theme]
+    return SCREENS[name](colors=theme)
+
+
+def frame(image, profile=DEFAULT_PROFILE, scale=1):
+    """Put a screen image into a device frame"""
+    return frame_screen(image, profile, scale)
+
+
+def _svg_bytes(svg):
+    if isinstance(svg, bytes):
+        return svg
+    if isinstance(svg, os.PathLike) or not svg.lstrip().startswith('<'):
+        with open(svg, 'rb') as f:
+            return f.read()
+    return svg.encode('utf-8')
+
+
+def convert_svg(svg, width=320, height=640):
+    """Rasterize SVG markup, bytes or a file path to an image, without temp files"""
+    data = _svg_bytes(svg)
+    try:
+        import cairosvg
+    except ImportError:
+        pass
+    else:
+        return decode(cairosvg.svg2png(bytestring=data, output_width=width, output_height=height))
+
+    for method in SVG_PIPE_METHODS:
+        try:
+            result = subprocess.run(method(width, height), input=data, capture_output=True, timeout=30)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            continue
+        if result.returncode == 0 and result.stdout:
+            return decode(result.stdout)
+    raise RuntimeError('no working SVG conversion tool found (install cairosvg or librsvg)')
+
+
+def encode(image, format='PNG', **params):
+    """Encode an image to bytes (PNG unless told otherwise)"""
+    buffer = io.BytesIO()
+    image.save(buffer, format, **params)
+    return buffer.getvalue()
+
+
+def decode(data):
+    """Decode image bytes into a fully loaded image"""
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def save(data, path):
+    """Write an image (as PNG) or already encoded bytes to path"""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        with open(path, 'wb') as f:
+            f.write(data)
+    else:
+        data.save(path, 'PNG')
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render one screenshot through the in-memory API')
+    parser.add_argument('screen', choices=sorted(SCREENS))
+    parser.add_argument('--theme', choices=sorted(THEMES), help='Color theme (default: the mockup colors)')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default=DEFAULT_PROFILE, help='Device frame')
+    parser.add_argument('--no-frame', action='store_true', help='Skip the device frame')
+    parser.add_argument('-o', '--output', required=True, help='PNG file to write')
+    args = parser.parse_args()
+
+    if not PIL_AVAILABLE:
+        print("❌ PIL not available. Install with: pip install pillow")
+        return
+
+    image = render_screen(args.screen, args.theme)
+    if not args.no_frame:
+        image = frame(image, args.profile)
+    save(encode(image), args.output)
+    print(f"✅ {args.screen} saved as {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Support triage report for an exported EmuSaves Room database.
+
+Reads the synced_files and sync_folders tables (see data/local/entity/Entities.kt)
+from a copy of the app's `emusaves_database` file. The database is opened
+read-only and synced_files is streamed in primary-key order with a single
+cursor, so memory stays bounded however many rows there are; grouping by
+hash and localUri is left to SQLite's on-disk sorter, one pass per key, with
+the totals and the worst entries both taken from that pass.
+
+Reported:
+  * files and bytes per sync folder
+  * size distribution
+  * staleness: files whose latest row has lastModified newer than lastSynced,
+    and how long ago each file was last uploaded
+  * duplicate content by hash
+  * re-upload churn: syncFolder() inserts a new row on every upload, so
+    several rows for one localUri mean the same file was sent again
+
+Usage:
+  python3 scripts/analyze_sync_db.py emusaves_database
+  python3 scripts/analyze_sync_db.py --create-sample sample.db --rows 2000000
+"""
+
+import argparse
+import hashlib
+import heapq
+import os
+import random
+import sqlite3
+import sys
+import time
+
+DAY_MS = 24 * 3600 * 1000
+
+SIZE_BUCKETS = [
+    (4 * 1024, '< 4 KB'),
+    (64 * 1024, '4-64 KB'),
+    (512 * 1024, '64-512 KB'),
+    (4 * 1024 * 1024, '0.5-4 MB'),
+    (32 * 1024 * 1024, '4-32 MB'),
+    (None, '>= 32 MB'),
+]
+
+AGE_BUCKETS = [
+    (1, '< 1 day'),
+    (7, '1-7 days'),
+    (30, '7-30 days'),
+    (None, '>= 30 days'),
+]
+
+# Same tables Room creates for Entities.kt (schema version 1)
+ROOM_SCHEMA = """
+CREATE TABLE IF NOT EXISTS synced_files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    localUri TEXT NOT NULL,
+    relativePath TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    lastModified INTEGER NOT NULL,
+    hash TEXT,
+    lastSynced INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_folders (
+    uri TEXT PRIMARY KEY NOT NULL,
+    name TEXT NOT NULL,
+    lastSyncTimestamp INTEGER NOT NULL
+);
+"""
+
+
+def open_readonly(path):
+    connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    # Keep SQLite's own memory bounded; large GROUP BYs spill to temp files
+    connection.execute('PRAGMA cache_size = -16384')
+    connection.execute('PRAGMA temp_store = FILE')
+    return connection
+
+
+def folder_key(local_uri):
+    """Tree URI a document URI belongs to (content://.../tree/X/document/Y -> .../tree/X)"""
+    tree, separator, _ = local_uri.partition('/document/')
+    return tree if separator else None
+
+
+def bucket_index(value, buckets):
+    for index, (limit, _) in enumerate(buckets):
+        if limit is None or value < limit:
+            return index
+    return len(buckets) - 1
+
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if size < 1024 or unit == 'TB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+
+
+def format_ms(timestamp):
+    if not timestamp:
+        return 'never'
+    return time.strftime('%Y-%m-%d %H:%M', time.gmtime(timestamp / 1000))
+
+
+def keep_top(heap, entry, top):
+    """Add entry to a min-heap that holds the `top` largest entries seen"""
+    if len(heap) < top:
+        heapq.heappush(heap, entry)
+    elif top:
+        heapq.heappushpop(heap, entry)
+
+
+def scan_files(connection, folders, batch_size):
+    """Single streaming pass over synced_files rows (one row per upload)"""
+    per_folder = {uri: {'rows': 0, 'bytes': 0, 'stale': 0, 'last_synced': 0} for uri in folders}
+    unknown = {'rows': 0, 'bytes': 0, 'stale': 0, 'last_synced': 0}
+    sizes = [[0, 0] for _ in SIZE_BUCKETS]
+    totals = {'rows': 0, 'bytes': 0}
+    newest_sync = 0
+
+    cursor = connection.execute(
+        'SELECT localUri, size, lastSynced FROM synced_files ORDER BY id'
+    )
+    while True:
+        batch = cursor.fetchmany(batch_size)
+        if not batch:
+            break
+        for local_uri, size, last_synced in batch:
+            stats = per_folder.get(folder_key(local_uri), unknown)
+            stats['rows'] += 1
+            stats['bytes'] += size
+            if last_synced > stats['last_synced']:
+                stats['last_synced'] = last_synced
+
+            size_bucket = sizes[bucket_index(size, SIZE_BUCKETS)]
+            size_bucket[0] += 1
+            size_bucket[1] += size
+            totals['rows'] += 1
+            totals['bytes'] += size
+            if last_synced > newest_sync:
+                newest_sync = last_synced
+
+    return per_folder, unknown, sizes, totals, newest_sync
+
+
+def scan_latest(connection, per_folder, unknown, newest_sync, args):
+    """One GROUP BY localUri pass: staleness of each file's latest row, and re-upload churn
+
+    syncFolder() inserts a row per upload, so the row with the highest id is
+    the file as it stands; older rows are history and are not stale.
+    """
+    staleness = {'files': 0, 'stale': 0, 'stale_bytes': 0, 'never_synced': 0}
+    ages = [0] * len(AGE_BUCKETS)
+    churn = {'files': 0, 'reuploads': 0, 'wasted': 0, 'unchanged': 0}
+    worst = []
+    newest_day = newest_sync // DAY_MS
+
+    # With a single max() aggregate, SQLite takes the bare columns from the row holding MAX(id)
+    cursor = connection.execute("""
+        SELECT MAX(id), localUri, relativePath, size, lastModified, lastSynced,
+               COUNT(*), SUM(size), COUNT(DISTINCT lastModified)
+        FROM synced_files GROUP BY localUri
+    """)
+    while True:
+        batch = cursor.fetchmany(args.batch_size)
+        if not batch:
+            break
+        for _, local_uri, relative_path, size, last_modified, last_synced, uploads, sent, versions in batch:
+            staleness['files'] += 1
+            if last_synced == 0:
+                staleness['never_synced'] += 1
+            else:
+                ages[bucket_index(newest_day - last_synced // DAY_MS, AGE_BUCKETS)] += 1
+                if last_modified > last_synced:
+                    per_folder.get(folder_key(local_uri), unknown)['stale'] += 1
+                    staleness['stale'] += 1
+                    staleness['stale_bytes'] += size
+            if uploads > 1:
+                churn['files'] += 1
+                churn['reuploads'] += uploads - 1
+                churn['wasted'] += sent - size
+                churn['unchanged'] += uploads - versions
+                keep_top(worst, (uploads, relative_path, sent, versions), args.top)
+
+    worst = [(path, uploads, sent, versions) for uploads, path, sent, versions in sorted(worst, reverse=True)]
+    return staleness, ages, churn, worst
+
+
+def duplicate_report(connection, args):
+    """Content stored under more than one localUri, from one GROUP BY hash pass"""
+    hashed = groups = extra_copies = wasted = 0
+    worst = []
+    cursor = connection.execute("""
+        SELECT hash, COUNT(*), COUNT(DISTINCT localUri), MAX(size), MIN(relativePath)
+        FROM synced_files WHERE hash IS NOT NULL GROUP BY hash
+    """)
+    while True:
+        batch = cursor.fetchmany(args.batch_size)
+        if not batch:
+            break
+        for digest, rows, uris, size, sample in batch:
+            hashed += rows
+            if uris > 1:
+                groups += 1
+                extra_copies += uris - 1
+                wasted += (uris - 1) * size
+                keep_top(worst, ((uris - 1) * size, digest, uris, size, sample), args.top)
+
+    worst = [entry[1:] for entry in sorted(worst, reverse=True)]
+    return hashed, (groups, extra_copies, wasted), worst
+
+
+def print_report(path, connection, args):
+    start = time.perf_counter()
+    folders = dict(connection.execute('SELECT uri, name FROM sync_folders'))
+    folder_sync = dict(connection.execute('SELECT uri, lastSyncTimestamp FROM sync_folders'))
+    per_folder, unknown, sizes, totals, newest_sync = scan_files(connection, folders, args.batch_size)
+    staleness, ages, churn, worst_churn = scan_latest(connection, per_folder, unknown, newest_sync, args)
+
+    print(f"🗄️  {path}: {totals['rows']} synced_files rows, {len(folders)} sync folders, "
+          f"{format_size(totals['bytes'])}")
+    print(f"   {staleness['files']} distinct files; newest upload {format_ms(newest_sync)} "
+          f"(ages below are relative to it)")
+
+    print("\n📁 Per folder                     rows      size   stale  last upload        folder lastSync")
+    for uri, name in sorted(folders.items(), key=lambda item: -per_folder[item[0]]['rows']):
+        stats = per_folder[uri]
+        print(f"   {name[:28]:<28} {stats['rows']:>7} {format_size(stats['bytes']):>9} {stats['stale']:>7}  "
+              f"{format_ms(stats['last_synced']):<17}  {format_ms(folder_sync[uri])}")
+    if unknown['rows']:
+        print(f"   {'(no matching folder)':<28} {unknown['rows']:>7} {format_size(unknown['bytes']):>9} "
+              f"{unknown['stale']:>7}  {format_ms(unknown['last_synced'])}")
+
+    print("\n📏 Size distribution")
+    for (_, label), (count, size) in zip(SIZE_BUCKETS, sizes):
+        share = count / totals['rows'] * 100 if totals['rows'] else 0
+        print(f"   {label:<10} {count:>9} rows {share:5.1f}%  {format_size(size):>10}")
+
+    print("\n⏳ Staleness (latest row per file)")
+    print(f"   Modified after last upload: {staleness['stale']} files ({format_size(staleness['stale_bytes'])})")
+    print(f"   Never synced (lastSynced = 0): {staleness['never_synced']} files")
+    for (_, label), count in zip(AGE_BUCKETS, ages):
+        print(f"   Last uploaded {label:<11} before newest: {count:>9}")
+
+    hashed, (groups, extra_copies, wasted), worst = duplicate_report(connection, args)
+    print("\n🧬 Duplicate content by hash")
+    if hashed == 0:
+        print("   No rows carry a hash (the app does not fill it yet)")
+    else:
+        print(f"   {groups} hashes stored under several files, {extra_copies} extra copies, "
+              f"{format_size(wasted)} redundant")
+        for digest, uris, size, sample in worst:
+            print(f"   {digest[:16]:<16} x{uris:<4} {format_size(size):>9}  e.g. {sample}")
+
+    print("\n🔁 Re-upload churn")
+    print(f"   {churn['files']} files uploaded more than once: {churn['reuploads']} repeat uploads, "
+          f"{format_size(churn['wasted'])} sent again")
+    print(f"   {churn['unchanged']} uploads repeated an unchanged file (same lastModified)")
+    for relative_path, count, size, versions in worst_churn:
+        print(f"   x{count:<5} {versions:>4} versions {format_size(size):>10}  {relative_path}")
+
+    print(f"\n⏱️  Report built in {time.perf_counter() - start:.2f}s")
+
+
+def create_sample(path, rows, seed=1):
+    """Write a synthetic database with the Room schema for trying the report"""
+    if os.path.exists(path):
+        os.unlink(path)
+    rng = random.Random(seed)
+    connection = sqlite3.connect(path)
+    connection.executescript(ROOM_SCHEMA)
+    base = 'content://com.android.externalstorage.documents/tree/primary%3A'
+    folders = ['RetroArch%2Fsaves', 'RetroArch%2Fstates', 'PSP%2FSAVEDATA', 'DraStic%2Fbackup']
+    now = 1_760_000_000_000
+    connection.executemany(
+        'INSERT INTO sync_folders VALUES (?, ?, ?)',
+        [(base + folder, folder.replace('%2F', ' '), now) for folder in folders],
+    )
+
+    files = max(1, rows // 8)
+
+    def generate():
+        for _ in range(rows):
+            # A few files are uploaded far more often than the rest
+            index = int(files * rng.random() ** 3)
+            folder = folders[index % len(folders)]
+            is_state = 'states' in folder
+            size = int(rng.lognormvariate(15 if is_state else 10, 1))
+            modified = now - (index % 90) * DAY_MS
+            synced = modified + rng.randint(-3, 30) * DAY_MS if rng.random() > 0.01 else 0
+            # Roughly half the rows carry a hash; some files share content
+            content = (index * 2654435761) % (files // 2 + 1)
+            digest = hashlib.sha256(str(content).encode()).hexdigest() if rng.random() < 0.5 else None
+            name = f'game_{index}.{"state" if is_state else "srm"}'
+            yield (f'{base}{folder}/document/primary%3A{folder}%2F{name}', name, size, modified, digest, synced)
+
+    connection.executemany(
+        'INSERT INTO synced_files (localUri, relativePath, size, lastModified, hash, lastSynced) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        generate(),
+    )
+    connection.commit()
+    connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyse an exported EmuSaves database')
+    parser.add_argument('database', nargs='?', help='Copy of emusaves_database')
+    parser.add_argument('--top', type=int, default=5, help='Rows shown in the duplicate and churn lists')
+    parser.add_argument('--batch-size', type=int, default=10000, help='Rows fetched per cursor batch')
+    parser.add_argument('--create-sample', metavar='PATH', help='Write a synthetic database and exit')
+    parser.add_argument('--rows', type=int, default=100000, help='synced_files rows for --create-sample')
+    args = parser.parse_args()
+
+    if args.create_sample:
+        create_sample(args.create_sample, args.rows)
+        print(f"✅ Created {args.create_sample} with {args.rows} synced_files rows")
+        return
+    if not args.database:
+        parser.error('pass a database file or --create-sample')
+    if not os.path.exists(args.database):
+        print(f"❌ Database not found: {args.database}")
+        sys.exit(1)
+
+    connection = open_readonly(args.database)
+    try:
+        print_report(args.database, connection, args)
+    finally:
+        connection.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Compression codec study for emulator save files.
+
+EmusavesRepository.uploadFile() sends saves uncompressed. This tool runs every
+standard-library compressor (zlib, bz2, lzma) at a range of levels over a save
+corpus, grouped by emulator (first directory under the corpus root) and file
+extension, and reports ratio, compression/decompression throughput and peak
+memory per group. Work is spread over a process pool, one task per
+group/codec/level.
+
+For each link speed the summary picks the codec and level with the lowest
+estimated sync time: compression time (scaled by --cpu-factor to approximate
+a phone) plus transfer of the compressed bytes.
+
+Usage: python3 scripts/compression_study.py ~/save-corpus --link-mbps 5 20 100
+"""
+
+import argparse
+import bz2
+import lzma
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Same extension rule as EmusavesRepository.isSaveFile()
+SAVE_EXTENSIONS = ('srm', 'state', 'sav', 'bsv')
+
+CODECS = {
+    'zlib': (lambda data, level: zlib.compress(data, level), zlib.decompress),
+    'bz2': (lambda data, level: bz2.compress(data, level), bz2.decompress),
+    'lzma': (lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+
+DEFAULT_LEVELS = {
+    'zlib': (1, 3, 6, 9),
+    'bz2': (1, 5, 9),
+    'lzma': (0, 2, 6, 9),
+}
+
+FULL_LEVELS = {
+    'zlib': tuple(range(1, 10)),
+    'bz2': tuple(range(1, 10)),
+    'lzma': tuple(range(0, 10)),
+}
+
+
+def is_save_file(name):
+    return any(name.lower().endswith(f'.{ext}') for ext in SAVE_EXTENSIONS)
+
+
+def collect_groups(root, all_files=False):
+    """Map (emulator, extension) to the list of file paths in the corpus"""
+    groups = {}
+    for dirpath, _, filenames in os.walk(root):
+        relative = os.path.relpath(dirpath, root)
+        emulator = '(root)' if relative == '.' else relative.split(os.sep)[0]
+        for name in filenames:
+            if not all_files and not is_save_file(name):
+                continue
+            extension = os.path.splitext(name)[1].lower().lstrip('.') or '(none)'
+            groups.setdefault((emulator, extension), []).append(os.path.join(dirpath, name))
+    return groups
+
+
+def measure(group, codec, level, paths):
+    """Compress and decompress every file of a group; runs in a pool worker"""
+    compress, decompress = CODECS[codec]
+    raw = packed = 0
+    compress_seconds = decompress_seconds = 0.0
+    largest = None
+
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        start = time.perf_counter()
+        compressed = compress(data, level)
+        compress_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        restored = decompress(compressed)
+        decompress_seconds += time.perf_counter() - start
+
+        if restored != data:
+            raise ValueError(f'{codec} level {level} did not round-trip {path}')
+        raw += len(data)
+        packed += len(compressed)
+        if largest is None or len(data) > largest[0]:
+            largest = (len(data), path)
+        del data, compressed, restored
+
+    return {
+        'group': group,
+        'codec': codec,
+        'level': level,
+        'files': len(paths),
+        'raw': raw,
+        'packed': packed,
+        'compress_seconds': compress_seconds,
+        'decompress_seconds': decompress_seconds,
+        'peak': peak_memory(codec, level, largest[1]),
+    }
+
+
+def peak_memory(codec, level, path):
+    """Memory a round trip of one file needs on top of its input buffer
+
+    Measured separately because tracing allocations skews the timings. The
+    codecs allocate through PyMem_RawMalloc, so tracemalloc sees their state.
+    """
+    compress, decompress = CODECS[codec]
+    with open(path, 'rb') as f:
+        data = f.read()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    decompress(compress(data, level))
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return peak
+
+
+def sync_seconds(result, link_mbps, cpu_factor):
+    """Estimated time to compress on the device and send the result"""
+    return result['compress_seconds'] * cpu_factor + result['packed'] * 8 / (link_mbps * 1e6)
+
+
+def throughput(size, seconds):
+    return size / seconds / 1e6 if seconds > 0 else float('inf')
+
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+
+
+def create_synthetic_corpus(root, seed=1):
+    """Write a small sample corpus: sparse SRAM saves and noisier save states"""
+    rng = random.Random(seed)
+    layout = [
+        ('RetroArch', 'srm', 24, 8 * 1024, 0.05),
+        ('RetroArch', 'state', 12, 2 * 1024 * 1024, 0.6),
+        ('PPSSPP', 'sav', 8, 512 * 1024, 0.3),
+        ('DraStic', 'sav', 10, 512 * 1024, 0.02),
+    ]
+    for emulator, extension, count, size, density in layout:
+        folder = os.path.join(root, emulator)
+        os.makedirs(folder, exist_ok=True)
+        for i in range(count):
+            data = bytearray(size)
+            # Runs of random bytes with density controlling how much is non-zero
+            position = 0
+            while position < size:
+                run = rng.randint(16, 4096)
+                if rng.random() < density:
+                    data[position:position + run] = rng.randbytes(min(run, size - position))
+                position += run
+            with open(os.path.join(folder, f'game_{i:03d}.{extension}'), 'wb') as f:
+                f.write(bytes(data))
+
+
+def print_report(results, link_speeds, cpu_factor):
+    by_group = {}
+    for result in results:
+        by_group.setdefault(result['group'], []).append(result)
+
+    for group in sorted(by_group):
+        rows = sorted(by_group[group], key=lambda r: (r['codec'], r['level']))
+        first = rows[0]
+        print(f"\n📁 {group[0]} .{group[1]}: {first['files']} files, {format_size(first['raw'])}")
+        print(f"   {'codec':<6} {'lvl':>3} {'ratio':>7} {'comp MB/s':>10} {'decomp MB/s':>12} {'peak mem':>10}")
+        for r in rows:
+            ratio = r['raw'] / r['packed'] if r['packed'] else float('inf')
+            print(f"   {r['codec']:<6} {r['level']:>3} {ratio:>7.2f} "
+                  f"{throughput(r['raw'], r['compress_seconds']):>10.1f} "
+                  f"{throughput(r['raw'], r['decompress_seconds']):>12.1f} "
+                  f"{format_size(r['peak']):>10}")
+
+    print(f"\n🏁 Fastest total sync per link speed (compression time x{cpu_factor:g} for device CPU)")
+    header = ''.join(f'{f"{speed:g} Mbit/s":>22}' for speed in link_speeds)
+    print(f"   {'group':<24}{header}")
+    for group in sorted(by_group):
+        cells = []
+        raw = by_group[group][0]['raw']
+        for speed in link_speeds:
+            uncompressed = raw * 8 / (speed * 1e6)
+            best = min(by_group[group], key=lambda r: sync_seconds(r, speed, cpu_factor))
+            best_time = sync_seconds(best, speed, cpu_factor)
+            if best_time < uncompressed:
+                cells.append(f"{best['codec']}-{best['level']} {best_time:.2f}s")
+            else:
+                cells.append(f"none {uncompressed:.2f}s")
+        label = f'{group[0]} .{group[1]}'
+        print(f"   {label:<24}" + ''.join(f'{cell:>22}' for cell in cells))
+
+    # One setting for the whole corpus, since the app would ship a single codec
+    print("\n💡 Best single setting for the whole corpus:")
+    for speed in link_speeds:
+        settings = {}
+        for result in results:
+            key = (result['codec'], result['level'])
+            settings[key] = settings.get(key, 0.0) + sync_seconds(result, speed, cpu_factor)
+        raw_total = sum(rows[0]['raw'] for rows in by_group.values())
+        baseline = raw_total * 8 / (speed * 1e6)
+        (codec, level), best_time = min(settings.items(), key=lambda item: item[1])
+        if best_time < baseline:
+            print(f"   {speed:g} Mbit/s: {codec} level {level} "
+                  f"({best_time:.1f}s vs {baseline:.1f}s uncompressed)")
+        else:
+            print(f"   {speed:g} Mbit/s: no compression ({baseline:.1f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare stdlib compressors on emulator saves')
+    parser.add_argument('corpus', nargs='?', help='Directory of saves, one sub-folder per emulator')
+    parser.add_argument('--synthetic', action='store_true', help='Run on a generated sample corpus')
+    parser.add_argument('--all-files', action='store_true', help='Include files isSaveFile() would skip')
+    parser.add_argument('--full', action='store_true', help='Try every level of every codec')
+    parser.add_argument('--codecs', nargs='+', choices=sorted(CODECS), default=sorted(CODECS))
+    parser.add_argument('--link-mbps', nargs='+', type=float, default=[5, 20, 100],
+                        help='Upload link speeds to optimise for')
+    parser.add_argument('--cpu-factor', type=float, default=4,
+                        help='How much slower the phone compresses than this machine')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Process pool size')
+    args = parser.parse_args()
+
+    print("🗜️  EmuSaves compression study")
+
+    if args.synthetic:
+        temp = tempfile.TemporaryDirectory()
+        root = temp.name
+        create_synthetic_corpus(root)
+    elif args.corpus:
+        root = args.corpus
+    else:
+        parser.error('pass a corpus directory or --synthetic')
+
+    groups = collect_groups(root, args.all_files)
+    if not groups:
+        print(f"❌ No save files found in {root}")
+        sys.exit(1)
+    print(f"📂 {sum(len(p) for p in groups.values())} files in {len(groups)} groups")
+
+    levels = FULL_LEVELS if args.full else DEFAULT_LEVELS
+    tasks = [
+        (group, codec, level, paths)
+        for group, paths in groups.items()
+        for codec in args.codecs
+        for level in levels[codec]
+    ]
+    # Largest groups first so the pool does not finish on one long task
+    sizes = {group: sum(os.path.getsize(p) for p in paths) for group, paths in groups.items()}
+    tasks.sort(key=lambda task: sizes[task[0]], reverse=True)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(measure, *task) for task in tasks]
+        results = [future.result() for future in futures]
+    print(f"⏱️  {len(tasks)} runs in {time.perf_counter() - start:.1f}s on {args.workers} workers")
+
+    print_report(results, args.link_mbps, args.cpu_factor)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Discover where emulators keep save files in a device filesystem dump.
+
+Takes either a directory produced by `adb pull /storage/emulated/0` or a tar
+archive of it (read in place, nothing is extracted). An archive with a single
+leading folder (`tar czf pixel7.tar.gz pixel7/`, or adb's `0/`) is re-rooted
+at that folder; --root names the folder explicitly. Save files are matched
+with the extension list of EmusavesRepository.isSaveFile(), and the known
+locations from EmulatorLocations.DEFAULT_LOCATIONS are checked first. Both
+are read from the Kotlin sources so this tool stays in step with the app.
+
+Directory dumps are walked with os.scandir on a thread pool, one directory
+per task. The known locations are queued before the root, and media/cache
+subtrees that never hold saves are pruned before they are entered unless
+they are (or lie under) a known location.
+
+Usage:
+  python3 scripts/discover_save_locations.py ~/dumps/pixel7
+  python3 scripts/discover_save_locations.py ~/dumps/pixel7.tar.gz --json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_ROOT = os.path.join(REPO_ROOT, 'app', 'src', 'main', 'java', 'com', 'emusaves')
+LOCATIONS_SOURCE = os.path.join(SOURCE_ROOT, 'domain', 'model', 'EmulatorLocation.kt')
+REPOSITORY_SOURCE = os.path.join(SOURCE_ROOT, 'domain', 'repository', 'EmusavesRepository.kt')
+
+DEVICE_ROOT = '/storage/emulated/0'
+
+# Shared-storage folders that hold media, caches or app bundles but no saves.
+# Matched against the path relative to the device root, or any directory name.
+PRUNED_PATHS = {
+    'DCIM', 'Pictures', 'Movies', 'Music', 'Podcasts', 'Ringtones', 'Alarms',
+    'Notifications', 'Audiobooks', 'Recordings', 'Android/obb', 'Android/media',
+}
+PRUNED_NAMES = {'.thumbnails', '.cache', 'cache', 'code_cache', '.git', 'node_modules', '.trash'}
+
+# Folders found directly in shared storage; an archive whose only top-level
+# entry is one of these is already rooted at the device root
+DEVICE_FOLDERS = {'Android', 'Download', 'Documents'} | {path.split('/')[0] for path in PRUNED_PATHS}
+
+
+def load_default_locations(path=LOCATIONS_SOURCE):
+    """Parse (name, emulator, path) for every EmulatorLocation in DEFAULT_LOCATIONS"""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    locations = []
+    for block in re.findall(r'EmulatorLocation\((.*?)\n\s*\)', source, re.S):
+        fields = dict(re.findall(r'(\w+)\s*=\s*"([^"]*)"', block))
+        if 'path' in fields:
+            locations.append((fields['name'], fields['emulator'], fields['path'].rstrip('/')))
+    return locations
+
+
+def load_save_extensions(path=REPOSITORY_SOURCE):
+    """Parse the extension list of EmusavesRepository.isSaveFile()"""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    body = re.search(r'fun isSaveFile\(.*?listOf\((.*?)\)', source, re.S).group(1)
+    body = re.sub(r'//[^\n]*', '', body)
+    return tuple(re.findall(r'"([^"]+)"', body))
+
+
+def relative_to_device(path):
+    """Strip the device root (or its /sdcard alias) from an absolute device path"""
+    for prefix in (DEVICE_ROOT, '/sdcard'):
+        if path == prefix:
+            return ''
+        if path.startswith(prefix + '/'):
+            return path[len(prefix) + 1:]
+    return path.lstrip('/')
+
+
+def is_pruned(relative, name):
+    return name in PRUNED_NAMES or relative in PRUNED_PATHS
+
+
+def under_seed(relative, seeds):
+    return any(relative == seed or relative.startswith(seed + '/') for seed in seeds)
+
+
+class Matcher:
+    def __init__(self, extensions):
+        self.suffixes = tuple(f'.{ext}' for ext in extensions)
+
+    def is_save_file(self, name):
+        return name.lower().endswith(self.suffixes)
+
+
+def scan_directory(root, relative, matcher, seeds=()):
+    """Scan one directory: return (save file count, total size, subdirectories)"""
+    count = size = 0
+    subdirs = []
+    try:
+        with os.scandir(os.path.join(root, relative) if relative else root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        child = f'{relative}/{entry.name}' if relative else entry.name
+                        if not is_pruned(child, entry.name) or under_seed(child, seeds):
+                            subdirs.append(child)
+                    elif matcher.is_save_file(entry.name):
+                        count += 1
+                        size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return count, size, subdirs
+
+
+def walk_directory(root, matcher, workers, seeds=()):
+    """Breadth-first parallel walk; returns ({dir: [count, size]}, directories scanned)
+
+    The seed directories that exist in the dump are submitted before the
+    root, so they report first; the walk does not enter them a second time.
+    """
+    found = {}
+    scanned = 0
+    queued = [seed for seed in seeds if seed and os.path.isdir(os.path.join(root, seed))]
+    submitted = set(queued) | {''}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        for relative in queued + ['']:
+            pending[pool.submit(scan_directory, root, relative, matcher, seeds)] = relative
+        while pending:
+            # Oldest first: the pool stays busy with everything queued behind it
+            future = next(iter(pending))
+            relative = pending.pop(future)
+            count, size, subdirs = future.result()
+            scanned += 1
+            if count:
+                found[relative] = [count, size]
+            for child in subdirs:
+                if child not in submitted:
+                    submitted.add(child)
+                    pending[pool.submit(scan_directory, root, child, matcher, seeds)] = child
+    return found, scanned
+
+
+def clean_member(name):
+    while name.startswith('./'):
+        name = name[2:]
+    return name.lstrip('/')
+
+
+def normalize_member(name):
+    """Map a tar member name onto a path relative to the device root
+
+    Returns (path, rooted): rooted is False when the name contains no device
+    root marker and was only cleaned up.
+    """
+    name = clean_member(name)
+    for marker in ('storage/emulated/0/', 'sdcard/'):
+        index = name.find(marker)
+        if index != -1 and (index == 0 or name[index - 1] == '/'):
+            return name[index + len(marker):], True
+    return name, False
+
+
+def archive_root(top_level, seeds=()):
+    """The single leading folder of an archive made from outside the dump
+    (tar czf pixel7.tar.gz pixel7/, or the 0/ folder adb pull creates), else ''"""
+    top_level = top_level - {'', '.'}
+    if len(top_level) != 1:
+        return ''
+    folder = next(iter(top_level))
+    known = DEVICE_FOLDERS | {seed.split('/')[0] for seed in seeds}
+    return '' if folder in known else folder
+
+
+def walk_tar(path, matcher, seeds=(), root=None):
+    """Stream the archive's member headers; returns ({dir: [count, size]}, members read)
+
+    root is the folder inside the archive that holds the device root; by
+    default a single leading folder is detected and stripped.
+    """
+    saves = []
+    top_level = set()
+    rooted = False
+    members = 0
+    with tarfile.open(path, 'r|*') as archive:
+        for member in archive:
+            members += 1
+            relative, marked = normalize_member(member.name)
+            rooted = rooted or marked
+            if not marked:
+                top_level.add(relative.split('/', 1)[0])
+            if member.isfile() and matcher.is_save_file(relative.rpartition('/')[2]):
+                saves.append((relative, marked, member.size))
+
+    if root is None:
+        root = '' if rooted else archive_root(top_level, seeds)
+    root = clean_member(root).strip('/')
+
+    found = {}
+    for relative, marked, size in saves:
+        if root and not marked:
+            if not relative.startswith(root + '/'):
+                continue
+            relative = relative[len(root) + 1:]
+        directory = relative.rpartition('/')[0]
+        parts = directory.split('/') if directory else []
+        if any(is_pruned('/'.join(parts[:i + 1]), part) for i, part in enumerate(parts)) \
+                and not under_seed(directory, seeds):
+            continue
+        entry = found.setdefault(directory, [0, 0])
+        entry[0] += 1
+        entry[1] += size
+    return found, members
+
+
+def attribute(directory, locations):
+    """Return the DEFAULT_LOCATIONS entry a directory lives under, if any"""
+    best = None
+    for location in locations:
+        seed = relative_to_device(location[2])
+        if directory == seed or directory.startswith(seed + '/'):
+            if best is None or len(seed) > len(relative_to_device(best[2])):
+                best = location
+    return best
+
+
+def is_tar_archive(path):
+    """tarfile.is_tarfile() that answers False for missing or unreadable paths"""
+    try:
+        return os.path.isfile(path) and tarfile.is_tarfile(path)
+    except OSError:
+        return False
+
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find emulator save folders in a device dump')
+    parser.add_argument('dump', help='Directory pulled from /storage/emulated/0, or a tar archive of it')
+    parser.add_argument('--workers', type=int, default=32, help='Threads scanning directories')
+    parser.add_argument('--min-files', type=int, default=1, help='Hide folders with fewer save files')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable output')
+    parser.add_argument('--root', help='Folder inside the dump that holds the device root '
+                                       '(default: the dump itself, or a tar archive\'s single leading folder)')
+    args = parser.parse_args()
+
+    locations = load_default_locations()
+    matcher = Matcher(load_save_extensions())
+    seed_dirs = [relative_to_device(path) for _, _, path in locations]
+
+    start = time.perf_counter()
+    if os.path.isdir(args.dump):
+        found, scanned = walk_directory(os.path.join(args.dump, args.root or ''), matcher, args.workers, seed_dirs)
+        unit = 'directories'
+    elif is_tar_archive(args.dump):
+        found, scanned = walk_tar(args.dump, matcher, seed_dirs, args.root)
+        unit = 'archive members'
+    else:
+        print(f"❌ {args.dump} is neither a directory nor a tar archive")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    candidates = []
+    for directory, (count, size) in found.items():
+        if count < args.min_files:
+            continue
+        location = attribute(directory, locations)
+        candidates.append({
+            'path': f'{DEVICE_ROOT}/{directory}' if directory else DEVICE_ROOT,
+            'files': count,
+            'bytes': size,
+            'known_location': location[0] if location else None,
+            'emulator': location[1] if location else None,
+        })
+    candidates.sort(key=lambda c: (c['known_location'] is not None, -c['files']))
+
+    seeds = []
+    for name, emulator, path in locations:
+        seed = relative_to_device(path)
+        files = sum(count for d, (count, _) in found.items() if d == seed or d.startswith(seed + '/'))
+        seeds.append({'name': name, 'emulator': emulator, 'path': path, 'files': files})
+
+    if args.json:
+        json.dump({'scanned': scanned, 'seconds': elapsed, 'seeds': seeds, 'candidates': candidates},
+                  sys.stdout, indent=2)
+        print()
+        return
+
+    print(f"🔍 Scanned {scanned} {unit} in {elapsed:.2f}s")
+
+    print("\n📌 Known locations (EmulatorLocations.DEFAULT_LOCATIONS):")
+    for seed in seeds:
+        mark = '✅' if seed['files'] else '  '
+        print(f"   {mark} {seed['name']:<22} {seed['files']:>6} files  {seed['path']}")
+
+    unknown = [c for c in candidates if c['known_location'] is None]
+    print(f"\n🆕 Folders with saves outside known locations: {len(unknown)}")
+    for c in unknown:
+        print(f"   {c['files']:>6} files {format_size(c['bytes']):>10}  {c['path']}")
+
+    known = [c for c in candidates if c['known_location'] is not None]
+    print(f"\n📂 Folders under known locations: {len(known)}")
+    for c in known:
+        print(f"   {c['files']:>6} files {format_size(c['bytes']):>10}  {c['path']}  ({c['known_location']})")
+
+
+if __name__ == '__main__':
+    main()
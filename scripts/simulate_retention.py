@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Replay save-corpus history against NAS retention policies.
+
+EmusavesRepository.uploadFile() writes every file to
+/Drive/EmulatorBackups/<folder>/<relativePath>, so each sync overwrites the
+previous copy. This simulates what versioned history would cost instead. A
+synthetic corpus (one SRAM save plus a few save-state slots per game) is
+snapshotted every sync period; games are picked Zipf-style, so a few get most
+of the play time. Each snapshot is replayed under every policy:
+
+  overwrite    today's behaviour, one copy per file
+  last-N       keep the N newest versions of each file
+  buckets      newest version per hour / day / week for the configured spans
+  dedup        the buckets schedule, stored as content chunks plus manifests,
+               uploading only chunks the NAS does not have yet
+
+Per policy it reports stored bytes over time, write amplification (bytes
+written on the NAS per byte of save data that actually changed) and the
+FileStation list/delete traffic retention needs. Files are modelled as lists
+of fixed-size chunk ids, so no file contents are generated.
+
+Usage: python3 scripts/simulate_retention.py --games 800 --days 120
+"""
+
+import argparse
+import math
+import random
+import time
+
+HOUR = 3600
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+# FileStation list calls return at most this many entries per request
+LIST_PAGE = 1000
+# Manifest bytes per chunk reference (SHA-256 + length)
+MANIFEST_ENTRY = 40
+# Chunk id shared by every all-zero chunk (padding in save states)
+ZERO_CHUNK = 0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Compare NAS retention policies for save backups')
+    parser.add_argument('--games', type=int, default=600, help='Games in the corpus')
+    parser.add_argument('--days', type=int, default=90, help='Simulated days of history')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+
+    corpus = parser.add_argument_group('Corpus')
+    corpus.add_argument('--states-per-game', type=int, default=3, help='Save-state slots per game')
+    corpus.add_argument('--sram-kb', type=float, default=32, help='Median SRAM save size')
+    corpus.add_argument('--state-mb', type=float, default=2, help='Median save state size')
+    corpus.add_argument('--zero-share', type=float, default=0.15, help='Share of state chunks that are all zeros')
+
+    activity = parser.add_argument_group('Activity')
+    activity.add_argument('--sync-hours', type=float, default=6, help='Time between snapshots (SyncWorker period)')
+    activity.add_argument('--games-per-sync', type=float, default=1.5, help='Mean games played between syncs')
+    activity.add_argument('--zipf', type=float, default=1.1, help='Skew of game popularity')
+    activity.add_argument('--state-saves', type=float, default=1.2, help='Mean state slots written per session')
+    activity.add_argument('--state-dirty', type=float, default=0.4, help='Share of a state\'s chunks a save rewrites')
+
+    policy = parser.add_argument_group('Policies')
+    policy.add_argument('--keep-last', type=int, default=10, help='N for the last-N policy')
+    policy.add_argument('--hourly', type=int, default=24, help='Hours of hourly versions')
+    policy.add_argument('--daily', type=int, default=7, help='Days of daily versions')
+    policy.add_argument('--weekly', type=int, default=8, help='Weeks of weekly versions')
+    policy.add_argument('--prune-hours', type=float, default=24, help='Interval of the pruning job (buckets, dedup)')
+    policy.add_argument('--chunk-kb', type=int, default=64, help='Dedup chunk size')
+    args = parser.parse_args()
+
+    for name in ('games', 'days', 'sync_hours', 'prune_hours', 'chunk_kb'):
+        if getattr(args, name) <= 0:
+            parser.error(f"--{name.replace('_', '-')} must be positive")
+    return args
+
+
+class Corpus:
+    """Current content of every file as a tuple of chunk ids"""
+
+    def __init__(self, args, rng):
+        self.rng = rng
+        self.chunk_size = args.chunk_kb * 1024
+        self.zero_share = args.zero_share
+        self.next_chunk = ZERO_CHUNK + 1
+        self.chunk_bytes = {ZERO_CHUNK: self.chunk_size}
+        self.sizes = []
+        self.chunks = []
+        self.games = []
+
+        for _ in range(args.games):
+            sram = self._add_file(self._lognormal(args.sram_kb * 1024, 0.8, 2 * 1024, 512 * 1024), False)
+            states = [self._add_file(self._lognormal(args.state_mb * 1024 * 1024, 0.7, 256 * 1024, 32 * 1024 * 1024), True)
+                      for _ in range(args.states_per_game)]
+            self.games.append((sram, states))
+
+    def _lognormal(self, median, sigma, low, high):
+        return int(min(high, max(low, median * math.exp(self.rng.gauss(0, sigma)))))
+
+    def _new_chunk(self, size, may_be_zero):
+        if may_be_zero and size == self.chunk_size and self.rng.random() < self.zero_share:
+            return ZERO_CHUNK
+        chunk = self.next_chunk
+        self.next_chunk += 1
+        self.chunk_bytes[chunk] = size
+        return chunk
+
+    def _chunk_sizes(self, size):
+        full, tail = divmod(size, self.chunk_size)
+        return [self.chunk_size] * full + ([tail] if tail else [])
+
+    def _add_file(self, size, is_state):
+        self.sizes.append(size)
+        self.chunks.append(tuple(self._new_chunk(s, is_state) for s in self._chunk_sizes(size)))
+        return len(self.sizes) - 1
+
+    def modify(self, index, dirty_share):
+        """Rewrite a share of a file's chunks; returns the bytes that changed"""
+        old = self.chunks[index]
+        if len(old) == 1:
+            dirty_share = 1.0
+        new = []
+        changed = 0
+        for chunk in old:
+            if self.rng.random() < dirty_share:
+                size = self.chunk_bytes[chunk]
+                chunk = self._new_chunk(size, True)
+                changed += size
+            new.append(chunk)
+        self.chunks[index] = tuple(new)
+        return changed
+
+
+class Policy:
+    """Versions per file plus the NAS-side cost counters"""
+
+    name = ''
+
+    def __init__(self):
+        self.versions = {}
+        self.stored = 0
+        self.written = 0
+        self.list_requests = 0
+        self.list_entries = 0
+        self.deletes = 0
+
+    def list_directory(self, entries):
+        self.list_requests += max(1, math.ceil(entries / LIST_PAGE))
+        self.list_entries += entries
+
+    def store(self, t, index, size, chunks, chunk_bytes):
+        self.versions.setdefault(index, []).append((t, size, chunks))
+        self.stored += size
+        self.written += size
+
+    def drop(self, version, chunk_bytes):
+        self.stored -= version[1]
+        self.deletes += 1
+
+    def upload(self, t, index, size, chunks, chunk_bytes):
+        self.store(t, index, size, chunks, chunk_bytes)
+
+    def prune(self, t, chunk_bytes):
+        pass
+
+    def version_count(self):
+        return sum(len(v) for v in self.versions.values())
+
+
+class Overwrite(Policy):
+    name = 'overwrite'
+
+    def upload(self, t, index, size, chunks, chunk_bytes):
+        previous = self.versions.get(index)
+        if previous:
+            self.stored -= previous[0][1]
+        self.versions[index] = [(t, size, None)]
+        self.stored += size
+        self.written += size
+
+
+class KeepLast(Policy):
+    def __init__(self, count):
+        super().__init__()
+        self.count = count
+        self.name = f'last-{count}'
+
+    def upload(self, t, index, size, chunks, chunk_bytes):
+        self.store(t, index, size, None, chunk_bytes)
+        versions = self.versions[index]
+        if len(versions) > self.count:
+            # Find the oldest versions by listing the file's version folder
+            self.list_directory(len(versions))
+            while len(versions) > self.count:
+                self.drop(versions.pop(0), chunk_bytes)
+
+
+class Buckets(Policy):
+    """Grandfather-father-son: newest version per hour, day and week bucket"""
+
+    name = 'buckets'
+
+    def __init__(self, hourly, daily, weekly):
+        super().__init__()
+        self.tiers = [(HOUR, hourly * HOUR), (DAY, daily * DAY), (WEEK, weekly * WEEK)]
+        self.with_history = set()
+
+    def upload(self, t, index, size, chunks, chunk_bytes):
+        self.store(t, index, size, chunks, chunk_bytes)
+        if len(self.versions[index]) > 1:
+            self.with_history.add(index)
+
+    def keep(self, t, versions):
+        """Indexes of versions the schedule retains; the newest is always kept"""
+        kept = {len(versions) - 1}
+        for width, span in self.tiers:
+            seen = set()
+            for position in range(len(versions) - 1, -1, -1):
+                version_time = versions[position][0]
+                if t - version_time >= span:
+                    break
+                bucket = version_time // width
+                if bucket not in seen:
+                    seen.add(bucket)
+                    kept.add(position)
+        return kept
+
+    def prune(self, t, chunk_bytes):
+        for index in list(self.with_history):
+            versions = self.versions[index]
+            self.list_directory(len(versions))
+            kept = self.keep(t, versions)
+            if len(kept) == len(versions):
+                continue
+            survivors = []
+            for position, version in enumerate(versions):
+                if position in kept:
+                    survivors.append(version)
+                else:
+                    self.drop(version, chunk_bytes)
+            self.versions[index] = survivors
+            if len(survivors) == 1:
+                self.with_history.discard(index)
+
+
+class DedupBuckets(Buckets):
+    """Buckets schedule over a content-addressed chunk store with refcounts"""
+
+    name = 'dedup'
+
+    def __init__(self, hourly, daily, weekly):
+        super().__init__(hourly, daily, weekly)
+        self.refcounts = {}
+
+    def store(self, t, index, size, chunks, chunk_bytes):
+        self.versions.setdefault(index, []).append((t, size, chunks))
+        manifest = len(chunks) * MANIFEST_ENTRY
+        fresh = 0
+        refcounts = self.refcounts
+        for chunk in chunks:
+            count = refcounts.get(chunk, 0)
+            if count == 0:
+                fresh += chunk_bytes[chunk]
+            refcounts[chunk] = count + 1
+        self.stored += fresh + manifest
+        self.written += fresh + manifest
+
+    def drop(self, version, chunk_bytes):
+        self.stored -= len(version[2]) * MANIFEST_ENTRY
+        self.deletes += 1
+        refcounts = self.refcounts
+        for chunk in version[2]:
+            count = refcounts[chunk] - 1
+            if count:
+                refcounts[chunk] = count
+            else:
+                del refcounts[chunk]
+                self.stored -= chunk_bytes[chunk]
+                self.deletes += 1
+
+
+class Zipf:
+    """Sample indexes 0..n-1 with probability proportional to 1 / (rank + 1) ** s"""
+
+    def __init__(self, n, s, rng):
+        self.rng = rng
+        total = 0.0
+        self.cumulative = []
+        for rank in range(n):
+            total += 1 / (rank + 1) ** s
+            self.cumulative.append(total)
+        self.total = total
+
+    def sample(self):
+        target = self.rng.random() * self.total
+        low, high = 0, len(self.cumulative) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.cumulative[middle] < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+def poisson(rng, mean):
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def simulate(args):
+    rng = random.Random(args.seed)
+    corpus = Corpus(args, rng)
+    popularity = Zipf(len(corpus.games), args.zipf, rng)
+    order = list(range(len(corpus.games)))
+    rng.shuffle(order)
+
+    policies = [
+        Overwrite(),
+        KeepLast(args.keep_last),
+        Buckets(args.hourly, args.daily, args.weekly),
+        DedupBuckets(args.hourly, args.daily, args.weekly),
+    ]
+    chunk_bytes = corpus.chunk_bytes
+
+    # Initial full backup
+    for index in range(len(corpus.sizes)):
+        for policy in policies:
+            policy.upload(0, index, corpus.sizes[index], corpus.chunks[index], chunk_bytes)
+    initial = [(p.stored, p.written) for p in policies]
+
+    dirty = 0
+    changes = 0
+    timeline = []
+    step = int(args.sync_hours * HOUR)
+    prune_every = int(args.prune_hours * HOUR)
+    next_prune = prune_every
+    next_sample = WEEK
+    end = args.days * DAY
+    t = step
+    while t <= end:
+        changed = set()
+        for _ in range(poisson(rng, args.games_per_sync)):
+            sram, states = corpus.games[order[popularity.sample()]]
+            dirty += corpus.modify(sram, 1.0)
+            changed.add(sram)
+            for _ in range(poisson(rng, args.state_saves)):
+                slot = rng.choice(states)
+                dirty += corpus.modify(slot, args.state_dirty)
+                changed.add(slot)
+        for index in changed:
+            for policy in policies:
+                policy.upload(t, index, corpus.sizes[index], corpus.chunks[index], chunk_bytes)
+        changes += len(changed)
+
+        if t >= next_prune:
+            for policy in policies:
+                policy.prune(t, chunk_bytes)
+            next_prune += prune_every
+        if t >= next_sample:
+            timeline.append((t, [p.stored for p in policies]))
+            next_sample += WEEK
+        t += step
+
+    for policy in policies:
+        policy.prune(end, chunk_bytes)
+    return policies, initial, dirty, changes, timeline, corpus
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+
+
+def main():
+    args = parse_args()
+    print("🗄️  Simulating NAS retention policies...")
+    start = time.perf_counter()
+    policies, initial, dirty, changes, timeline, corpus = simulate(args)
+    elapsed = time.perf_counter() - start
+
+    months = args.days / 30
+    print(f"   {len(corpus.sizes)} files ({format_bytes(sum(corpus.sizes))}), {args.days} days, "
+          f"snapshot every {args.sync_hours:g}h, simulated in {elapsed:.2f}s")
+    print(f"   {changes} file versions written, {format_bytes(dirty)} of save data actually changed")
+
+    print(f"\n📦 {'policy':<10} {'stored':>10} {'growth/mo':>10} {'versions':>9} {'written':>10} "
+          f"{'write amp':>9}")
+    for policy, (initial_stored, initial_written) in zip(policies, initial):
+        written = policy.written - initial_written
+        print(f"   {policy.name:<10} {format_bytes(policy.stored):>10} "
+              f"{format_bytes((policy.stored - initial_stored) / months):>10} {policy.version_count():>9} "
+              f"{format_bytes(written):>10} {written / max(1, dirty):>8.2f}x")
+
+    print(f"\n🧹 {'policy':<10} {'list calls':>10} {'entries':>10} {'deletes':>9}")
+    for policy in policies:
+        print(f"   {policy.name:<10} {policy.list_requests:>10} {policy.list_entries:>10} {policy.deletes:>9}")
+
+    print("\n📈 Stored bytes by week")
+    print(f"   {'week':>4} " + ' '.join(f'{p.name:>10}' for p in policies))
+    for t, stored in timeline:
+        print(f"   {t // WEEK:>4} " + ' '.join(f'{format_bytes(s):>10}' for s in stored))
+
+    print("\n💡 written excludes the initial full backup; write amp = bytes written on the NAS")
+    print("   per byte of save data that changed (dedup only uploads chunks the NAS lacks)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Discrete-event simulation of SyncWorker scheduling across a device fleet.
+
+Models the WorkManager requests built in app/src/main/java/com/emusaves/sync/SyncWorker.kt:
+
+  * periodic work: 6 h period, 30 min flex, UNMETERED network + charging,
+    exponential backoff starting at 1 h
+  * one-time work ("Sync Now"): CONNECTED network, exponential backoff
+    starting at 30 s
+  * doWork() syncs the folders one after another and returns Result.success()
+    whatever syncFolder() reports; Result.retry() only follows an exception
+    escaping doWork(), which this model has none of
+
+Each device gets a daily charging and Wi-Fi schedule; a sync runs only while
+both hold. EmusavesRepository.syncFolder() opens one FileStation session per
+folder (login, createFolder, serial uploads, logout) on the shared NAS, which
+has a fixed number of concurrent session slots. A folder whose login waits
+longer than the OkHttp timeout for a slot is skipped and the run moves on to
+the next folder. --retry-on-timeout instead fails the whole run into
+WorkManager's backoff, a hypothetical worker that propagates login failures.
+
+The event loop is plain Python and costs roughly 0.1 ms per device-day: the
+default 1000 devices over 14 days take about a second, 5000 devices over 28
+days about 15 s, and a 100k-device month several minutes.
+
+Usage: python3 scripts/simulate_sync_fleet.py --devices 5000 --days 28
+"""
+
+import argparse
+import heapq
+import math
+import random
+import time
+from collections import deque
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+# WorkManager clamps exponential backoff to this (WorkRequest.MAX_BACKOFF_MILLIS)
+MAX_BACKOFF = 5 * HOUR
+# SyncWorker.doWork() returns Result.retry() while runAttemptCount < 3 (only
+# reached with --retry-on-timeout)
+MAX_RETRIES = 3
+
+# Event kinds
+WINDOW, START, FINISH, TIMEOUT = range(4)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Simulate SyncWorker load on a shared NAS')
+    parser.add_argument('--devices', type=int, default=1000, help='Number of devices in the fleet')
+    parser.add_argument('--days', type=int, default=14, help='Simulated days')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+
+    work = parser.add_argument_group('WorkManager parameters')
+    work.add_argument('--period-hours', type=float, default=6, help='Periodic repeat interval')
+    work.add_argument('--flex-minutes', type=float, default=30, help='Periodic flex window')
+    work.add_argument('--backoff-hours', type=float, default=1, help='Periodic backoff delay')
+    work.add_argument('--one-time-backoff-seconds', type=float, default=30, help='One-time backoff delay')
+    work.add_argument('--scheduler-jitter', type=float, default=60,
+                      help='Max seconds JobScheduler takes to start eligible work')
+    work.add_argument('--manual-per-day', type=float, default=0.3,
+                      help='Mean "Sync Now" taps per device per day')
+    work.add_argument('--retry-on-timeout', action='store_true',
+                      help='Hypothetical: fail the run with Result.retry() when a login times out '
+                           '(doWork() currently skips the folder and reports success)')
+
+    device = parser.add_argument_group('Device behaviour')
+    device.add_argument('--plug-in-hour', type=float, default=23, help='Mean nightly plug-in time')
+    device.add_argument('--plug-in-spread', type=float, default=1.5, help='Std. dev. of plug-in time (hours)')
+    device.add_argument('--timezones', type=int, default=1,
+                        help='Spread the fleet over this many consecutive UTC offsets')
+
+    load = parser.add_argument_group('Upload cost')
+    load.add_argument('--folders-per-device', type=float, default=2, help='Mean backup folders per device')
+    load.add_argument('--files-per-sync', type=float, default=4, help='Mean changed files per sync')
+    load.add_argument('--state-share', type=float, default=0.3, help='Share of files that are save states')
+    load.add_argument('--sram-kb', type=float, default=64, help='Median SRAM save size')
+    load.add_argument('--state-mb', type=float, default=4, help='Median save state size')
+    load.add_argument('--request-ms', type=float, default=80, help='Per-request overhead (login, upload, logout)')
+    load.add_argument('--uplink-mbps', type=float, default=20, help='Median device upload bandwidth')
+
+    nas = parser.add_argument_group('NAS')
+    nas.add_argument('--nas-slots', type=int, default=8, help='Concurrent FileStation sessions served')
+    nas.add_argument('--nas-mbps', type=float, default=400, help='Total NAS ingest bandwidth')
+    nas.add_argument('--login-timeout', type=float, default=30, help='Seconds a device waits for a slot')
+
+    report = parser.add_argument_group('Report')
+    report.add_argument('--storm-bucket-minutes', type=float, default=5, help='Bucket size for backoff storms')
+    report.add_argument('--storm-threshold', type=int, default=0,
+                        help='Retries per bucket that count as a storm (default: 1%% of the fleet, min 10)')
+    args = parser.parse_args()
+
+    positive = ['devices', 'days', 'period_hours', 'nas_slots', 'nas_mbps', 'uplink_mbps',
+                'storm_bucket_minutes']
+    non_negative = ['flex_minutes', 'backoff_hours', 'one_time_backoff_seconds', 'scheduler_jitter',
+                    'manual_per_day', 'folders_per_device', 'files_per_sync', 'request_ms', 'login_timeout']
+    for name in positive:
+        if getattr(args, name) <= 0:
+            parser.error(f"--{name.replace('_', '-')} must be positive")
+    for name in non_negative:
+        if getattr(args, name) < 0:
+            parser.error(f"--{name.replace('_', '-')} must not be negative")
+    if args.flex_minutes * 60 > args.period_hours * HOUR:
+        parser.error('--flex-minutes cannot exceed the period')
+    return args
+
+
+def poisson(rng, mean):
+    # Knuth's method is fine for the small means used here
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+class Device:
+    """Daily charging/Wi-Fi schedule of one device, generated lazily per day"""
+
+    def __init__(self, index, args):
+        self.index = index
+        self.args = args
+        self.seed = args.seed * 1000003 + index
+        self.offset = (index % max(1, args.timezones)) * HOUR
+        rng = random.Random(self.seed)
+        self.uplink = rng.lognormvariate(math.log(args.uplink_mbps), 0.5)
+        self.folders = 1 + poisson(rng, max(0.0, args.folders_per_device - 1))
+        self.days = {}
+
+    def eligible_intervals(self, day):
+        """Intervals of that day where the device is charging on unmetered Wi-Fi"""
+        if day not in self.days:
+            self.days[day] = self._generate(day)
+        return self.days[day]
+
+    def _generate(self, day):
+        args = self.args
+        rng = random.Random(self.seed * 7919 + day)
+        base = day * DAY + self.offset
+        weekend = day % 7 in (5, 6)
+
+        charging = []
+        plug_in = rng.gauss(args.plug_in_hour, args.plug_in_spread) * HOUR
+        charging.append((base + plug_in, base + plug_in + rng.uniform(5, 9) * HOUR))
+        if rng.random() < 0.35:
+            top_up = rng.uniform(10, 19) * HOUR
+            charging.append((base + top_up, base + top_up + rng.uniform(0.3, 2) * HOUR))
+
+        if weekend:
+            wifi = [(base, base + DAY + 8 * HOUR)]
+        else:
+            leave = rng.gauss(8, 0.75) * HOUR
+            arrive = rng.gauss(18.5, 1.5) * HOUR
+            wifi = [(base - DAY + arrive, base + leave), (base + arrive, base + DAY + leave)]
+            if rng.random() < 0.4:
+                # Unmetered Wi-Fi at work or school
+                wifi.append((base + leave + HOUR, base + arrive - HOUR))
+
+        eligible = []
+        for c_start, c_end in charging:
+            for w_start, w_end in wifi:
+                start, end = max(c_start, w_start), min(c_end, w_end)
+                if start < end:
+                    eligible.append((start, end))
+        eligible.sort()
+        return eligible
+
+    def next_eligible(self, t):
+        """Return (start, end) of the first eligible interval ending after t"""
+        day = int((t - self.offset) // DAY) - 1
+        while True:
+            for start, end in self.eligible_intervals(day):
+                if end > t:
+                    return max(start, t), end
+            day += 1
+
+
+class Job:
+    """One WorkManager work request (the device's periodic work or one "Sync Now")"""
+
+    def __init__(self, device, periodic):
+        self.device = device
+        self.periodic = periodic
+        self.attempts = 0
+        self.retrying = False
+        self.eligible_end = math.inf
+        self.folders_left = 0
+        self.skipped = 0
+
+
+class Session:
+    """One folder's FileStation session, waiting for or holding a NAS slot"""
+
+    def __init__(self, job, arrival, deadline):
+        self.job = job
+        self.arrival = arrival
+        self.deadline = deadline
+        self.started = False
+        self.cancelled = False
+
+
+class Stats:
+    def __init__(self, args):
+        self.runs = self.successes = self.timeouts = self.stopped = self.retries = self.gave_up = 0
+        self.partial = 0
+        self.manual_runs = 0
+        self.bytes = 0
+        self.queue_delays = []
+        self.peak_active = 0
+        self.peak_queue = 0
+        self.hour_busy = [0.0] * 24
+        self.hour_peak = [0] * 24
+        self.retry_buckets = {}
+        self.bucket = args.storm_bucket_minutes * 60
+        self.last_change = 0.0
+
+    def active_changed(self, t, active_before, active_after):
+        hour = int((t % DAY) // HOUR)
+        self.hour_busy[int((self.last_change % DAY) // HOUR)] += active_before * (t - self.last_change)
+        self.last_change = t
+        self.hour_peak[hour] = max(self.hour_peak[hour], active_after)
+        self.peak_active = max(self.peak_active, active_after)
+
+
+class Simulation:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.devices = [Device(i, args) for i in range(args.devices)]
+        self.events = []
+        self.seq = 0
+        self.active = 0
+        self.queue = deque()
+        self.end = args.days * DAY
+        self.stats = Stats(args)
+        self.period = args.period_hours * HOUR
+        self.flex = args.flex_minutes * 60
+        self.slot_bandwidth = args.nas_mbps / args.nas_slots
+        self.files_per_folder = args.files_per_sync / max(1.0, args.folders_per_device)
+        self.state_mu = math.log(args.state_mb * 1e6)
+        self.sram_mu = math.log(args.sram_kb * 1e3)
+
+    def push(self, t, kind, obj):
+        if t < self.end:
+            self.seq += 1
+            heapq.heappush(self.events, (t, self.seq, kind, obj))
+
+    def seed_jobs(self):
+        """Enqueue each device's periodic work plus its manual syncs"""
+        for device in self.devices:
+            # Periodic work is enqueued when the app is first opened
+            enqueued = self.rng.uniform(0, self.period)
+            self.push(enqueued + self.period - self.flex, WINDOW, Job(device, periodic=True))
+
+            rate = self.args.manual_per_day
+            for day in range(self.args.days):
+                taps = 0
+                # Poisson sample via exponential gaps
+                gap = self.rng.expovariate(rate) if rate > 0 else 2.0
+                while gap < 1.0:
+                    taps += 1
+                    gap += self.rng.expovariate(rate)
+                for _ in range(taps):
+                    t = day * DAY + device.offset + self.rng.uniform(9, 23) * HOUR
+                    self.push(t, START, Job(device, periodic=False))
+
+    def on_window(self, t, job):
+        """The job's period (or backoff) has elapsed; wait for constraints"""
+        start, job.eligible_end = job.device.next_eligible(t)
+        self.push(start + self.rng.uniform(0, self.args.scheduler_jitter), START, job)
+
+    def on_start(self, t, job):
+        stats = self.stats
+        stats.runs += 1
+        if not job.periodic:
+            stats.manual_runs += 1
+        if job.retrying:
+            key = int(t // stats.bucket)
+            stats.retry_buckets[key] = stats.retry_buckets.get(key, 0) + 1
+        job.folders_left = job.device.folders
+        job.skipped = 0
+        self.next_folder(t, job)
+
+    def next_folder(self, t, job):
+        """Log in for the next folder of the run, or finish the run"""
+        if job.folders_left == 0:
+            self.complete(t, job)
+            return
+        job.folders_left -= 1
+        session = Session(job, t, t + self.args.login_timeout)
+        if self.active < self.args.nas_slots:
+            self.begin(t, session)
+        else:
+            self.queue.append(session)
+            self.stats.peak_queue = max(self.stats.peak_queue, len(self.queue))
+            self.push(session.deadline, TIMEOUT, session)
+
+    def begin(self, t, session):
+        args = self.args
+        job = session.job
+        session.started = True
+        self.stats.queue_delays.append(t - session.arrival)
+        self.stats.active_changed(t, self.active, self.active + 1)
+        self.active += 1
+
+        rng = self.rng
+        files = poisson(rng, self.files_per_folder)
+        size = 0
+        for _ in range(files):
+            if rng.random() < args.state_share:
+                size += math.exp(rng.gauss(self.state_mu, 0.8))
+            else:
+                size += math.exp(rng.gauss(self.sram_mu, 1.0))
+        mbps = min(job.device.uplink, self.slot_bandwidth)
+        # login + createFolder + one request per file + logout
+        duration = (files + 3) * args.request_ms / 1000 + size * 8 / (mbps * 1e6)
+        self.stats.bytes += size
+
+        finish = t + duration
+        stopped = False
+        if job.periodic and job.eligible_end < finish:
+            # WorkManager stops the worker as soon as a constraint is lost,
+            # abandoning the folders still to come
+            finish, stopped = max(t, job.eligible_end), True
+        self.push(finish, FINISH, (session, stopped))
+
+    def on_finish(self, t, session, stopped):
+        self.stats.active_changed(t, self.active, self.active - 1)
+        self.active -= 1
+        while self.queue:
+            waiting = self.queue.popleft()
+            if not waiting.cancelled:
+                self.begin(t, waiting)
+                break
+
+        job = session.job
+        if stopped:
+            self.stats.stopped += 1
+            self.push(t, WINDOW, job)
+            return
+        self.next_folder(t, job)
+
+    def complete(self, t, job):
+        """doWork() returns Result.success(), even if folders were skipped"""
+        self.stats.successes += 1
+        if job.skipped:
+            self.stats.partial += 1
+        job.attempts = 0
+        job.retrying = False
+        if job.periodic:
+            self.push(t + self.period - self.flex, WINDOW, job)
+
+    def on_timeout(self, t, session):
+        if session.started:
+            return
+        session.cancelled = True
+        self.stats.timeouts += 1
+        job = session.job
+        if not self.args.retry_on_timeout:
+            # login() fails, syncFolder() returns Result.failure and doWork()
+            # carries on with the next folder
+            job.skipped += 1
+            self.next_folder(t, job)
+        elif job.attempts < MAX_RETRIES:
+            job.attempts += 1
+            job.retrying = True
+            self.stats.retries += 1
+            initial = self.args.backoff_hours * HOUR if job.periodic else self.args.one_time_backoff_seconds
+            delay = min(initial * 2 ** (job.attempts - 1), MAX_BACKOFF)
+            if job.periodic:
+                self.push(t + delay, WINDOW, job)
+            else:
+                self.push(t + delay, START, job)
+        else:
+            self.stats.gave_up += 1
+            job.attempts = 0
+            job.retrying = False
+            if job.periodic:
+                self.push(t + self.period - self.flex, WINDOW, job)
+
+    def run(self):
+        self.seed_jobs()
+        events = self.events
+        while events:
+            t, _, kind, obj = heapq.heappop(events)
+            if kind == WINDOW:
+                self.on_window(t, obj)
+            elif kind == START:
+                self.on_start(t, obj)
+            elif kind == FINISH:
+                self.on_finish(t, *obj)
+            else:
+                self.on_timeout(t, obj)
+        self.stats.active_changed(self.end, self.active, self.active)
+        return self.stats
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def format_time(seconds):
+    day, rest = divmod(int(seconds), int(DAY))
+    return f"day {day + 1} {rest // 3600:02d}:{rest % 3600 // 60:02d}"
+
+
+def print_report(args, stats):
+    delays = sorted(stats.queue_delays)
+    threshold = args.storm_threshold or max(10, args.devices // 100)
+    storms = sorted((count, key) for key, count in stats.retry_buckets.items() if count >= threshold)
+
+    print(f"\n📊 Runs: {stats.runs} ({stats.manual_runs} manual), "
+          f"{stats.runs / (args.devices * args.days):.2f} per device per day")
+    print(f"   Succeeded: {stats.successes}  stopped by constraints: {stats.stopped}")
+    if args.retry_on_timeout:
+        print(f"   Logins timed out waiting for NAS: {stats.timeouts}  retries: {stats.retries}  "
+              f"gave up: {stats.gave_up}  (hypothetical retry-on-timeout worker)")
+    else:
+        print(f"   Folders skipped after a login timeout: {stats.timeouts}  "
+              f"in {stats.partial} runs that still reported success")
+    print(f"   Uploaded: {stats.bytes / 1e9:.1f} GB")
+
+    print(f"\n🖥️  NAS concurrency peak: {stats.peak_active}/{args.nas_slots} sessions, "
+          f"queue peak: {stats.peak_queue}")
+    print(f"   Queueing delay p50 {percentile(delays, 0.5):.1f}s  p95 {percentile(delays, 0.95):.1f}s  "
+          f"p99 {percentile(delays, 0.99):.1f}s  max {delays[-1] if delays else 0:.1f}s")
+
+    print("\n🕐 Hour  avg sessions  peak")
+    total_days = max(1, args.days)
+    for hour in range(24):
+        average = stats.hour_busy[hour] / (total_days * HOUR)
+        bar = '█' * min(40, int(round(average / max(1, args.nas_slots) * 40)))
+        print(f"   {hour:02d}:00  {average:12.2f}  {stats.hour_peak[hour]:4d}  {bar}")
+
+    if not args.retry_on_timeout:
+        return
+    print(f"\n🌪️  Backoff storms (≥{threshold} retries per {args.storm_bucket_minutes:g} min): {len(storms)}")
+    for count, key in storms[::-1][:5]:
+        print(f"   {format_time(key * stats.bucket)}: {count} retries")
+
+
+def main():
+    args = parse_args()
+    print("🎮 Simulating EmuSaves sync scheduling...")
+    print(f"   {args.devices} devices, {args.days} days, period {args.period_hours:g}h, "
+          f"flex {args.flex_minutes:g}min, NAS slots {args.nas_slots}")
+    if args.retry_on_timeout:
+        print("   ⚠️  --retry-on-timeout models a hypothetical worker; SyncWorker skips the folder today")
+    start = time.perf_counter()
+    stats = Simulation(args).run()
+    print(f"   ⏱️  Simulated in {time.perf_counter() - start:.1f}s")
+    print_report(args, stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+End-to-end sync time of one device: per-folder sessions vs pipelined uploads.
+
+SyncWorker.doWork() calls EmusavesRepository.syncFolder() for each folder in
+turn, and every call does its own login(), createFolder("/Drive",
+"EmulatorBackups"), serial uploadFile() calls and logout(). This harness runs
+a local FileStation stand-in that models network round trips, connection
+setup, a shared uplink and server-side work, replays that request sequence
+over real HTTP and compares it with restructured sync loops:
+
+  current          per folder: login, createFolder, serial uploads, logout
+  shared-session   one login/logout around all folders
+  cached-folder    shared session, createFolder once per run
+  concurrent       shared session and cached folder, uploads from all folders
+                   through --workers kept-alive connections
+
+Each row includes the changes of the rows above it, so the step with the
+biggest drop is the restructuring worth doing first. OkHttp already keeps
+connections alive, so the sequential strategies reuse one connection;
+--fresh-connections replays them with a new connection per request, as
+behind a proxy that closes them.
+
+Usage: python3 scripts/sync_pipeline_experiment.py --networks lan wan --workers 4
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from upload_memory_benchmark import BOUNDARY, CHUNK_SIZE, multipart_parts, upload_url
+
+REMOTE_PARENT = '/Drive'
+REMOTE_FOLDER = 'EmulatorBackups'
+
+# rtt in seconds, uplink in bytes/s, round trips to open a connection
+# (TCP; TCP + TLS for the https QuickConnect URL SynologyApiClient builds)
+Network = namedtuple('Network', ['rtt', 'uplink', 'handshake_rtts'])
+NETWORKS = {
+    'lan': Network(0.003, 40e6, 1),            # http://nas.local:5000
+    'wan': Network(0.040, 5e6, 1),             # http://example.synology.me:5000
+    'quickconnect': Network(0.120, 1.5e6, 3),  # https://id.quickconnect.to
+}
+
+# Server-side time per call: DSM auth is slow, uploads include the disk write
+SERVER_TIME = {
+    'login': 0.250,
+    'logout': 0.020,
+    'create': 0.050,
+    'upload': 0.020,
+}
+
+# name, file count, size range in KB
+Folder = namedtuple('Folder', ['name', 'files', 'min_kb', 'max_kb'])
+LAYOUTS = {
+    'retroarch': [
+        Folder('RetroArch Saves', 60, 8, 128),
+        Folder('RetroArch States', 12, 200, 1500),
+    ],
+    'handhelds': [
+        Folder('RetroArch Saves', 30, 8, 64),
+        Folder('PPSSPP Saves', 40, 4, 200),
+        Folder('DraStic Saves', 15, 256, 512),
+        Folder('My Boy! Saves', 10, 32, 128),
+    ],
+    'many-folders': [
+        Folder(name, 6, 16, 64) for name in (
+            'Snes9x EX+ Saves', 'MD.emu Saves', 'Pizza Boy GBA', 'Pizza Boy GBC',
+            'ePSXe Memory Cards', 'AetherSX2 Saves', 'MAME4droid Saves', 'FBNeo Saves',
+        )
+    ],
+}
+
+STRATEGIES = ('current', 'shared-session', 'cached-folder', 'concurrent')
+
+
+class Link:
+    """Shared uplink: body chunks from all connections queue for its bandwidth"""
+
+    def __init__(self, bandwidth):
+        self.bandwidth = bandwidth
+        self.lock = threading.Lock()
+        self.free_at = 0.0
+
+    def transmit(self, size):
+        with self.lock:
+            now = time.monotonic()
+            self.free_at = max(now, self.free_at) + size / self.bandwidth
+            done = self.free_at
+        time.sleep(max(0.0, done - time.monotonic()))
+
+
+class FileStationHandler(BaseHTTPRequestHandler):
+    """SYNO.API.Auth and SYNO.FileStation stand-in with modelled latency"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; with Nagle on, loopback
+    # delayed ACKs would add ~40 ms to every response
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # One handler per connection: the handshake is paid here, once
+        self.server.count('connections')
+        time.sleep(self.server.network.handshake_rtts * self.server.network.rtt)
+
+    def do_GET(self):
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        api, method = query.get('api'), query.get('method')
+        if api == 'SYNO.API.Auth' and method == 'login':
+            sid = self.server.open_session()
+            self.reply('login', {'success': True, 'data': {'sid': sid}})
+        elif api == 'SYNO.API.Auth' and method == 'logout':
+            self.server.close_session(self.sid())
+            self.reply('logout', {'success': True})
+        elif api == 'SYNO.FileStation.CreateFolder' and method == 'create':
+            path = json.loads(query.get('folder_path', '[]'))[0]
+            self.reply('create', {'success': True, 'data': {'folders': [{'path': path}]}})
+        else:
+            self.reply(None, {'success': False, 'error': {'code': 102}})
+
+    def do_POST(self):
+        remaining = int(self.headers.get('Content-Length', 0))
+        while remaining:
+            data = self.rfile.read(min(remaining, CHUNK_SIZE))
+            if not data:
+                break
+            self.server.link.transmit(len(data))
+            remaining -= len(data)
+        query = parse_qs(urlparse(self.path).query)
+        if query.get('api') != ['SYNO.FileStation.Upload']:
+            self.reply(None, {'success': False, 'error': {'code': 102}})
+        elif not self.server.has_session(self.sid()):
+            self.reply('upload', {'success': False, 'error': {'code': 119}})  # SID not found
+        else:
+            self.reply('upload', {'success': True})
+
+    def sid(self):
+        cookie = self.headers.get('Cookie', '')
+        return cookie[3:] if cookie.startswith('id=') else None
+
+    def reply(self, call, payload):
+        network = self.server.network
+        # The request and the response cross the network once each
+        time.sleep(network.rtt + SERVER_TIME.get(call, 0.0))
+        self.server.count(call or 'invalid')
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FileStationServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, network):
+        super().__init__(('127.0.0.1', 0), FileStationHandler)
+        self.network = network
+        self.link = Link(network.uplink)
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.sessions = set()
+        self.next_sid = 0
+
+    def count(self, name):
+        with self.lock:
+            self.counts[name] += 1
+
+    def open_session(self):
+        with self.lock:
+            self.next_sid += 1
+            sid = f'sid{self.next_sid}'
+            self.sessions.add(sid)
+            return sid
+
+    def close_session(self, sid):
+        with self.lock:
+            self.sessions.discard(sid)
+
+    def has_session(self, sid):
+        with self.lock:
+            return sid in self.sessions
+
+    def reset(self):
+        with self.lock:
+            self.counts = Counter()
+            self.sessions = set()
+            self.link.free_at = 0.0
+
+
+class FileStationClient:
+    """The SynologyApiClient calls SyncWorker makes, over http.client"""
+
+    def __init__(self, port, keep_alive=True, sid=None):
+        self.port = port
+        self.keep_alive = keep_alive
+        self.sid = sid
+        self.connection = None
+
+    def request(self, method, url, body=None, headers=None):
+        if self.connection is None:
+            self.connection = http.client.HTTPConnection('127.0.0.1', self.port)
+        headers = dict(headers or {})
+        if not self.keep_alive:
+            headers['Connection'] = 'close'
+        self.connection.request(method, url, body=body, headers=headers)
+        response = self.connection.getresponse()
+        reply = json.loads(response.read())
+        if not self.keep_alive:
+            self.close()
+        if not reply.get('success'):
+            raise RuntimeError(f'{url.split("&method=")[-1]} failed: {reply}')
+        return reply
+
+    def api(self, **params):
+        query = '&'.join(f'{key}={value}' for key, value in params.items())
+        headers = {'Cookie': f'id={self.sid}'} if self.sid else None
+        return self.request('GET', f'/webapi/entry.cgi?{query}', headers=headers)
+
+    def login(self):
+        reply = self.api(api='SYNO.API.Auth', version=7, method='login', account='emusaves',
+                         password='secret', session='EmuSaves', format='cookie')
+        self.sid = reply['data']['sid']
+        return self.sid
+
+    def logout(self):
+        self.api(api='SYNO.API.Auth', version=7, method='logout', session='EmuSaves')
+        self.sid = None
+
+    def create_folder(self, path, name):
+        return self.api(api='SYNO.FileStation.CreateFolder', version=3, method='create',
+                        folder_path=json.dumps([f'{path}/{name}']), force_parent='true')
+
+    def upload(self, payload, filename):
+        preamble, epilogue = multipart_parts(filename)
+        return self.request('POST', upload_url(f'{REMOTE_PARENT}/{REMOTE_FOLDER}'),
+                            body=preamble + payload + epilogue,
+                            headers={'Content-Type': f'multipart/form-data; boundary={BOUNDARY}',
+                                     'Cookie': f'id={self.sid}'})
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def build_layout(folders, seed):
+    """[(folder name, [(relative path, size), ...]), ...] with reproducible sizes"""
+    rng = random.Random(seed)
+    layout = []
+    for folder in folders:
+        files = [(f'{folder.name}/save_{i:03d}.sav', rng.randint(folder.min_kb, folder.max_kb) * 1024)
+                 for i in range(folder.files)]
+        layout.append((folder.name, files))
+    return layout
+
+
+def sync_current(port, layout, payload, keep_alive, workers):
+    """SyncWorker.doWork() + EmusavesRepository.syncFolder() as they are"""
+    client = FileStationClient(port, keep_alive)
+    for _, files in layout:
+        client.login()
+        try:
+            client.create_folder(REMOTE_PARENT, REMOTE_FOLDER)
+            for path, size in files:
+                client.upload(payload[:size], path)
+        finally:
+            client.logout()
+    client.close()
+
+
+def sync_shared_session(port, layout, payload, keep_alive, workers):
+    client = FileStationClient(port, keep_alive)
+    client.login()
+    try:
+        for _, files in layout:
+            client.create_folder(REMOTE_PARENT, REMOTE_FOLDER)
+            for path, size in files:
+                client.upload(payload[:size], path)
+    finally:
+        client.logout()
+    client.close()
+
+
+def sync_cached_folder(port, layout, payload, keep_alive, workers):
+    client = FileStationClient(port, keep_alive)
+    client.login()
+    try:
+        client.create_folder(REMOTE_PARENT, REMOTE_FOLDER)
+        for _, files in layout:
+            for path, size in files:
+                client.upload(payload[:size], path)
+    finally:
+        client.logout()
+    client.close()
+
+
+def sync_concurrent(port, layout, payload, keep_alive, workers):
+    client = FileStationClient(port, keep_alive)
+    client.login()
+    local = threading.local()
+    clients = []
+
+    def upload(job):
+        # One kept-alive connection per worker, all on the same session
+        if not hasattr(local, 'client'):
+            local.client = FileStationClient(port, True, client.sid)
+            clients.append(local.client)
+        path, size = job
+        local.client.upload(payload[:size], path)
+
+    try:
+        client.create_folder(REMOTE_PARENT, REMOTE_FOLDER)
+        jobs = [job for _, files in layout for job in files]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(upload, jobs))
+    finally:
+        for worker_client in clients:
+            worker_client.close()
+        client.logout()
+    client.close()
+
+
+SYNCS = {
+    'current': sync_current,
+    'shared-session': sync_shared_session,
+    'cached-folder': sync_cached_folder,
+    'concurrent': sync_concurrent,
+}
+
+
+def run(server, strategy, layout, payload, keep_alive, workers):
+    server.reset()
+    start = time.monotonic()
+    SYNCS[strategy](server.server_address[1], layout, payload, keep_alive, workers)
+    elapsed = time.monotonic() - start
+    return elapsed, Counter(server.counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare sync loop structures against a FileStation stand-in')
+    parser.add_argument('--networks', nargs='+', choices=sorted(NETWORKS), default=['lan', 'wan'])
+    parser.add_argument('--layouts', nargs='+', choices=sorted(LAYOUTS), default=list(LAYOUTS))
+    parser.add_argument('--strategies', nargs='+', choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument('--workers', type=int, default=4, help='Uploads in flight for "concurrent"')
+    parser.add_argument('--fresh-connections', action='store_true',
+                        help='New connection per request in the sequential strategies')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print("🔁 EmuSaves sync pipeline experiment")
+    layouts = {name: build_layout(LAYOUTS[name], args.seed) for name in args.layouts}
+    largest = max(size for layout in layouts.values() for _, files in layout for _, size in files)
+    payload = random.Random(args.seed).randbytes(largest)
+
+    for network_name in args.networks:
+        network = NETWORKS[network_name]
+        server = FileStationServer(network)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"\n🌐 {network_name}: RTT {network.rtt * 1000:.0f} ms, uplink {network.uplink / 1e6:.1f} MB/s, "
+              f"{network.handshake_rtts} RTT connection setup")
+
+        for layout_name, layout in layouts.items():
+            files = sum(len(f) for _, f in layout)
+            total = sum(size for _, f in layout for _, size in f)
+            print(f"\n   📂 {layout_name}: {len(layout)} folders, {files} files, {total / 1e6:.1f} MB")
+            print(f"   {'strategy':<15} {'time':>8} {'speedup':>8} {'login':>6} {'create':>7} "
+                  f"{'upload':>7} {'logout':>7} {'conns':>6} {'MB/s':>6}")
+            baseline = None
+            previous = None
+            steps = []
+            for strategy in args.strategies:
+                keep_alive = strategy == 'concurrent' or not args.fresh_connections
+                elapsed, counts = run(server, strategy, layout, payload, keep_alive, args.workers)
+                baseline = baseline or elapsed
+                if previous is not None:
+                    steps.append((previous[1] - elapsed, previous[0], strategy))
+                previous = (strategy, elapsed)
+                print(f"   {strategy:<15} {elapsed:>7.2f}s {baseline / elapsed:>7.1f}x {counts['login']:>6} "
+                      f"{counts['create']:>7} {counts['upload']:>7} {counts['logout']:>7} "
+                      f"{counts['connections']:>6} {total / elapsed / 1e6:>6.2f}")
+            if steps:
+                saved, before, after = max(steps)
+                print(f"   💡 largest win: {before} → {after} saves {saved:.2f}s")
+
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,8 @@
 set -e
 
 SCREENSHOTS_DIR="docs/screenshots"
+# Raw captures are kept apart from the mockups so only they get framed
+CAPTURES_DIR="$SCREENSHOTS_DIR/captures"
 DEVICE_SCREENSHOT_PATH="/sdcard/emusaves-screenshot.png"
 
 # Colors for output
@@ -27,13 +29,13 @@ if ! adb devices | grep -q "device$"; then
 fi
 
 # Create screenshots directory if it doesn't exist
-mkdir -p "$SCREENSHOTS_DIR"
+mkdir -p "$CAPTURES_DIR"
 
 # Function to take and save screenshot
 take_screenshot() {
     local name="$1"
     local description="$2"
-    local output_file="$SCREENSHOTS_DIR/screenshot-$name.png"
+    local output_file="$CAPTURES_DIR/screenshot-$name.png"
     
     echo -e "${BLUE}📸 Taking screenshot: $description${NC}"
     echo -e "${YELLOW}   👆 Please navigate to the correct screen on your device, then press Enter...${NC}"
@@ -84,12 +86,13 @@ take_screenshot "sync-complete" "Sync Complete (success confirmation)"
 echo -e "${GREEN}🎉 Screenshot capture complete!${NC}"
 echo
 echo -e "${BLUE}Next steps:${NC}"
-echo "1. Review screenshots in $SCREENSHOTS_DIR/"
+echo "1. Review screenshots in $CAPTURES_DIR/"
 echo "2. Edit screenshots to remove personal information"
-echo "3. Update README.md to use real screenshots instead of placeholders"
-echo "4. Commit and push changes"
+echo "3. Clean up status bars and add device frames: python3 process_device_captures.py $CAPTURES_DIR -o $SCREENSHOTS_DIR"
+echo "4. Update README.md to use real screenshots instead of placeholders"
+echo "5. Commit and push changes"
 echo
 echo -e "${YELLOW}To replace placeholders in README.md:${NC}"
-echo "   Replace placeholder.com URLs with: docs/screenshots/screenshot-[name].png"
+echo "   Replace placeholder.com URLs with: docs/screenshots/screenshot-[name]-framed.png"
 echo
 echo -e "${GREEN}Thanks for contributing! 📸${NC}"
\ No newline at end of file
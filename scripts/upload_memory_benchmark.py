@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Peak memory of buffered vs streaming save uploads.
+
+EmusavesRepository.uploadFile() copies each save into a ByteArrayOutputStream
+and calls toByteArray(), then SynologyApiClient.uploadFile() wraps that array
+in a multipart body, so a large PSP or Dreamcast state is held in memory more
+than once. This harness runs a local stand-in for
+`entry.cgi?api=SYNO.FileStation.Upload` and uploads test files with three
+strategies, each in a fresh process so its peak memory can be measured:
+
+  buffered   read the file into a buffer, copy it out, build the whole
+             multipart body in memory and POST it (what the app does today)
+  chunked    stream the multipart body with Transfer-Encoding: chunked,
+             64 KiB at a time
+  mmap       map the file and send the multipart parts from the mapping
+             with a known Content-Length; the payload is never copied into a
+             Python buffer, but send() still copies each 1 MiB slice from the
+             mapped pages into the kernel's socket buffer, so this is not
+             zero-copy (socket.sendfile() would be)
+
+Reported per file size: peak RSS (VmHWM), peak anonymous memory (heap and
+buffers, sampled from /proc; mapped file pages are excluded), throughput and
+time to first byte as seen by the server. Sizes, memory and throughput are
+all in MiB (1024 * 1024 bytes).
+
+Usage: python3 scripts/upload_memory_benchmark.py --sizes 16 64 256
+"""
+
+import argparse
+import http.client
+import io
+import json
+import mmap
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BOUNDARY = 'emusaves-benchmark-boundary'
+CHUNK_SIZE = 64 * 1024
+MIB = 1024 * 1024
+STRATEGIES = ('buffered', 'chunked', 'mmap')
+
+
+class UploadHandler(BaseHTTPRequestHandler):
+    """FileStation upload stand-in: drains the body and reports when it started"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path != '/webapi/entry.cgi' or query.get('api') != ['SYNO.FileStation.Upload']:
+            self.reply(404, {'success': False, 'error': {'code': 102}})
+            return
+
+        first_byte = None
+        received = 0
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                remaining = size
+                while remaining:
+                    data = self.rfile.read(min(remaining, CHUNK_SIZE))
+                    if first_byte is None:
+                        first_byte = time.time()
+                    remaining -= len(data)
+                    received += len(data)
+                self.rfile.readline()
+        else:
+            remaining = int(self.headers.get('Content-Length', 0))
+            while remaining:
+                data = self.rfile.read(min(remaining, CHUNK_SIZE))
+                if not data:
+                    break
+                if first_byte is None:
+                    first_byte = time.time()
+                remaining -= len(data)
+                received += len(data)
+
+        self.reply(200, {'success': True, 'received': received, 'first_byte': first_byte})
+
+    def reply(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def multipart_parts(filename, overwrite=False):
+    """Preamble and epilogue around the file bytes, as in SynologyApiClient.uploadFile()"""
+    preamble = (
+        f'--{BOUNDARY}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode('utf-8')
+    epilogue = (
+        f'\r\n--{BOUNDARY}\r\n'
+        'Content-Disposition: form-data; name="overwrite"\r\n\r\n'
+        f'{str(overwrite).lower()}\r\n'
+        f'--{BOUNDARY}--\r\n'
+    ).encode('utf-8')
+    return preamble, epilogue
+
+
+def upload_url(remote_path='/Drive/EmulatorBackups'):
+    return f'/webapi/entry.cgi?api=SYNO.FileStation.Upload&version=2&method=upload&path={remote_path}'
+
+
+def open_request(port, headers):
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    connection.putrequest('POST', upload_url())
+    connection.putheader('Content-Type', f'multipart/form-data; boundary={BOUNDARY}')
+    connection.putheader('Cookie', 'id=benchmark')
+    for name, value in headers.items():
+        connection.putheader(name, value)
+    connection.endheaders()
+    return connection
+
+
+def upload_buffered(port, path):
+    preamble, epilogue = multipart_parts(os.path.basename(path))
+    # input.copyTo(ByteArrayOutputStream) + toByteArray()
+    output = io.BytesIO()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(8192)
+            if not chunk:
+                break
+            output.write(chunk)
+    content = output.getvalue()
+    # MultipartBody around the array, written out as one request body
+    body = preamble + content + epilogue
+    connection = open_request(port, {'Content-Length': str(len(body))})
+    connection.send(body)
+    return connection
+
+
+def upload_chunked(port, path):
+    preamble, epilogue = multipart_parts(os.path.basename(path))
+    connection = open_request(port, {'Transfer-Encoding': 'chunked'})
+
+    def send_chunk(data):
+        connection.send(b'%x\r\n' % len(data))
+        connection.send(data)
+        connection.send(b'\r\n')
+
+    send_chunk(preamble)
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            send_chunk(chunk)
+    send_chunk(epilogue)
+    connection.send(b'0\r\n\r\n')
+    return connection
+
+
+def upload_mmap(port, path):
+    preamble, epilogue = multipart_parts(os.path.basename(path))
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        connection = open_request(port, {'Content-Length': str(len(preamble) + size + len(epilogue))})
+        connection.send(preamble)
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                for offset in range(0, size, MIB):
+                    connection.sock.sendall(view[offset:offset + MIB])
+                view.release()
+        connection.send(epilogue)
+    return connection
+
+
+UPLOADERS = {'buffered': upload_buffered, 'chunked': upload_chunked, 'mmap': upload_mmap}
+
+
+class AnonSampler(threading.Thread):
+    """Track peak RssAnon from /proc/self/status (Linux only)"""
+
+    def __init__(self, interval=0.002):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self.running = True
+
+    @staticmethod
+    def read():
+        try:
+            with open('/proc/self/status') as status:
+                for line in status:
+                    if line.startswith('RssAnon:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return 0
+
+    def run(self):
+        while self.running:
+            self.peak = max(self.peak, self.read())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self.running = False
+        self.join()
+        self.peak = max(self.peak, self.read())
+
+
+def run_client(strategy, port, path):
+    """Child process entry point: one upload, result printed as JSON"""
+    baseline_anon = AnonSampler.read()
+    sampler = AnonSampler()
+    sampler.start()
+
+    start = time.time()
+    connection = UPLOADERS[strategy](port, path)
+    response = connection.getresponse()
+    reply = json.loads(response.read())
+    finished = time.time()
+    sampler.stop()
+    connection.close()
+
+    if not reply.get('success'):
+        raise SystemExit(f'upload failed: {reply}')
+    size = os.path.getsize(path)
+    print(json.dumps({
+        'strategy': strategy,
+        'size': size,
+        'received': reply['received'],
+        'seconds': finished - start,
+        'ttfb': reply['first_byte'] - start if reply['first_byte'] else None,
+        'peak_rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        'peak_anon': sampler.peak - baseline_anon,
+    }))
+
+
+def make_test_file(directory, megabytes):
+    """Save-state-like file: incompressible blocks mixed with zero runs"""
+    path = os.path.join(directory, f'state_{megabytes}mb.state')
+    block = os.urandom(MIB)
+    with open(path, 'wb') as f:
+        for i in range(megabytes):
+            f.write(block if i % 4 else bytes(MIB))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare upload strategies by peak memory and speed')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[16, 64, 256], help='File sizes in MiB')
+    parser.add_argument('--strategies', nargs='+', choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument('--client', choices=STRATEGIES, help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client:
+        run_client(args.client, args.port, args.file)
+        return
+
+    print("📤 EmuSaves upload memory benchmark")
+    server = ThreadingHTTPServer(('127.0.0.1', 0), UploadHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    # A bare interpreter's footprint, to read the numbers against
+    idle = subprocess.run(
+        [sys.executable, '-c', 'import resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)'],
+        capture_output=True, text=True, check=True,
+    )
+    # ru_maxrss is in KiB on Linux
+    print(f"   Python baseline RSS: {int(idle.stdout) * 1024 / MIB:.1f} MiB")
+
+    print(f"\n   {'size':>7} {'strategy':<9} {'peak RSS':>10} {'peak anon':>10} {'MiB/s':>8} {'TTFB':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for megabytes in args.sizes:
+            path = make_test_file(directory, megabytes)
+            for strategy in args.strategies:
+                result = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), '--client', strategy,
+                     '--port', str(port), '--file', path],
+                    capture_output=True, text=True,
+                )
+                if result.returncode != 0:
+                    print(f"   {megabytes:>4}MiB {strategy:<9} ❌ {result.stderr.strip().splitlines()[-1]}")
+                    continue
+                r = json.loads(result.stdout)
+                ttfb = f"{r['ttfb'] * 1000:.1f}ms" if r['ttfb'] is not None else '-'
+                print(f"   {megabytes:>4}MiB {strategy:<9} {r['peak_rss'] / MIB:>7.1f}MiB "
+                      f"{r['peak_anon'] / MIB:>7.1f}MiB {r['size'] / r['seconds'] / MIB:>8.1f} {ttfb:>9}")
+            os.unlink(path)
+
+    server.shutdown()
+    print("\n💡 peak anon excludes clean file pages the kernel can drop (mmap, page cache)")
+
+
+if __name__ == '__main__':
+    main()
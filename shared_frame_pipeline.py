@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Multi-process screenshot pipeline that hands frames over in shared memory.
+
+Stages (render, frame, encode, ...) run in a process pool. Instead of pickling
+whole PIL images between workers, a stage that returns an image writes its
+pixels once into a shared-memory segment and returns a small FrameHandle. The
+next stage maps the segment directly (Image.frombuffer, no copy). The parent
+process keeps a reference count per segment and unlinks it as soon as the
+last stage that needs it has finished, or when the pipeline is closed.
+
+Running this file benchmarks the shared-memory handoff against plain pickling.
+"""
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+import argparse
+import io
+import multiprocessing
+import os
+import queue
+import time
+from collections import namedtuple
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from generate_realistic_screenshots import (
+    build_android_phone_frame,
+    create_home_screen,
+    create_quick_add_dialog,
+    create_sync_progress,
+)
+
+# Shared frames are always stored as RGBA: four bytes per pixel is what
+# Image.frombuffer can map without copying.
+FRAME_MODE = 'RGBA'
+
+FrameHandle = namedtuple('FrameHandle', ['name', 'size'])
+
+
+def export_frame(image):
+    """Copy an image into a new shared-memory segment and return its handle"""
+    if image.mode != FRAME_MODE:
+        image = image.convert(FRAME_MODE)
+    data = image.tobytes()
+    shm = SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[:len(data)] = data
+        return FrameHandle(shm.name, image.size)
+    finally:
+        shm.close()
+
+
+def _run_stage(stage, handle, value, shared):
+    """Worker entry point: resolve the input, run the stage, publish the output"""
+    if handle is None:
+        result = stage(value)
+    else:
+        shm = SharedMemory(handle.name)
+        try:
+            image = Image.frombuffer(FRAME_MODE, handle.size, shm.buf, 'raw', FRAME_MODE, 0, 1)
+            result = stage(image)
+            if result is image:
+                result = image.copy()
+            # The mapped image must be gone before the segment can be closed
+            del image
+        finally:
+            shm.close()
+
+    if shared and isinstance(result, Image.Image):
+        return export_frame(result)
+    return result
+
+
+class FramePipeline:
+    """Run items through a list of stages on a process pool
+
+    Every stage is a picklable top-level function taking one value (the item
+    for the first stage, an image afterwards) and returning an image or any
+    other picklable result. With shared=True images travel as FrameHandles;
+    with shared=False they are pickled, which is what the benchmark compares.
+    """
+
+    def __init__(self, stages, workers=None, shared=True):
+        self.stages = list(stages)
+        self.workers = workers or os.cpu_count()
+        self.shared = shared
+        self.segments = {}
+        self.pool = None
+
+    def __enter__(self):
+        # Start the resource tracker before forking so workers register the
+        # segments they create with the same tracker that sees them unlinked
+        resource_tracker.ensure_running()
+        self.pool = multiprocessing.Pool(self.workers)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.pool.terminate()
+        self.pool.join()
+        for name in list(self.segments):
+            self._unlink(name)
+
+    def retain(self, handle):
+        """Take a reference to a frame produced by a worker"""
+        if handle.name not in self.segments:
+            self.segments[handle.name] = [SharedMemory(handle.name), 0]
+        self.segments[handle.name][1] += 1
+
+    def release(self, handle):
+        """Drop a reference; the segment is unlinked when none are left"""
+        entry = self.segments.get(handle.name)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            self._unlink(handle.name)
+
+    def _unlink(self, name):
+        shm, _ = self.segments.pop(name)
+        shm.close()
+        shm.unlink()
+
+    def materialize(self, handle):
+        """Copy a shared frame into a regular image owned by this process"""
+        shm = self.segments[handle.name][0]
+        return Image.frombytes(FRAME_MODE, handle.size, bytes(shm.buf[:handle.size[0] * handle.size[1] * 4]))
+
+    def run(self, items):
+        """Push every item through all stages and return the final results in order"""
+        done = queue.Queue()
+        results = [None] * len(items)
+        pending = 0
+
+        def submit(index, stage_index, handle, value):
+            nonlocal pending
+            pending += 1
+            self.pool.apply_async(
+                _run_stage,
+                (self.stages[stage_index], handle, value, self.shared),
+                callback=lambda result: done.put((index, stage_index, handle, result, None)),
+                error_callback=lambda error: done.put((index, stage_index, handle, None, error)),
+            )
+
+        for index, item in enumerate(items):
+            submit(index, 0, None, item)
+
+        while pending:
+            index, stage_index, handle, result, error = done.get()
+            pending -= 1
+            if handle is not None:
+                self.release(handle)
+            if error is not None:
+                raise error
+
+            if isinstance(result, FrameHandle):
+                self.retain(result)
+                if stage_index + 1 == len(self.stages):
+                    results[index] = self.materialize(result)
+                    self.release(result)
+                    continue
+                submit(index, stage_index + 1, result, None)
+            elif stage_index + 1 == len(self.stages):
+                results[index] = result
+            else:
+                submit(index, stage_index + 1, None, result)
+
+        return results
+
+
+SCREENS = {
+    'home': create_home_screen,
+    'quick-add': create_quick_add_dialog,
+    'sync-progress': create_sync_progress,
+}
+
+
+def render_stage(job):
+    """Render a named screen at the given scale (job is (screen, scale))"""
+    screen, scale = job
+    image = SCREENS[screen]()
+    if scale != 1:
+        image = image.resize((image.width * scale, image.height * scale), Image.Resampling.LANCZOS)
+    return image
+
+
+def frame_stage(image):
+    return build_android_phone_frame(image)
+
+
+def encode_stage(image):
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', compress_level=1)
+    return buffer.getvalue()
+
+
+def benchmark(items, workers, shared):
+    stages = [render_stage, frame_stage, encode_stage]
+    start = time.perf_counter()
+    with FramePipeline(stages, workers, shared=shared) as pipeline:
+        outputs = pipeline.run(items)
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark shared-memory frame handoff against pickling')
+    parser.add_argument('--items', type=int, default=48, help='Screens pushed through the pipeline')
+    parser.add_argument('--scale', type=int, default=4, help='Render scale (bigger frames, more copying)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Process pool size')
+    args = parser.parse_args()
+
+    print("🧪 Shared-memory vs pickled frame handoff")
+
+    if not PIL_AVAILABLE:
+        print("❌ PIL not available. Install with: pip install pillow")
+        return
+
+    names = list(SCREENS)
+    items = [(names[i % len(names)], args.scale) for i in range(args.items)]
+    print(f"📱 {args.items} screens at {300 * args.scale}x{600 * args.scale}, {args.workers} workers")
+
+    timings = {}
+    for label, shared in (('pickle', False), ('shared memory', True)):
+        seconds, outputs = benchmark(items, args.workers, shared)
+        timings[label] = seconds
+        print(f"   {label:<14} {seconds:6.2f}s  {args.items / seconds:6.1f} screens/s  "
+              f"{sum(len(o) for o in outputs) / 1e6:.1f} MB encoded")
+
+    print(f"\n🎉 Shared memory is {timings['pickle'] / timings['shared memory']:.2f}x the pickled throughput")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Check the theme variants: every theme defines the mockup color roles, and
+color emoji keep their own colors whatever the theme.
+
+Run from the repository root:
+  python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+if PIL_AVAILABLE:
+    import emoji_atlas
+    from generate_realistic_screenshots import (
+        MATERIAL_COLORS,
+        create_home_screen,
+        create_quick_add_dialog,
+        create_sync_progress,
+    )
+    from generate_theme_variants import THEMES
+
+# A color no theme uses, so every pixel of it comes from a pasted emoji
+EMOJI_COLOR = (240, 20, 200)
+
+
+@unittest.skipUnless(PIL_AVAILABLE, 'PIL not available')
+class ThemeVariantsTest(unittest.TestCase):
+
+    def setUp(self):
+        # A small emoji folder in the Twemoji layout: one opaque square per
+        # emoji the mockups use
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        source = os.path.join(folder.name, 'emoji')
+        os.makedirs(source)
+        for emoji in emoji_atlas.app_emoji():
+            name = '-'.join(emoji_atlas._codepoints(emoji))
+            Image.new('RGBA', (72, 72), EMOJI_COLOR + (255,)).save(os.path.join(source, f'{name}.png'))
+
+        for patcher in (mock.patch.dict(os.environ, {'EMUSAVES_EMOJI': source}),
+                        mock.patch.object(emoji_atlas, 'CACHE_DIR', os.path.join(folder.name, 'cache'))):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        emoji_atlas.default_atlas.cache_clear()
+        self.addCleanup(emoji_atlas.default_atlas.cache_clear)
+
+    def test_themes_define_every_role(self):
+        for theme, colors in THEMES.items():
+            with self.subTest(theme=theme):
+                self.assertEqual(set(colors), set(MATERIAL_COLORS))
+
+    def test_emoji_keep_their_colors(self):
+        self.assertTrue(emoji_atlas.default_atlas().available)
+        for creator in (create_home_screen, create_quick_add_dialog, create_sync_progress):
+            counts = {}
+            for theme, colors in THEMES.items():
+                image = creator(colors=colors).convert('RGB')
+                colors_used = image.getcolors(image.width * image.height)
+                counts[theme] = sum(count for count, rgb in colors_used if rgb == EMOJI_COLOR)
+            with self.subTest(screen=creator.__name__):
+                self.assertEqual(len(set(counts.values())), 1, counts)
+                if creator is not create_sync_progress:
+                    self.assertGreater(counts['light'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()